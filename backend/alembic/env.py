@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 # Import Base and models
 from app.core.database import Base
-from app.models import Property
+import app.models  # noqa: F401  (register models on Base.metadata)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
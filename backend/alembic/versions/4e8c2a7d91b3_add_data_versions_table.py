@@ -0,0 +1,44 @@
+"""add data_versions table
+
+Revision ID: 4e8c2a7d91b3
+Revises: dd25715451fb
+Create Date: 2026-10-18 15:20:11.406231
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8c2a7d91b3"
+down_revision: Union[str, None] = "dd25715451fb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["property_transactions", "property_presales", "property_rentals"]
+
+
+def upgrade() -> None:
+    data_versions = op.create_table(
+        "data_versions",
+        sa.Column("table_name", sa.String(length=64), nullable=False, comment="資料表名稱"),
+        sa.Column("version", sa.Integer(), nullable=False, comment="資料版本"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+            comment="最後更新時間",
+        ),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.bulk_insert(
+        data_versions, [{"table_name": table, "version": 0} for table in TABLES]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("data_versions")
@@ -0,0 +1,82 @@
+"""partition property tables by quarter
+
+Revision ID: 5533a1d79403
+Revises: 6a1638b1dc8b
+Create Date: 2026-10-18 20:14:36.502918
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5533a1d79403"
+down_revision: Union[str, None] = "6a1638b1dc8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, constraint prefix, date column, period comment)
+TABLES = [
+    ("property_transactions", "trans", "transaction_date_ad", "交易季度(西元年*10+季)"),
+    ("property_presales", "presale", "transaction_date_ad", "交易季度(西元年*10+季)"),
+    ("property_rentals", "rental", "rental_date_ad", "租賃季度(西元年*10+季)"),
+]
+
+# Quarters created up front; scripts/manage_partitions.py adds later ones
+FIRST_YEAR = 2012
+LAST_YEAR = 2027
+
+
+def partitions() -> str:
+    """p_before, one partition per quarter, then the p_future catch-all."""
+    clauses = [f"PARTITION p_before VALUES LESS THAN ({FIRST_YEAR}1)"]
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        for quarter in range(1, 5):
+            upper = (year + 1) * 10 + 1 if quarter == 4 else year * 10 + quarter + 1
+            clauses.append(f"PARTITION p{year}q{quarter} VALUES LESS THAN ({upper})")
+    clauses.append("PARTITION p_future VALUES LESS THAN MAXVALUE")
+    return ",\n".join(clauses)
+
+
+def upgrade() -> None:
+    for table, prefix, date_column, comment in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "period",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+                comment=comment,
+            ),
+        )
+        op.execute(
+            f"UPDATE {table} "
+            f"SET period = YEAR({date_column}) * 10 + QUARTER({date_column}) "
+            f"WHERE {date_column} IS NOT NULL"
+        )
+
+        # Every unique key of a partitioned table must contain the
+        # partitioning column; done in one ALTER so the table is rebuilt once
+        op.execute(
+            f"ALTER TABLE {table} "
+            "DROP PRIMARY KEY, ADD PRIMARY KEY (id, period), "
+            f"DROP INDEX uq_{prefix}_serial_number, "
+            f"ADD UNIQUE KEY uq_{prefix}_serial_number (serial_number, period) "
+            f"PARTITION BY RANGE (period) ({partitions()})"
+        )
+
+
+def downgrade() -> None:
+    for table, prefix, _, _ in reversed(TABLES):
+        op.execute(f"ALTER TABLE {table} REMOVE PARTITIONING")
+        op.execute(
+            f"ALTER TABLE {table} "
+            "DROP PRIMARY KEY, ADD PRIMARY KEY (id), "
+            f"DROP INDEX uq_{prefix}_serial_number, "
+            f"ADD UNIQUE KEY uq_{prefix}_serial_number (serial_number)"
+        )
+        op.drop_column(table, "period")
@@ -0,0 +1,101 @@
+"""add parsed construction year and AD date columns
+
+Revision ID: 68908ee382ad
+Revises: 9a5dea43f51d
+Create Date: 2026-10-18 09:12:40.318562
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.roc_calendar import parse_roc_year, roc_to_date
+
+
+# revision identifiers, used by Alembic.
+revision: str = "68908ee382ad"
+down_revision: Union[str, None] = "9a5dea43f51d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, index prefix, ROC date column)
+TABLES = [
+    ("property_transactions", "trans", "transaction_date"),
+    ("property_presales", "presale", "transaction_date"),
+    ("property_rentals", "rental", "rental_date"),
+]
+
+BACKFILL_BATCH_SIZE = 10000
+
+
+def backfill(table: str, date_column: str) -> None:
+    """Populate parsed columns from the existing ROC strings in id batches."""
+    conn = op.get_bind()
+    select_batch = sa.text(
+        f"SELECT id, construction_complete_date, {date_column} FROM {table} "
+        "WHERE id > :last_id ORDER BY id LIMIT :batch_size"
+    )
+    update_row = sa.text(
+        f"UPDATE {table} SET construction_year_roc = :year, "
+        f"{date_column}_ad = :ad_date WHERE id = :id"
+    )
+
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select_batch, {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+
+        conn.execute(
+            update_row,
+            [
+                {
+                    "id": row[0],
+                    "year": parse_roc_year(row[1]),
+                    "ad_date": roc_to_date(row[2]),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    for table, prefix, date_column in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "construction_year_roc",
+                sa.Integer(),
+                nullable=True,
+                comment="建築完成年(民國)",
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                f"{date_column}_ad",
+                sa.Date(),
+                nullable=True,
+                comment="交易年月日(西元)" if prefix != "rental" else "租賃年月日(西元)",
+            ),
+        )
+
+        backfill(table, date_column)
+
+        op.create_index(
+            f"idx_{prefix}_construction_year", table, ["construction_year_roc"]
+        )
+        op.create_index(f"idx_{prefix}_date_ad", table, [f"{date_column}_ad"])
+
+
+def downgrade() -> None:
+    for table, prefix, date_column in reversed(TABLES):
+        op.drop_index(f"idx_{prefix}_date_ad", table_name=table)
+        op.drop_index(f"idx_{prefix}_construction_year", table_name=table)
+        op.drop_column(table, f"{date_column}_ad")
+        op.drop_column(table, "construction_year_roc")
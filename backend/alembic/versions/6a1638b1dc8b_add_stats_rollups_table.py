@@ -0,0 +1,64 @@
+"""add stats_rollups table
+
+Revision ID: 6a1638b1dc8b
+Revises: 4e8c2a7d91b3
+Create Date: 2026-10-18 19:02:45.118274
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6a1638b1dc8b"
+down_revision: Union[str, None] = "4e8c2a7d91b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stats_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False, comment="來源資料表"),
+        sa.Column("value_column", sa.String(length=64), nullable=False, comment="統計欄位"),
+        sa.Column("city", sa.String(length=50), nullable=True, comment="縣市"),
+        sa.Column("district", sa.String(length=50), nullable=True, comment="鄉鎮市區"),
+        sa.Column(
+            "building_type", sa.String(length=100), nullable=True, comment="建物型態"
+        ),
+        sa.Column(
+            "year_month", sa.Integer(), nullable=True, comment="年月(西元, 例 202303)"
+        ),
+        sa.Column("bucket", sa.Integer(), nullable=True, comment="價格區間(NULL 為無值)"),
+        sa.Column("row_count", sa.Integer(), nullable=False, comment="筆數"),
+        sa.Column(
+            "value_sum", sa.Numeric(precision=24, scale=2), nullable=True, comment="合計"
+        ),
+        sa.Column(
+            "value_min", sa.Numeric(precision=20, scale=2), nullable=True, comment="最小值"
+        ),
+        sa.Column(
+            "value_max", sa.Numeric(precision=20, scale=2), nullable=True, comment="最大值"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_rollup_table_value_month",
+        "stats_rollups",
+        ["table_name", "value_column", "year_month"],
+    )
+    # Rollups are not current until the first refresh (scripts/etl.py rollups)
+    op.add_column(
+        "data_versions",
+        sa.Column("rollup_version", sa.Integer(), nullable=True, comment="統計彙總版本"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("data_versions", "rollup_version")
+    op.drop_index("idx_rollup_table_value_month", table_name="stats_rollups")
+    op.drop_table("stats_rollups")
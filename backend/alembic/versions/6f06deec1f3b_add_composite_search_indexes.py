@@ -0,0 +1,55 @@
+"""add composite search indexes
+
+Revision ID: 6f06deec1f3b
+Revises: 68908ee382ad
+Create Date: 2026-10-18 10:41:07.552810
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6f06deec1f3b"
+down_revision: Union[str, None] = "68908ee382ad"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, index prefix, date column, price column)
+TABLES = [
+    ("property_transactions", "trans", "transaction_date_ad", "total_price_ntd"),
+    ("property_presales", "presale", "transaction_date_ad", "total_price_ntd"),
+    ("property_rentals", "rental", "rental_date_ad", "monthly_rent_ntd"),
+]
+
+
+def upgrade() -> None:
+    for table, prefix, date_column, price_column in TABLES:
+        # city + district + date range ORDER BY date DESC, id DESC
+        op.create_index(
+            f"idx_{prefix}_city_district_date",
+            table,
+            ["city", "district", date_column, "id"],
+        )
+        # city + date range ORDER BY date DESC, id DESC
+        op.create_index(f"idx_{prefix}_city_date", table, ["city", date_column, "id"])
+        # city + building types + price range
+        op.create_index(
+            f"idx_{prefix}_city_type_price",
+            table,
+            ["city", "building_type", price_column],
+        )
+
+        # (city, district) is a prefix of the new city/district/date index
+        op.drop_index(f"idx_{prefix}_city_district", table_name=table)
+
+
+def downgrade() -> None:
+    for table, prefix, date_column, price_column in reversed(TABLES):
+        op.create_index(f"idx_{prefix}_city_district", table, ["city", "district"])
+        op.drop_index(f"idx_{prefix}_city_type_price", table_name=table)
+        op.drop_index(f"idx_{prefix}_city_date", table_name=table)
+        op.drop_index(f"idx_{prefix}_city_district_date", table_name=table)
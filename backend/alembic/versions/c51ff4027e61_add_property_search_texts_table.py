@@ -0,0 +1,90 @@
+"""add property_search_texts table with ngram fulltext indexes
+
+Revision ID: c51ff4027e61
+Revises: 5533a1d79403
+Create Date: 2026-10-18 21:14:32.506118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c51ff4027e61"
+down_revision: Union[str, None] = "5533a1d79403"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrored table -> its project name column (only presales have one)
+SOURCES = {
+    "property_transactions": "NULL",
+    "property_presales": "project_name",
+    "property_rentals": "NULL",
+}
+
+FULLTEXT_INDEXES = {
+    "ft_search_project": ["project_name"],
+    "ft_search_address": ["land_section"],
+    "ft_search_project_address": ["project_name", "land_section"],
+}
+
+
+def upgrade() -> None:
+    # Partitioned tables cannot hold FULLTEXT indexes, so the searchable
+    # text lives in this unpartitioned mirror
+    op.create_table(
+        "property_search_texts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False, comment="來源資料表"),
+        sa.Column("record_id", sa.Integer(), nullable=False, comment="來源資料編號"),
+        sa.Column("serial_number", sa.String(length=100), nullable=True, comment="編號"),
+        sa.Column(
+            "period",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="季度(西元年*10+季)",
+        ),
+        sa.Column("project_name", sa.String(length=200), nullable=True, comment="建案名稱"),
+        sa.Column("land_section", sa.Text(), nullable=True, comment="土地位置建物門牌"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_search_table_serial",
+        "property_search_texts",
+        ["table_name", "serial_number"],
+    )
+    op.create_index(
+        "idx_search_table_period", "property_search_texts", ["table_name", "period"]
+    )
+
+    for table_name, project_name in SOURCES.items():
+        op.execute(
+            f"""
+            INSERT INTO property_search_texts
+                (table_name, record_id, serial_number, period, project_name, land_section)
+            SELECT '{table_name}', id, serial_number, period, {project_name}, land_section
+            FROM {table_name}
+            """
+        )
+
+    # Built after the backfill: one sort instead of per-row index updates
+    for name, columns in FULLTEXT_INDEXES.items():
+        op.create_index(
+            name,
+            "property_search_texts",
+            columns,
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        )
+
+
+def downgrade() -> None:
+    for name in FULLTEXT_INDEXES:
+        op.drop_index(name, table_name="property_search_texts")
+    op.drop_index("idx_search_table_period", table_name="property_search_texts")
+    op.drop_index("idx_search_table_serial", table_name="property_search_texts")
+    op.drop_table("property_search_texts")
@@ -0,0 +1,52 @@
+"""add serial_number unique constraint and row_hash
+
+Revision ID: dd25715451fb
+Revises: 6f06deec1f3b
+Create Date: 2026-10-18 13:05:52.804417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "dd25715451fb"
+down_revision: Union[str, None] = "6f06deec1f3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, constraint prefix)
+TABLES = [
+    ("property_transactions", "trans"),
+    ("property_presales", "presale"),
+    ("property_rentals", "rental"),
+]
+
+
+def upgrade() -> None:
+    for table, prefix in TABLES:
+        op.add_column(
+            table,
+            sa.Column("row_hash", sa.BigInteger(), nullable=True, comment="匯入內容雜湊"),
+        )
+
+        # Earlier full reloads may have inserted the same record more than
+        # once; keep the first copy so the unique constraint can be created
+        op.execute(
+            f"DELETE newer FROM {table} newer "
+            f"JOIN {table} older "
+            "ON newer.serial_number = older.serial_number AND newer.id > older.id"
+        )
+
+        op.create_unique_constraint(
+            f"uq_{prefix}_serial_number", table, ["serial_number"]
+        )
+
+
+def downgrade() -> None:
+    for table, prefix in reversed(TABLES):
+        op.drop_constraint(f"uq_{prefix}_serial_number", table, type_="unique")
+        op.drop_column(table, "row_hash")
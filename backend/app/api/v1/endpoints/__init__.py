@@ -1,3 +1,3 @@
 """API v1 endpoints."""
 
-__all__ = ["property_transactions", "property_presales", "property_rentals"]
+__all__ = ["property_transactions", "property_presales", "property_rentals", "metrics"]
@@ -0,0 +1,35 @@
+"""Operational metrics endpoints (mounted only with METRICS_ENABLED)"""
+
+from typing import Any, Dict, List
+from fastapi import APIRouter
+
+from app.core.database import replica_router
+from app.core.pool_metrics import pool_report
+from app.core.search_cache import search_cache
+from app.core.suggest import suggestions
+
+router = APIRouter()
+
+
+@router.get("/search-cache")
+async def get_search_cache_stats() -> Dict[str, Any]:
+    """Search response cache hit/miss counters."""
+    return search_cache.stats()
+
+
+@router.get("/suggest")
+async def get_suggest_stats() -> Dict[str, Any]:
+    """Values held by each built typeahead index."""
+    return suggestions.stats()
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats() -> Dict[str, Any]:
+    """Connection pool usage of this worker process, per engine."""
+    return pool_report()
+
+
+@router.get("/db-replicas")
+async def get_replica_status() -> List[Dict[str, Any]]:
+    """Read replicas and whether each is in the rotation."""
+    return replica_router.status()
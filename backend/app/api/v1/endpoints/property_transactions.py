@@ -1,38 +1,33 @@
 """Property transaction API endpoints"""
 
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Literal, Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.export import ExportFormat, export_response
+from app.core.fieldsets import parse_fields
+from app.core.http_cache import conditional_get
+from app.core.pagination import CountStrategy
+from app.core.responses import model_response
+from app.core.stats import DEFAULT_METRICS, StatsGroupBy, StatsMetric
 from app.services.property_transaction_service import PropertyTransactionService
 from app.schemas.property_transaction import (
     PropertyTransactionResponse,
     PropertyTransactionSearchResponse,
 )
+from app.schemas.stats import StatsResponse
 
 router = APIRouter()
 
+# ETag/Cache-Control derived from the table's data version
+not_modified = conditional_get("property_transactions")
 
-@router.get("/{property_id}", response_model=PropertyTransactionResponse)
-def get_transaction(property_id: int, db: Session = Depends(get_db)):
-    """Get single transaction by ID."""
-    service = PropertyTransactionService(db)
-    result = service.get_by_id(property_id)
-
-    if result is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Transaction with ID {property_id} not found",
-        )
 
-    return result
-
-
-@router.get("/", response_model=PropertyTransactionSearchResponse)
-def search_transactions(
+def search_filters(
     city: Optional[str] = Query(None, description="City name"),
     district: Optional[str] = Query(None, description="District name"),
+    address: Optional[str] = Query(None, description="Address (full-text search)"),
     date_from: Optional[str] = Query(None, description="Start date (ROC format)"),
     date_to: Optional[str] = Query(None, description="End date (ROC format)"),
     price_min: Optional[int] = Query(None, description="Minimum total price (NTD)"),
@@ -45,16 +40,12 @@ def search_transactions(
     age_max: Optional[int] = Query(
         None, ge=0, description="Maximum building age (years)"
     ),
-    skip: int = Query(0, ge=0, description="Records to skip"),
-    limit: int = Query(20, ge=1, le=100, description="Max records to return"),
-    db: Session = Depends(get_db),
-):
-    """Search transactions with filters."""
-    service = PropertyTransactionService(db)
-
+) -> Dict[str, Any]:
+    """Filters shared by search and export (unset ones are dropped)."""
     filters = {
         "city": city,
         "district": district,
+        "address": address,
         "date_from": date_from,
         "date_to": date_to,
         "price_min": price_min,
@@ -65,6 +56,132 @@ def search_transactions(
         "age_max": age_max,
     }
 
-    filters = {k: v for k, v in filters.items() if v is not None}
+    return {k: v for k, v in filters.items() if v is not None}
+
+
+# Registered before /{property_id} so "export"/"stats" are not taken for an id
+@router.get("/export", dependencies=[Depends(not_modified)])
+async def export_transactions(
+    response: Response,
+    filters: Dict[str, Any] = Depends(search_filters),
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias="format", description="csv, ndjson or parquet"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated columns to export (id is always included)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Stream every transaction matching the filters, without a page size limit."""
+    service = PropertyTransactionService(db)
+
+    try:
+        columns, batches = service.export(filters, parse_fields(fields))
+    except ValueError as e:
+        # Unparseable date filter or unknown field name
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return export_response(
+        batches,
+        columns,
+        service.repository.model,
+        export_format,
+        "transactions",
+        response,
+    )
+
+
+@router.get(
+    "/stats",
+    response_model=StatsResponse,
+    dependencies=[Depends(not_modified)],
+)
+async def transactions_stats(
+    response: Response,
+    filters: Dict[str, Any] = Depends(search_filters),
+    group_by: List[StatsGroupBy] = Query(
+        [], description="Dimensions to group by: city, district, building_type, month"
+    ),
+    value: Literal["unit_price_ntd", "total_price_ntd"] = Query(
+        "unit_price_ntd", description="Column the value metrics are computed over"
+    ),
+    metrics: List[StatsMetric] = Query(
+        DEFAULT_METRICS,
+        description="count, sum, avg, min, max, p25, p50, p75 or p90",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Aggregate transactions matching the filters, computed in the database."""
+    service = PropertyTransactionService(db)
+
+    try:
+        result = await service.stats(filters, group_by, value, metrics)
+    except ValueError as e:
+        # Unparseable date filter or no metrics
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return model_response(result, response)
+
+
+@router.get(
+    "/{property_id}",
+    response_model=PropertyTransactionResponse,
+    dependencies=[Depends(not_modified)],
+)
+async def get_transaction(
+    property_id: int, response: Response, db: AsyncSession = Depends(get_async_db)
+):
+    """Get single transaction by ID."""
+    service = PropertyTransactionService(db)
+    result = await service.get_by_id(property_id)
+
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transaction with ID {property_id} not found",
+        )
+
+    return model_response(result, response)
+
+
+@router.get(
+    "/",
+    response_model=PropertyTransactionSearchResponse,
+    dependencies=[Depends(not_modified)],
+)
+async def search_transactions(
+    response: Response,
+    filters: Dict[str, Any] = Depends(search_filters),
+    skip: int = Query(0, ge=0, description="Records to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Max records to return"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (replaces skip)"
+    ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT, description="Total count: exact, estimated or none"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated item fields to return (id is always included)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Search transactions with filters."""
+    service = PropertyTransactionService(db)
+
+    try:
+        result = await service.search(
+            filters=filters,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=parse_fields(fields),
+        )
+    except ValueError as e:
+        # Malformed cursor (InvalidCursorError), unparseable date filter
+        # or unknown field name
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    return service.search(filters=filters, skip=skip, limit=limit)
+    return model_response(result, response)
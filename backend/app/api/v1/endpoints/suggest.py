@@ -0,0 +1,24 @@
+"""Typeahead suggestion endpoint"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.core.suggest import SuggestKind, suggestions
+from app.schemas.suggest import SuggestResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=SuggestResponse)
+async def suggest(
+    kind: SuggestKind = Query(..., description="project, district or road"),
+    prefix: str = Query(
+        ..., min_length=1, max_length=50, description="Text typed so far"
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Maximum suggestions"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Project, district or road names starting with a prefix."""
+    items = await suggestions.lookup(db, kind, prefix, limit)
+    return SuggestResponse(kind=kind, prefix=prefix, items=items)
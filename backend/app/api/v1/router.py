@@ -1,10 +1,13 @@
 """API v1 router configuration."""
 
 from fastapi import APIRouter
+from app.core.config import settings
 from app.api.v1.endpoints import (
+    metrics,
     property_transactions,
     property_presales,
     property_rentals,
+    suggest,
 )
 
 api_router = APIRouter()
@@ -17,3 +20,8 @@ api_router.include_router(
     property_presales.router, prefix="/presales", tags=["presales"]
 )
 api_router.include_router(property_rentals.router, prefix="/rentals", tags=["rentals"])
+api_router.include_router(suggest.router, prefix="/suggest", tags=["suggest"])
+
+# Register operational endpoints (off unless METRICS_ENABLED)
+if settings.METRICS_ENABLED:
+    api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
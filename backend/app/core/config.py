@@ -1,6 +1,6 @@
 """Application configuration management."""
 
-from typing import List
+from typing import List, Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -43,6 +43,48 @@ class Settings(BaseSettings):
             "?charset=utf8mb4"
         )
 
+    @property
+    def SQLALCHEMY_ASYNC_DATABASE_URI(self) -> str:
+        """Construct async (aiomysql) database URI."""
+        return (
+            f"mysql+aiomysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}"
+            f"@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+            "?charset=utf8mb4"
+        )
+
+    # Connection pools, per engine and per process (each uvicorn worker has
+    # its own): see /metrics/db-pool for how they are used
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # Replace connections older than this (below MySQL's wait_timeout)
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    # Seconds a checkout waits for a free connection before failing
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    # Ping before use: "always", "idle" (connections unused for longer than
+    # DB_POOL_PRE_PING_IDLE_SECONDS) or "never"
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "idle"
+    DB_POOL_PRE_PING_IDLE_SECONDS: int = 30
+
+    # Read replicas serving GET requests, as "host" or "host:port" (same
+    # credentials and database as the primary); empty = primary only
+    MYSQL_REPLICA_HOSTS: List[str] = []
+    # A replica that fails to connect is skipped for this many seconds
+    REPLICA_RETRY_SECONDS: int = 30
+    REPLICA_CONNECT_TIMEOUT_SECONDS: int = 2
+
+    @property
+    def SQLALCHEMY_ASYNC_REPLICA_URIS(self) -> List[str]:
+        """Construct async (aiomysql) URIs of the read replicas."""
+        uris = []
+        for replica in self.MYSQL_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            uris.append(
+                f"mysql+aiomysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}"
+                f"@{host}:{port or self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+                "?charset=utf8mb4"
+            )
+        return uris
+
     # JWT Security (for future authentication)
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
@@ -52,5 +94,40 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
 
+    # Rows fetched per server-side cursor batch by the /export endpoints
+    EXPORT_BATCH_SIZE: int = 5000
+
+    # Estimated search totals (count_strategy=estimated)
+    COUNT_CACHE_TTL_SECONDS: int = 300
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+
+    # Search response cache, invalidated by per-table data versions
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_BACKEND: str = "memory"  # "memory" or "redis"
+    SEARCH_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    SEARCH_CACHE_TTL_SECONDS: int = 300
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024
+
+    # Address / project name search through the ngram FULLTEXT indexes of
+    # property_search_texts (MySQL only); off = LIKE '%...%' on the tables
+    FULLTEXT_SEARCH_ENABLED: bool = True
+
+    # /api/v1/metrics/* (pool usage, replica hosts, cache and typeahead
+    # stats): operational details, so only served when enabled; expose them
+    # to internal networks only
+    METRICS_ENABLED: bool = False
+
+    # Typeahead (/suggest) indexes: seconds an index is served before the
+    # data versions are checked and a rebuild started (imports bump them
+    # every batch)
+    SUGGEST_REBUILD_INTERVAL_SECONDS: int = 60
+
+    # Browser caching of read endpoints (0 = always revalidate via ETag)
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 60
+
+    # JSON encoding of Decimal values (prices, areas): "string" keeps them
+    # exact, "float" emits plain JSON numbers
+    JSON_DECIMAL_MODE: Literal["string", "float"] = "string"
+
 
 settings = Settings()
@@ -0,0 +1,103 @@
+"""Per-table data versions used to invalidate cached search responses."""
+
+from typing import Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.data_version import DataVersion
+
+
+def bump_data_version(db: Session, table_name: str) -> None:
+    """
+    Increment a table's data version inside the caller's transaction
+
+    Call before committing rows written to the table, so the new version
+    becomes visible together with the data.
+    """
+    table = DataVersion.__table__
+    result = db.execute(
+        update(table)
+        .where(table.c.table_name == table_name)
+        .values(version=table.c.version + 1, updated_at=func.now())
+    )
+    if result.rowcount == 0:
+        db.execute(insert(table).values(table_name=table_name, version=1))
+
+
+async def get_data_version(db: AsyncSession, table_name: str) -> int:
+    """
+    Current data version of a table (0 if it was never bumped)
+
+    The value is remembered on the session, so the ETag check and the
+    response cache of one request share a single lookup.
+    """
+    versions = db.info.setdefault("data_versions", {})
+    if table_name not in versions:
+        version = await db.scalar(
+            select(DataVersion.version).where(DataVersion.table_name == table_name)
+        )
+        versions[table_name] = version or 0
+    return versions[table_name]
+
+
+def _rollup_state(table_name: str):
+    """Data version and rollup version of a table."""
+    return select(DataVersion.version, DataVersion.rollup_version).where(
+        DataVersion.table_name == table_name
+    )
+
+
+def rollups_current(db: Session, table_name: str) -> bool:
+    """Whether a table's stats rollups reflect its current data."""
+    state = db.execute(_rollup_state(table_name)).first()
+    return state is not None and state.version == state.rollup_version
+
+
+def data_version(db: Session, table_name: str) -> Optional[int]:
+    """Current data version of a table (None if it was never bumped)."""
+    return db.scalar(
+        select(DataVersion.version).where(DataVersion.table_name == table_name)
+    )
+
+
+def mark_rollups_stale(db: Session, table_name: str) -> None:
+    """Record that a table's stats rollups do not match its data."""
+    table = DataVersion.__table__
+    db.execute(
+        update(table)
+        .where(table.c.table_name == table_name)
+        .values(rollup_version=None)
+    )
+
+
+def mark_rollups_current(db: Session, table_name: str, version: int) -> bool:
+    """
+    Record that the stats rollups were built from a given data version
+
+    The marker is only set while that is still the table's data version.
+    An import batch committed during the refresh bumps the version, and
+    rollups that may have missed the batch then stay stale.
+
+    Args:
+        db: Database session
+        table_name: Source table of the rollups
+        version: data_version() read when the refresh started
+
+    Returns:
+        Whether the rollups were marked current
+    """
+    table = DataVersion.__table__
+    result = db.execute(
+        update(table)
+        .where(table.c.table_name == table_name, table.c.version == version)
+        .values(rollup_version=version)
+    )
+    return result.rowcount > 0
+
+
+async def async_rollups_current(db: AsyncSession, table_name: str) -> bool:
+    """Async variant of rollups_current, used when serving statistics."""
+    state = (await db.execute(_rollup_state(table_name))).first()
+    return state is not None and state.version == state.rollup_version
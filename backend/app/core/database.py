@@ -1,27 +1,193 @@
 """Database connection and session management."""
 
-from typing import Generator
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Generator, List, Optional
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
+from app.core.pool_metrics import instrument, pool_options
 
-# Create SQLAlchemy engine
+# Create SQLAlchemy engine (pool sizing and pre-ping from settings)
 engine = create_engine(
     settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,  # Enable connection health checks
-    pool_size=10,  # Connection pool size
-    max_overflow=20,  # Maximum overflow connections
+    **pool_options(),
     echo=False,  # Set to True for SQL query logging in development
 )
+instrument(engine, "primary")
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine used by the API; scripts and migrations keep the sync engine
+async_engine = create_async_engine(
+    settings.SQLALCHEMY_ASYNC_DATABASE_URI,
+    **pool_options(is_async=True),
+    echo=False,
+)
+instrument(async_engine.sync_engine, "primary (async)")
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 # Create Base class for models
 Base = declarative_base()
 
+# Requests that only read, and so may be served by a replica
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Applies to the next transaction only, so pooled connections are unaffected
+READ_ONLY_TRANSACTION = "SET TRANSACTION ISOLATION LEVEL READ COMMITTED, READ ONLY"
+
+
+def create_replica_engines() -> List[AsyncEngine]:
+    """Async engines of the read replicas in settings.MYSQL_REPLICA_HOSTS."""
+    engines = []
+    for uri in settings.SQLALCHEMY_ASYNC_REPLICA_URIS:
+        replica = create_async_engine(
+            uri,
+            **pool_options(is_async=True),
+            # Fail over quickly instead of holding the request on a dead host
+            connect_args={"connect_timeout": settings.REPLICA_CONNECT_TIMEOUT_SECONDS},
+            echo=False,
+        )
+        instrument(
+            replica.sync_engine, f"replica {replica.url.host}:{replica.url.port}"
+        )
+        engines.append(replica)
+    return engines
+
+
+class ReplicaRouter:
+    """
+    Hand out read connections round-robin across replicas
+
+    Connecting is the health check: a new connection must be opened, or a
+    pooled one pass the pre-ping (DB_POOL_PRE_PING), and a replica that
+    cannot be reached is skipped for retry_seconds. A pooled connection
+    that was not pinged can still turn out dead once used; read_only_session
+    reports it with mark_down so the replica is skipped the same way. When
+    every replica is down (or none is configured) the primary serves reads.
+
+    Example:
+        router = ReplicaRouter(async_engine, create_replica_engines())
+        connection = await router.connect()
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: List[AsyncEngine],
+        retry_seconds: float = 30,
+    ):
+        """
+        Initialize router
+
+        Args:
+            primary: Engine used when no replica is available
+            replicas: Read replica engines, tried in turn
+            retry_seconds: Seconds a failed replica is left out of the rotation
+        """
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_seconds = retry_seconds
+        self._turns = itertools.cycle(range(len(replicas)))
+        # replica index -> monotonic time it may be tried again
+        self._down_until: Dict[int, float] = {}
+        self._failures: Dict[int, int] = {}
+
+    def _healthy(self, index: int) -> bool:
+        return self._down_until.get(index, 0) <= time.monotonic()
+
+    async def connect(self) -> AsyncConnection:
+        """Connection to the next healthy replica, or to the primary."""
+        for _ in range(len(self.replicas)):
+            index = next(self._turns)
+            if not self._healthy(index):
+                continue
+            try:
+                connection = await self.replicas[index].connect()
+            except (DBAPIError, OSError):
+                self._skip(index)
+                continue
+            self._down_until.pop(index, None)
+            return connection
+        return await self.primary.connect()
+
+    def _skip(self, index: int) -> None:
+        self._down_until[index] = time.monotonic() + self.retry_seconds
+        self._failures[index] = self._failures.get(index, 0) + 1
+
+    def mark_down(self, connection: AsyncConnection) -> None:
+        """Take the replica a connection came from out of the rotation."""
+        for index, replica in enumerate(self.replicas):
+            if replica.sync_engine is connection.sync_engine:
+                self._skip(index)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Health of each replica (host, whether in rotation, failed connects)."""
+        return [
+            {
+                "host": replica.url.host,
+                "port": replica.url.port,
+                "healthy": self._healthy(index),
+                "failures": self._failures.get(index, 0),
+            }
+            for index, replica in enumerate(self.replicas)
+        ]
+
+
+replica_router = ReplicaRouter(
+    async_engine, create_replica_engines(), settings.REPLICA_RETRY_SECONDS
+)
+
+
+@asynccontextmanager
+async def read_only_session(
+    router: Optional[ReplicaRouter] = None,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Session on a replica (or the primary) inside a read-only transaction
+
+    On MySQL the transaction is READ COMMITTED and READ ONLY: no snapshot
+    is held open for the length of a long export, and InnoDB skips
+    transaction id assignment. Any write attempt fails.
+
+    If the connection turns out to be dead (e.g. a pooled one handed out
+    without a pre-ping), its replica is marked down before the error
+    propagates, so the next request goes elsewhere.
+    """
+    router = router or replica_router
+    connection = await router.connect()
+    try:
+        if connection.dialect.name == "mysql":
+            await connection.exec_driver_sql(READ_ONLY_TRANSACTION)
+        async with AsyncSession(
+            bind=connection, autoflush=False, expire_on_commit=False
+        ) as db:
+            yield db
+    except DBAPIError as e:
+        # Disconnects only (OperationalError "server has gone away" and
+        # the like); a failing query says nothing about the replica
+        if e.connection_invalidated:
+            router.mark_down(connection)
+        raise
+    finally:
+        await connection.close()
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -37,3 +203,23 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting an async database session.
+
+    GET requests get a read-only session on a read replica (see
+    read_only_session); other methods a read-write one on the primary.
+
+    Usage in FastAPI endpoints:
+        @app.get("/items/")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    if request.method in READ_METHODS:
+        async with read_only_session() as db:
+            yield db
+    else:
+        async with AsyncSessionLocal() as db:
+            yield db
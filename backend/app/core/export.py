@@ -0,0 +1,169 @@
+"""Streaming bulk exports: encode row batches as CSV, NDJSON or Parquet."""
+
+import csv
+import io
+from enum import Enum
+from typing import Any, AsyncIterator, List, Sequence
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Boolean, Date, Integer, Numeric
+
+from app.core.responses import orjson_default
+
+
+class ExportFormat(str, Enum):
+    """File format of a bulk export."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"  # One JSON object per line
+    PARQUET = "parquet"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+async def encode_csv(
+    batches: AsyncIterator[List[Any]], columns: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """Header line, then one CSV chunk per row batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(columns)
+    yield drain()
+    async for rows in batches:
+        writer.writerows([row._mapping[name] for name in columns] for row in rows)
+        yield drain()
+
+
+async def encode_ndjson(
+    batches: AsyncIterator[List[Any]], columns: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """One chunk of newline-terminated JSON objects per row batch."""
+    async for rows in batches:
+        yield b"".join(
+            orjson.dumps(
+                {name: row._mapping[name] for name in columns}, default=orjson_default
+            )
+            + b"\n"
+            for row in rows
+        )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back whatever was written since the last drain."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(model, columns: Sequence[str]):
+    """Arrow schema for exported columns, typed from the model's columns."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquet exports require pyarrow (pip install pyarrow)"
+        ) from e
+
+    def arrow_type(column_type):
+        if isinstance(column_type, Boolean):
+            return pa.bool_()
+        if isinstance(column_type, Date):
+            return pa.date32()
+        if isinstance(column_type, Numeric):
+            return pa.decimal128(column_type.precision, column_type.scale)
+        if isinstance(column_type, Integer):
+            return pa.int64()
+        return pa.string()
+
+    # getattr covers hybrid properties (e.g. building_age) as well as columns
+    return pa.schema(
+        [(name, arrow_type(getattr(model, name).type)) for name in columns]
+    )
+
+
+async def encode_parquet(
+    batches: AsyncIterator[List[Any]], columns: Sequence[str], model
+) -> AsyncIterator[bytes]:
+    """One Parquet row group per row batch, then the file footer."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(model, columns)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for rows in batches:
+            table = pa.Table.from_pylist([row._asdict() for row in rows], schema=schema)
+            writer.write_table(table)
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def export_response(
+    batches: AsyncIterator[List[Any]],
+    columns: Sequence[str],
+    model,
+    export_format: ExportFormat,
+    filename: str,
+    response: Response,
+) -> StreamingResponse:
+    """
+    Stream row batches to the client in the requested format
+
+    Args:
+        batches: Row batches from a repository's export()
+        columns: Columns to write, in order
+        model: ORM model the rows come from (types the Parquet schema)
+        export_format: CSV, NDJSON or Parquet
+        filename: Download name without extension
+        response: Injected response whose headers (ETag, ...) are kept
+
+    Raises:
+        RuntimeError: If Parquet is requested and pyarrow is not installed
+    """
+    if export_format == ExportFormat.PARQUET:
+        _arrow_schema(model, columns)  # Fail before streaming starts
+        body = encode_parquet(batches, columns, model)
+    elif export_format == ExportFormat.NDJSON:
+        body = encode_ndjson(batches, columns)
+    else:
+        body = encode_csv(batches, columns)
+
+    disposition = f'attachment; filename="{filename}.{export_format.value}"'
+    headers = {**response.headers, "Content-Disposition": disposition}
+    return StreamingResponse(
+        body, media_type=MEDIA_TYPES[export_format], headers=headers
+    )
@@ -0,0 +1,104 @@
+"""Sparse fieldsets: return only the response fields a client asks for."""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, computed_field, create_model
+
+# Always returned so items stay addressable and cursors can be built
+ALWAYS_INCLUDED = ("id",)
+
+
+def parse_fields(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated ?fields= value; None/empty means all fields."""
+    if not value:
+        return None
+    fields = [name.strip() for name in value.split(",") if name.strip()]
+    return fields or None
+
+
+def resolve_fields(schema: Type[BaseModel], requested: List[str]) -> Tuple[str, ...]:
+    """
+    Validate requested field names against a response schema
+
+    Args:
+        schema: Item response schema, e.g. PropertyTransactionResponse
+        requested: Field names from the request
+
+    Returns:
+        Selected field names in schema declaration order
+
+    Raises:
+        ValueError: If a name is not a field of the schema
+    """
+    available = list(schema.model_fields) + list(schema.model_computed_fields)
+    unknown = sorted(set(requested) - set(available))
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. "
+            f"Available: {', '.join(available)}"
+        )
+
+    selected = set(ALWAYS_INCLUDED) | set(requested)
+    return tuple(name for name in available if name in selected)
+
+
+@lru_cache(maxsize=256)
+def narrow_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Build (and memoize) a copy of a response schema with only some fields
+
+    Field types, defaults and computed fields are carried over from the
+    original schema, so values validate and serialize the same way.
+    """
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields
+    }
+    computed = {
+        name: computed_field(info.wrapped_property, return_type=info.return_type)
+        for name, info in schema.model_computed_fields.items()
+        if name in fields
+    }
+    base = type(
+        f"{schema.__name__}Base",
+        (BaseModel,),
+        {**computed, "model_config": ConfigDict(from_attributes=True)},
+    )
+    return create_model(f"Partial{schema.__name__}", __base__=base, **definitions)
+
+
+@lru_cache(maxsize=256)
+def narrow_search_schema(
+    search_schema: Type[BaseModel],
+    item_schema: Type[BaseModel],
+    fields: Tuple[str, ...],
+) -> Type[BaseModel]:
+    """Copy of a *SearchResponse schema whose items use narrow_schema()."""
+    item = narrow_schema(item_schema, fields)
+    return create_model(
+        f"Partial{search_schema.__name__}",
+        __base__=search_schema,
+        items=(List[item], ...),
+    )
+
+
+def select_schemas(
+    item_schema: Type[BaseModel],
+    search_schema: Type[BaseModel],
+    fields: Optional[Tuple[str, ...]],
+) -> Tuple[Type[BaseModel], Type[BaseModel]]:
+    """Item and search response schemas, narrowed when fields are given."""
+    if not fields:
+        return item_schema, search_schema
+    return (
+        narrow_schema(item_schema, fields),
+        narrow_search_schema(search_schema, item_schema, fields),
+    )
+
+
+@lru_cache(maxsize=256)
+def items_adapter(item_schema: Type[BaseModel]) -> TypeAdapter:
+    """Pre-built List[item_schema] validator for turning result rows into items."""
+    return TypeAdapter(List[item_schema])
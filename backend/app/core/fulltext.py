@@ -0,0 +1,102 @@
+"""ngram FULLTEXT search of project names and addresses, with a LIKE fallback.
+
+MySQL cannot build FULLTEXT indexes on partitioned tables, so the
+searchable text of every property row is mirrored into the unpartitioned
+property_search_texts table (kept in sync by the loaders) and matched
+there with MATCH ... AGAINST. Backends without the ngram parser (SQLite,
+MariaDB, or MySQL with FULLTEXT_SEARCH_ENABLED off) filter the property
+table itself with LIKE '%...%'.
+"""
+
+from typing import Any, List, Optional
+
+from sqlalchemy import ColumnElement, literal, null, or_, select
+from sqlalchemy.dialects.mysql import match
+
+from app.core.config import settings
+from app.models.property_search_text import PropertySearchText
+
+# MySQL's default ngram_token_size: shorter values cannot match any token
+NGRAM_TOKEN_SIZE = 2
+
+# Mirrored text columns; every combination searched has a FULLTEXT index
+SEARCH_TEXT_COLUMNS = ("project_name", "land_section")
+
+
+def fulltext_supported(dialect: Any) -> bool:
+    """True if the database can serve MATCH ... AGAINST with the ngram parser."""
+    return (
+        settings.FULLTEXT_SEARCH_ENABLED
+        and dialect.name == "mysql"
+        and not getattr(dialect, "is_mariadb", False)
+    )
+
+
+def boolean_phrase(value: str) -> str:
+    """Quote a search value as one BOOLEAN MODE phrase ("..." matches in order)."""
+    return '"' + value.replace('"', " ").strip() + '"'
+
+
+def text_condition(
+    model, columns: List[str], value: str, dialect: Any
+) -> Optional[ColumnElement]:
+    """
+    Condition matching rows of model whose text columns contain a value
+
+    Args:
+        model: Property model (its table is mirrored in property_search_texts)
+        columns: Text columns to search, matched if any contains the value
+        value: Text to look for
+        dialect: Dialect of the session the query runs on
+
+    Returns:
+        WHERE condition on model, or None for a blank value
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    if fulltext_supported(dialect) and len(value) >= NGRAM_TOKEN_SIZE:
+        against = match(
+            *[getattr(PropertySearchText, c) for c in columns],
+            against=boolean_phrase(value),
+        ).in_boolean_mode()
+        matches = select(PropertySearchText.record_id).where(
+            PropertySearchText.table_name == model.__tablename__, against
+        )
+        return model.id.in_(matches)
+
+    return or_(*[getattr(model, c).contains(value, autoescape=True) for c in columns])
+
+
+def search_text_select(model, condition: Optional[ColumnElement] = None):
+    """
+    Rows of property_search_texts for a property table, as a select()
+
+    Args:
+        model: Property model to mirror
+        condition: Optional WHERE condition on model (e.g. some serial numbers)
+
+    Returns:
+        (columns, select) pair for PropertySearchText insert().from_select()
+    """
+    columns = [
+        "table_name",
+        "record_id",
+        "serial_number",
+        "period",
+        *SEARCH_TEXT_COLUMNS,
+    ]
+    query = select(
+        literal(model.__tablename__),
+        model.id,
+        model.serial_number,
+        model.period,
+        *[
+            getattr(model, c) if hasattr(model, c) else null()
+            for c in SEARCH_TEXT_COLUMNS
+        ],
+    )
+    if condition is not None:
+        query = query.where(condition)
+    return columns, query
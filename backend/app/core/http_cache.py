@@ -0,0 +1,66 @@
+"""HTTP conditional request support (ETag / If-None-Match) for read endpoints."""
+
+import hashlib
+from typing import Awaitable, Callable
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.data_version import get_data_version
+from app.core.database import get_async_db
+
+
+def make_etag(table_name: str, version: int, request: Request) -> str:
+    """Weak ETag from the table's data version and the request path/params."""
+    params = sorted(request.query_params.multi_items())
+    raw = f"{table_name}|{version}|{request.url.path}|{params}"
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Weak comparison of an ETag against an If-None-Match header value."""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in candidates)
+
+
+def cache_control() -> str:
+    """Cache-Control value for responses that carry an ETag."""
+    max_age = settings.HTTP_CACHE_MAX_AGE_SECONDS
+    return f"private, max-age={max_age}" if max_age > 0 else "private, no-cache"
+
+
+def conditional_get(table_name: str) -> Callable[..., Awaitable[None]]:
+    """
+    Dependency factory adding ETag/Cache-Control and answering 304
+
+    Responses only change when an import bumps the table's data version,
+    so the ETag can be decided before the endpoint queries anything.
+
+    Example:
+        @router.get("/", dependencies=[Depends(conditional_get("items"))])
+    """
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db),
+    ) -> None:
+        version = await get_data_version(db, table_name)
+        headers = {
+            "ETag": make_etag(table_name, version, request),
+            "Cache-Control": cache_control(),
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(headers["ETag"], if_none_match):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+
+        response.headers.update(headers)
+
+    return dependency
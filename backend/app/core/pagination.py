@@ -0,0 +1,79 @@
+"""Pagination helpers: keyset (seek) cursors and total count strategies."""
+
+import base64
+import json
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Tuple
+
+
+class CountStrategy(str, Enum):
+    """How the total number of matching rows is determined."""
+
+    EXACT = "exact"  # COUNT(*) over the filtered query
+    ESTIMATED = "estimated"  # Cached per-filter total or EXPLAIN row estimate
+    NONE = "none"  # No total; only has_next is reported
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _to_json_value(value: Any) -> Any:
+    """Convert an order column value into a JSON-safe representation."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(order_by: str, value: Any, last_id: int) -> str:
+    """
+    Encode the last seen (order_column, id) pair into an opaque cursor.
+
+    Args:
+        order_by: Name of the column the result set is ordered by
+        value: Value of the order column on the last returned row (None
+            when it is NULL, which the cursor records as a null value)
+        last_id: Primary key of the last returned row
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    payload = {"o": order_by, "v": _to_json_value(value), "id": last_id}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str) -> Tuple[Any, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous response
+        order_by: Column the current request is ordered by
+
+    Returns:
+        Tuple of (order column value, last id); the value is None when the
+        last row's order column was NULL
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued
+            for a different ordering
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value, last_id = payload["v"], int(payload["id"])
+        cursor_order = payload["o"]
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+    if cursor_order != order_by:
+        raise InvalidCursorError(
+            f"Cursor was issued for ordering by '{cursor_order}', not '{order_by}'"
+        )
+
+    return value, last_id
@@ -0,0 +1,106 @@
+"""Quarterly RANGE partitioning of the property tables.
+
+Each table has an integer `period` column, year * 10 + quarter of its
+parsed date (e.g. 20231 for 2023 Q1, 0 when the date is unknown), and is
+partitioned on it in MySQL, one partition per quarter:
+
+    p_before  VALUES LESS THAN (20121)      unknown dates and anything older
+    p2012q1   VALUES LESS THAN (20122)
+    ...
+    p_future  VALUES LESS THAN MAXVALUE     catch-all, split as quarters near
+
+MySQL only prunes partitions on predicates against the partitioning column
+itself, so date filters also bound `period` (see date_period()).
+
+Every unique key of a partitioned table must contain `period`, so in MySQL
+the primary key is (id, period) and the serial number key is
+(serial_number, period). The ORM models keep `id` as their only primary
+key; see the note on `id` in the models.
+"""
+
+import re
+from datetime import date
+from typing import Callable, List, Optional
+
+PERIOD_COLUMN = "period"
+
+# Partitioned table -> date column its period is derived from
+PERIOD_SOURCES = {
+    "property_transactions": "transaction_date_ad",
+    "property_presales": "transaction_date_ad",
+    "property_rentals": "rental_date_ad",
+}
+
+# First quarter with its own partition (actual price registration began 2012)
+FIRST_PERIOD = 20121
+BEFORE_PARTITION = "p_before"
+FUTURE_PARTITION = "p_future"
+
+_QUARTER = re.compile(r"^(\d{4})\s*[Qq]([1-4])$")
+
+
+def date_period(value: Optional[date]) -> int:
+    """Period of a date: 2023-03-15 -> 20231; 0 when the date is unknown."""
+    if value is None:
+        return 0
+    return value.year * 10 + (value.month - 1) // 3 + 1
+
+
+def period_default(date_column: str) -> Callable:
+    """
+    Column default deriving `period` from the row's date column
+
+    Covers ORM and Core inserts that do not set the period themselves; the
+    bulk loaders fill it in coerce_frame() instead.
+    """
+
+    def default(context) -> int:
+        return date_period(context.get_current_parameters().get(date_column))
+
+    return default
+
+
+def parse_period(value: str) -> int:
+    """
+    Parse a quarter such as "2023Q1" into a period
+
+    Raises:
+        ValueError: If the value is not YYYYQn
+    """
+    match = _QUARTER.match(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid quarter '{value}', expected e.g. 2023Q1")
+    return int(match.group(1)) * 10 + int(match.group(2))
+
+
+def next_period(period: int) -> int:
+    """The quarter after a period: 20234 -> 20241."""
+    year, quarter = divmod(period, 10)
+    return (year + 1) * 10 + 1 if quarter == 4 else period + 1
+
+
+def period_months(period: int) -> List[int]:
+    """Year * 100 + month values of a period's months: 20231 -> 202301..202303."""
+    year, quarter = divmod(period, 10)
+    first = (quarter - 1) * 3 + 1
+    return [year * 100 + month for month in range(first, first + 3)]
+
+
+def partition_name(period: int) -> str:
+    """Partition holding a period: 20231 -> "p2023q1"."""
+    year, quarter = divmod(period, 10)
+    return f"p{year}q{quarter}"
+
+
+def partition_period(name: str) -> Optional[int]:
+    """Inverse of partition_name(); None for p_before/p_future."""
+    match = re.match(r"^p(\d{4})q([1-4])$", name)
+    return int(match.group(1)) * 10 + int(match.group(2)) if match else None
+
+
+def partition_clause(period: int) -> str:
+    """Partition definition for one quarter."""
+    return (
+        f"PARTITION {partition_name(period)} "
+        f"VALUES LESS THAN ({next_period(period)})"
+    )
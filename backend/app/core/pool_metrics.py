@@ -0,0 +1,216 @@
+"""Connection pool instrumentation for sizing pools from observed load.
+
+Every engine created in app.core.database uses an instrumented QueuePool
+and is registered here under a name ("primary", "replica db-r1:3306",
+...). Pool events count connects, checkouts, check-ins and invalidations;
+the pool itself times how long each checkout waited for a connection.
+The counters are per process, like the pools: each uvicorn worker
+reports its own.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError, TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+# Checkout waits at or above these many seconds are counted separately
+WAIT_THRESHOLDS = (0.01, 0.1, 1.0)
+
+# record.info key: when the connection was last returned to the pool
+_CHECKED_IN_AT = "checked_in_at"
+
+
+class PoolMetrics:
+    """Counters and checkout wait times of one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool: Optional[QueuePool] = None
+        self._counters: Dict[str, int] = dict.fromkeys(
+            [
+                "connects",
+                "checkouts",
+                "checkins",
+                "invalidations",
+                "soft_invalidations",
+                "pings",
+                "ping_failures",
+                "timeouts",
+            ],
+            0,
+        )
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._waits_over = dict.fromkeys(WAIT_THRESHOLDS, 0)
+        self._lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] += 1
+
+    def record_wait(self, seconds: float) -> None:
+        """Record how long a checkout took to get a connection."""
+        with self._lock:
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+            for threshold in WAIT_THRESHOLDS:
+                if seconds >= threshold:
+                    self._waits_over[threshold] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current pool state plus the counters since startup."""
+        with self._lock:
+            checkouts = self._counters["checkouts"]
+            state = {
+                "name": self.name,
+                **self._counters,
+                "wait_seconds_total": round(self._wait_total, 6),
+                "wait_seconds_avg": (
+                    round(self._wait_total / checkouts, 6) if checkouts else None
+                ),
+                "wait_seconds_max": round(self._wait_max, 6),
+                "waits_over": {
+                    f"{threshold}s": count
+                    for threshold, count in self._waits_over.items()
+                },
+            }
+        pool = self.pool
+        if pool is not None:
+            state.update(
+                pool_size=pool.size(),
+                max_overflow=pool._max_overflow,
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                # overflow() counts down from -pool_size until the pool is full
+                overflow_in_use=max(pool.overflow(), 0),
+            )
+        return state
+
+
+class _TimedCheckout:
+    """Pool mixin timing connect(), i.e. the wait for a usable connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            if self.metrics:
+                self.metrics.count("timeouts")
+            raise
+        finally:
+            if self.metrics:
+                self.metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool for sync engines, with checkout timing."""
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """QueuePool for async engines, with checkout timing."""
+
+
+# Engine name -> its pool metrics
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def pool_options(is_async: bool = False) -> Dict[str, Any]:
+    """
+    create_engine() pool arguments from settings
+
+    DB_POOL_PRE_PING picks when a connection is tested with a ping before
+    use: "always" (SQLAlchemy's pool_pre_ping, one round trip per
+    checkout), "idle" (only connections idle for longer than
+    DB_POOL_PRE_PING_IDLE_SECONDS, see instrument()) or "never".
+    """
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
+
+
+def instrument(engine: Engine, name: str) -> PoolMetrics:
+    """
+    Attach pool event counters (and idle pre-pings) to an engine
+
+    Args:
+        engine: Sync engine, or the sync_engine of an AsyncEngine
+        name: Name the pool is reported under
+
+    Returns:
+        The engine's PoolMetrics, also registered in pool_metrics
+    """
+    metrics = PoolMetrics(name)
+    metrics.pool = engine.pool
+    engine.pool.metrics = metrics
+    pool_metrics[name] = metrics
+
+    idle_ping = settings.DB_POOL_PRE_PING == "idle"
+    idle_seconds = settings.DB_POOL_PRE_PING_IDLE_SECONDS
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, record):
+        metrics.count("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, record, proxy):
+        metrics.count("checkouts")
+        checked_in_at = record.info.get(_CHECKED_IN_AT)
+        if not idle_ping or checked_in_at is None:
+            return
+        if time.monotonic() - checked_in_at < idle_seconds:
+            return
+        metrics.count("pings")
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # The pool discards the connection and retries with a new one
+            metrics.count("ping_failures")
+            raise DisconnectionError() from e
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, record):
+        metrics.count("checkins")
+        record.info[_CHECKED_IN_AT] = time.monotonic()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, record, exception):
+        metrics.count("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def on_soft_invalidate(dbapi_connection, record, exception):
+        metrics.count("soft_invalidations")
+
+    return metrics
+
+
+def pool_report() -> Dict[str, Any]:
+    """Metrics of every instrumented pool in this process."""
+    return {
+        "pid": os.getpid(),
+        "pre_ping": settings.DB_POOL_PRE_PING,
+        "pools": [metrics.snapshot() for metrics in pool_metrics.values()],
+    }
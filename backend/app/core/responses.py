@@ -0,0 +1,67 @@
+"""Fast JSON responses and the API-wide Decimal encoding policy."""
+
+from decimal import Decimal
+from typing import Annotated, Any
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, PlainSerializer
+
+from app.core.config import settings
+
+
+def encode_decimal(value: Decimal) -> Any:
+    """Encode a Decimal per settings.JSON_DECIMAL_MODE ("string" or "float")."""
+    if settings.JSON_DECIMAL_MODE == "float":
+        return float(value)
+    return str(value)
+
+
+# Decimal schema fields: Pydantic already writes Decimals as strings, so a
+# serializer is only attached when numbers are wanted
+if settings.JSON_DECIMAL_MODE == "float":
+    JSONDecimal = Annotated[
+        Decimal, PlainSerializer(float, return_type=float, when_used="json")
+    ]
+else:
+    JSONDecimal = Decimal
+
+
+def orjson_default(value: Any) -> Any:
+    """orjson fallback for types it does not serialize natively."""
+    if isinstance(value, Decimal):
+        return encode_decimal(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson
+
+    Pydantic models passed as content are rendered by their own (Rust)
+    serializer; anything else goes through orjson, with Decimals encoded
+    per settings.JSON_DECIMAL_MODE.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return orjson.dumps(
+            content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def model_response(result: BaseModel, response: Response) -> FastJSONResponse:
+    """
+    Render a response model directly, skipping FastAPI's response_model pass
+
+    FastAPI re-validates a returned model against the route's response_model
+    and converts it to plain Python before encoding. Services already return
+    validated models (narrowed ones for ?fields= would not even match), so
+    endpoints hand them straight to the Rust serializer instead. Headers
+    already set on the injected response (ETag, Cache-Control) are kept.
+    """
+    return FastJSONResponse(result, headers=dict(response.headers))
@@ -0,0 +1,60 @@
+"""ROC (Minguo) calendar date parsing utilities.
+
+Government real-price registration data encodes dates as ROC year + month
++ day digits, e.g. "1120315" (2023-03-15) or "990101" (2010-01-01).
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+ROC_YEAR_OFFSET = 1911
+
+
+def current_roc_year() -> int:
+    """Return the current year in the ROC calendar."""
+    return datetime.now().year - ROC_YEAR_OFFSET
+
+
+def _roc_digits(value: object) -> Optional[str]:
+    """Normalize a ROC date value to its digit string ("751024.0" -> "751024")."""
+    if value is None:
+        return None
+    digits = str(value).strip().split(".", 1)[0]
+    if not digits.isdigit() or not 5 <= len(digits) <= 7:
+        return None
+    return digits
+
+
+def parse_roc_year(value: object) -> Optional[int]:
+    """
+    Extract the ROC year from a ROC date string.
+
+    Handles 2-digit (YYMMDD, <=6 chars) and 3-digit (YYYMMDD, 7 chars)
+    year formats, e.g. "751024" -> 75, "1051215" -> 105.
+
+    Returns:
+        ROC year, or None if the value cannot be parsed
+    """
+    digits = _roc_digits(value)
+    if digits is None:
+        return None
+    year = int(digits[:-4])
+    return year if year > 0 else None
+
+
+def roc_to_date(value: object) -> Optional[date]:
+    """
+    Convert a ROC date string to a Gregorian date.
+
+    Returns:
+        date, or None if the value is not a valid calendar date (ROC years
+        start at 1, as in parse_roc_year)
+    """
+    year = parse_roc_year(value)
+    if year is None:
+        return None
+    digits = _roc_digits(value)
+    try:
+        return date(year + ROC_YEAR_OFFSET, int(digits[-4:-2]), int(digits[-2:]))
+    except ValueError:
+        return None
@@ -0,0 +1,145 @@
+"""Statistics served from the pre-aggregated stats_rollups table."""
+
+import math
+from itertools import groupby
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Select, case, func, select
+
+from app.core.stats import StatsGroupBy, StatsMetric
+from app.models.stats_rollup import StatsRollup
+
+# Source table -> (date column months are taken from, value columns rolled up)
+ROLLUP_SOURCES = {
+    "property_transactions": (
+        "transaction_date_ad",
+        ("unit_price_ntd", "total_price_ntd"),
+    ),
+    "property_presales": ("transaction_date_ad", ("unit_price_ntd", "total_price_ntd")),
+    "property_rentals": ("rental_date_ad", ("monthly_rent_ntd", "unit_price_ntd")),
+}
+
+# Search filters that can be answered at rollup grain (dates only on month
+# boundaries); anything else needs the source table
+ROLLUP_FILTERS = {"city", "district", "building_types", "date_from", "date_to"}
+
+# Rollup column behind each group_by dimension
+ROLLUP_GROUPS = {
+    StatsGroupBy.CITY: StatsRollup.city,
+    StatsGroupBy.DISTRICT: StatsRollup.district,
+    StatsGroupBy.BUILDING_TYPE: StatsRollup.building_type,
+    StatsGroupBy.MONTH: StatsRollup.year_month,
+}
+
+
+def rollup_statement(
+    table_name: str,
+    value_column: str,
+    group_by: List[StatsGroupBy],
+    metrics: List[StatsMetric],
+    city: Optional[str] = None,
+    district: Optional[str] = None,
+    building_types: Optional[List[str]] = None,
+    month_from: Optional[int] = None,
+    month_to: Optional[int] = None,
+) -> Select:
+    """
+    Sum rollup rows up to the requested groups
+
+    Rows are additionally split per histogram bucket when percentiles are
+    requested, and come ordered by group (then bucket) for rollup_rows().
+
+    Args:
+        table_name: Source table of the statistics
+        value_column: Rolled-up value column
+        group_by: Dimensions to group by
+        metrics: Metrics that will be computed from the rows
+        city, district, building_types: Search filters
+        month_from, month_to: Inclusive year * 100 + month range
+    """
+    r = StatsRollup
+    keys = [ROLLUP_GROUPS[dimension].label(dimension.value) for dimension in group_by]
+    if any(metric.percentile for metric in metrics):
+        keys.append(r.bucket)
+
+    query = select(
+        *keys,
+        func.sum(r.row_count).label("row_count"),
+        func.sum(case((r.bucket.is_not(None), r.row_count), else_=0)).label(
+            "value_count"
+        ),
+        func.sum(r.value_sum).label("value_sum"),
+        func.min(r.value_min).label("value_min"),
+        func.max(r.value_max).label("value_max"),
+    ).where(r.table_name == table_name, r.value_column == value_column)
+
+    if city:
+        query = query.where(r.city == city)
+    if district:
+        query = query.where(r.district == district)
+    if building_types:
+        query = query.where(r.building_type.in_(building_types))
+    if month_from is not None:
+        query = query.where(r.year_month >= month_from)
+    if month_to is not None:
+        query = query.where(r.year_month <= month_to)
+
+    return query.group_by(*keys).order_by(*keys)
+
+
+def bucket_percentile(buckets: List[Any], count: int, percentile: int) -> Any:
+    """
+    Nearest-rank percentile estimated from ordered histogram buckets
+
+    The bucket holding the rank is known exactly; within it the value is
+    interpolated linearly between the bucket's min and max, so buckets of
+    identical values (common for prices) give the exact answer.
+    """
+    if not count:
+        return None
+    rank = math.ceil(percentile * count / 100)
+    seen = 0
+    for bucket in buckets:
+        if seen + bucket.value_count >= rank:
+            low, high = bucket.value_min, bucket.value_max
+            if bucket.value_count == 1 or low == high:
+                return low
+            position = rank - seen - 1
+            return low + (high - low) * position / (bucket.value_count - 1)
+        seen += bucket.value_count
+    return None
+
+
+def rollup_rows(
+    rows: List[Any], group_by: List[StatsGroupBy], metrics: List[StatsMetric]
+) -> List[Dict[str, Any]]:
+    """Reduce rollup_statement() rows to one mapping per group, like stats rows."""
+    names = [dimension.value for dimension in group_by]
+    results = []
+
+    for key, group in groupby(
+        rows, key=lambda row: tuple(row._mapping[n] for n in names)
+    ):
+        parts = list(group)
+        buckets = [part for part in parts if part.value_count]
+        count = sum(part.value_count for part in buckets)
+        total = sum(part.value_sum for part in buckets) if buckets else None
+
+        values: Dict[str, Any] = dict(zip(names, key))
+        for metric in metrics:
+            if metric == StatsMetric.COUNT:
+                value = sum(part.row_count for part in parts)
+            elif metric == StatsMetric.SUM:
+                value = total
+            elif metric == StatsMetric.AVG:
+                value = total / count if count else None
+            elif metric == StatsMetric.MIN:
+                value = min((part.value_min for part in buckets), default=None)
+            elif metric == StatsMetric.MAX:
+                value = max((part.value_max for part in buckets), default=None)
+            else:
+                value = bucket_percentile(buckets, count, metric.percentile)
+            values[metric.value] = value
+        results.append(values)
+
+    return results
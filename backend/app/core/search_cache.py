@@ -0,0 +1,175 @@
+"""Response cache for the search endpoints.
+
+Entries are keyed on the table's data version plus the normalized search
+parameters, so an import that bumps the version makes every older entry
+unreachable without having to delete anything.
+"""
+
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Protocol, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.data_version import get_data_version
+
+ResponseType = TypeVar("ResponseType", bound=BaseModel)
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized responses."""
+
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    async def set(self, key: str, value: str) -> None:
+        ...
+
+    async def clear(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU with TTL (one copy per worker process)."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._cache.set(key, value)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class RedisCacheBackend:
+    """Redis-backed cache shared by all workers and hosts."""
+
+    def __init__(self, url: str, ttl_seconds: int, prefix: str = "search:"):
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError(
+                "SEARCH_CACHE_BACKEND=redis requires the redis package"
+            ) from e
+
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._ttl_seconds = ttl_seconds
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._redis.get(self._prefix + key)
+
+    async def set(self, key: str, value: str) -> None:
+        await self._redis.set(self._prefix + key, value, ex=self._ttl_seconds)
+
+    async def clear(self) -> None:
+        async for key in self._redis.scan_iter(f"{self._prefix}*"):
+            await self._redis.delete(key)
+
+
+class SearchCache:
+    """
+    Cache search responses per table and data version
+
+    Example:
+        response = await search_cache.fetch(
+            db, "property_transactions", params, SearchResponse, run_search
+        )
+    """
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        """
+        Initialize cache
+
+        Args:
+            backend: Storage for serialized responses
+            enabled: Bypass the cache entirely when False
+        """
+        self.backend = backend
+        self.enabled = enabled
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(table_name: str, version: int, params: Dict[str, Any]) -> str:
+        """Build a key from the data version and normalized parameters."""
+        normalized = {
+            name: sorted(value) if isinstance(value, list) else value
+            for name, value in params.items()
+            if value is not None
+        }
+        raw = json.dumps(normalized, sort_keys=True, default=str, ensure_ascii=False)
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        return f"{table_name}:{version}:{digest}"
+
+    async def fetch(
+        self,
+        db: AsyncSession,
+        table_name: str,
+        params: Dict[str, Any],
+        response_model: Type[ResponseType],
+        search: Callable[[], Awaitable[ResponseType]],
+    ) -> ResponseType:
+        """
+        Return a cached response, or run the search and cache its result
+
+        Args:
+            db: Async session used to read the table's data version
+            table_name: Table the search reads from
+            params: Filters plus paging parameters identifying the request
+            response_model: Pydantic model of the response
+            search: Coroutine function producing the response on a miss
+        """
+        if not self.enabled:
+            return await search()
+
+        counters = self._counters.setdefault(table_name, {"hits": 0, "misses": 0})
+        version = await get_data_version(db, table_name)
+        key = self.make_key(table_name, version, params)
+
+        cached = await self.backend.get(key)
+        if cached is not None:
+            counters["hits"] += 1
+            return response_model.model_validate_json(cached)
+
+        counters["misses"] += 1
+        response = await search()
+        await self.backend.set(key, response.model_dump_json())
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per table and overall."""
+        hits = sum(c["hits"] for c in self._counters.values())
+        misses = sum(c["misses"] for c in self._counters.values())
+        lookups = hits + misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else None,
+            "tables": self._counters,
+        }
+
+
+def create_backend() -> CacheBackend:
+    """Backend selected by SEARCH_CACHE_BACKEND ("memory" or "redis")."""
+    if settings.SEARCH_CACHE_BACKEND == "redis":
+        return RedisCacheBackend(
+            settings.SEARCH_CACHE_REDIS_URL, settings.SEARCH_CACHE_TTL_SECONDS
+        )
+    return MemoryCacheBackend(
+        settings.SEARCH_CACHE_MAX_ENTRIES, settings.SEARCH_CACHE_TTL_SECONDS
+    )
+
+
+search_cache = SearchCache(create_backend(), enabled=settings.SEARCH_CACHE_ENABLED)
@@ -0,0 +1,138 @@
+"""Grouped statistics computed in SQL (GROUP BY + window-function percentiles)."""
+
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Optional, Type
+
+from sqlalchemy import ColumnElement, Select, and_, case, extract, func, select
+
+
+class StatsGroupBy(str, Enum):
+    """Dimensions statistics can be grouped by."""
+
+    CITY = "city"
+    DISTRICT = "district"
+    BUILDING_TYPE = "building_type"
+    MONTH = "month"  # Calendar month of the transaction/rental date
+
+
+class StatsMetric(str, Enum):
+    """Aggregates computed per group."""
+
+    COUNT = "count"  # Matching rows, whether or not the value is set
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    P25 = "p25"
+    P50 = "p50"  # Median
+    P75 = "p75"
+    P90 = "p90"
+
+    @property
+    def percentile(self) -> Optional[int]:
+        """Percentile rank for pNN metrics, None otherwise."""
+        return int(self.value[1:]) if self.value.startswith("p") else None
+
+
+DEFAULT_METRICS = [StatsMetric.COUNT, StatsMetric.AVG, StatsMetric.P50]
+
+
+def month_expression(date_column: Any) -> ColumnElement:
+    """Year * 100 + month of a date column, e.g. 202303 (portable across backends)."""
+    return extract("year", date_column) * 100 + extract("month", date_column)
+
+
+def format_month(value: Optional[int]) -> Optional[str]:
+    """202303 -> "2023-03"."""
+    if value is None:
+        return None
+    return f"{int(value) // 100:04d}-{int(value) % 100:02d}"
+
+
+def canonical(members: List[Enum], enum_class: Type[Enum]) -> List[Any]:
+    """Deduplicate enum members and put them in declaration order."""
+    return [member for member in enum_class if member in members]
+
+
+def stats_rows(rows: List[Mapping[str, Any]]) -> List[List[Any]]:
+    """Plain JSON-ready rows: months as "YYYY-MM", Decimals as floats."""
+    formatted = []
+    for row in rows:
+        values = []
+        for name, value in row.items():
+            if name == StatsGroupBy.MONTH.value:
+                value = format_month(value)
+            elif isinstance(value, Decimal):
+                value = float(value)
+            values.append(value)
+        formatted.append(values)
+    return formatted
+
+
+def stats_statement(
+    query: Select,
+    groups: Dict[str, Any],
+    value: Any,
+    metrics: List[StatsMetric],
+) -> Select:
+    """
+    Build a grouped statistics query over a filtered select()
+
+    Percentiles use the nearest-rank method: rows are numbered per group by
+    value (NULLs last) and pNN is the smallest value whose rank reaches
+    NN% of the group's non-NULL values. This only needs ROW_NUMBER/COUNT
+    window functions, so it runs on MySQL 8 (which has no PERCENTILE_CONT)
+    and SQLite alike.
+
+    Args:
+        query: Filtered select() on a model
+        groups: Output name -> column expression to group by (may be empty)
+        value: Column the value metrics are computed over
+        metrics: Metrics to compute
+
+    Returns:
+        Select yielding one row per group with the group columns followed
+        by one column per metric, ordered by the group columns
+    """
+    partition = list(groups.values()) or None
+    columns = [expr.label(name) for name, expr in groups.items()]
+    columns.append(value.label("value"))
+    if any(metric.percentile for metric in metrics):
+        nulls_last = case((value.is_(None), 1), else_=0)
+        columns.append(
+            func.row_number()
+            .over(partition_by=partition, order_by=[nulls_last, value])
+            .label("value_rank")
+        )
+        columns.append(
+            func.count(value).over(partition_by=partition).label("value_count")
+        )
+
+    base = query.with_only_columns(*columns).subquery()
+    group_columns = [base.c[name] for name in groups]
+    v = base.c.value
+
+    aggregates = []
+    for metric in metrics:
+        if metric == StatsMetric.COUNT:
+            expr = func.count()
+        elif metric == StatsMetric.SUM:
+            expr = func.sum(v)
+        elif metric == StatsMetric.AVG:
+            expr = func.avg(v)
+        elif metric == StatsMetric.MIN:
+            expr = func.min(v)
+        elif metric == StatsMetric.MAX:
+            expr = func.max(v)
+        else:
+            rank, count = base.c.value_rank, base.c.value_count
+            reached = rank * 100 >= metric.percentile * count
+            expr = func.min(case((and_(v.is_not(None), reached), v)))
+        aggregates.append(expr.label(metric.value))
+
+    return (
+        select(*group_columns, *aggregates)
+        .group_by(*group_columns)
+        .order_by(*group_columns)
+    )
@@ -0,0 +1,259 @@
+"""Typeahead suggestions served from in-memory prefix indexes.
+
+Each kind of suggestion (project names, districts, road names) is a sorted
+array of distinct values searched with bisect, so a keystroke costs a
+binary search instead of a LIKE scan. Indexes are built from the property
+tables in the background, at startup or on first use, and rebuilt once the
+data version of a source table changes; lookups never wait for a build.
+"""
+
+import asyncio
+import logging
+import time
+import unicodedata
+from bisect import bisect_left
+from enum import Enum
+from typing import (
+    AsyncContextManager,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.data_version import get_data_version
+from app.core.database import read_only_session
+from app.models.property_presale import PropertyPresale
+from app.models.property_rental import PropertyRental
+from app.models.property_transaction import PropertyTransaction
+
+logger = logging.getLogger(__name__)
+
+PROPERTY_MODELS = (PropertyTransaction, PropertyPresale, PropertyRental)
+
+# Road name at the start of an address, after the optional city and district,
+# e.g. 臺北市大安區仁愛路四段27巷 -> 仁愛路; land lots (…段…小段) have none
+ROAD_PATTERN = (
+    r"^(?:[^\d０-９區鄉鎮]{2,3}?[縣市])?(?:[^\d０-９區鄉鎮]{1,3}?[區鄉鎮市])?"
+    r"(?P<road>[^\d０-９段巷弄號]{1,10}?(?:大道|路|街))"
+)
+
+# Rows read per batch while collecting road names from addresses
+ROAD_BATCH_SIZE = 10000
+
+
+class SuggestKind(str, Enum):
+    """Kinds of values the typeahead can suggest."""
+
+    PROJECT = "project"  # Presale project names (建案名稱)
+    DISTRICT = "district"
+    ROAD = "road"  # Road/street names taken from addresses
+
+
+# Tables whose rows each kind of suggestion is built from
+SUGGEST_SOURCES = {
+    SuggestKind.PROJECT: (PropertyPresale,),
+    SuggestKind.DISTRICT: PROPERTY_MODELS,
+    SuggestKind.ROAD: PROPERTY_MODELS,
+}
+
+
+def normalize(text: str) -> str:
+    """Comparison form of a value: NFKC (full-width -> ASCII), 台 -> 臺, casefold."""
+    return unicodedata.normalize("NFKC", text).replace("台", "臺").casefold()
+
+
+class PrefixIndex:
+    """
+    Sorted array of distinct values, searched by prefix with bisect
+
+    Example:
+        index = PrefixIndex(["仁愛路", "信義路", "仁和街"])
+        index.lookup("仁")  # ["仁和街", "仁愛路"]
+    """
+
+    def __init__(self, values: Iterable[Optional[str]]):
+        """Index the non-blank values (one per normalized spelling)."""
+        by_key: Dict[str, str] = {}
+        for value in values:
+            if value and value.strip():
+                by_key.setdefault(normalize(value.strip()), value.strip())
+        self._keys = sorted(by_key)
+        self._values = [by_key[key] for key in self._keys]
+
+    def lookup(self, prefix: str, limit: int = 10) -> List[str]:
+        """Up to limit values starting with prefix, in sorted order."""
+        key = normalize(prefix)
+        start = bisect_left(self._keys, key)
+        matches = []
+        for i in range(start, min(start + limit, len(self._keys))):
+            if not self._keys[i].startswith(key):
+                break
+            matches.append(self._values[i])
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+async def distinct_values(db: AsyncSession, column) -> List[Optional[str]]:
+    """Distinct values of a column."""
+    return list((await db.scalars(select(column).distinct())).all())
+
+
+def roads_in(addresses: List[str]) -> Set[str]:
+    """Road names found in a batch of addresses."""
+    found = pd.Series(addresses, dtype="string").str.extract(ROAD_PATTERN)["road"]
+    return set(found.dropna().unique())
+
+
+async def road_names(db: AsyncSession, model) -> Set[str]:
+    """Road names found in a table's addresses (land_section)."""
+    loop = asyncio.get_running_loop()
+    roads: Set[str] = set()
+    result = await db.stream(
+        select(model.land_section)
+        .where(model.land_section.is_not(None))
+        .execution_options(yield_per=ROAD_BATCH_SIZE)
+    )
+    async for rows in result.partitions():
+        # Matching the pattern is CPU work; keep it off the event loop
+        addresses = [row[0] for row in rows]
+        roads.update(await loop.run_in_executor(None, roads_in, addresses))
+    return roads
+
+
+async def collect_values(db: AsyncSession, kind: SuggestKind) -> Iterable[str]:
+    """Every value a kind of suggestion can return, read from the database."""
+    values: Set[Optional[str]] = set()
+    for model in SUGGEST_SOURCES[kind]:
+        if kind == SuggestKind.PROJECT:
+            values.update(await distinct_values(db, model.project_name))
+        elif kind == SuggestKind.DISTRICT:
+            values.update(await distinct_values(db, model.district))
+        else:
+            values.update(await road_names(db, model))
+    return values
+
+
+class Suggestions:
+    """
+    Prefix indexes per suggestion kind, rebuilt in the background
+
+    An index remembers the data versions of its source tables. A lookup
+    compares them with the current versions at most once per
+    rebuild_interval seconds, so most keystrokes do not touch the
+    database. On newer versions it starts a rebuild as a background task
+    and keeps answering from the old index until the new one is swapped
+    in: an import bumps the version every batch, and suggestions one batch
+    behind are fine until it finishes. Until a kind's first build completes
+    its lookups return no suggestions.
+
+    Example:
+        values = await suggestions.lookup(db, SuggestKind.ROAD, "仁愛")
+    """
+
+    def __init__(
+        self,
+        rebuild_interval: float = 60,
+        session: Callable[[], AsyncContextManager[AsyncSession]] = read_only_session,
+    ):
+        """
+        Initialize indexes
+
+        Args:
+            rebuild_interval: Seconds an index is served before its source
+                data versions are checked again
+            session: Opens the session a background rebuild reads with
+        """
+        self.rebuild_interval = rebuild_interval
+        self.session = session
+        # kind -> (source data versions, last checked (monotonic), index)
+        self._indexes: Dict[
+            SuggestKind, Tuple[Tuple[int, ...], float, PrefixIndex]
+        ] = {}
+        # kind -> running rebuild; at most one per kind
+        self._tasks: Dict[SuggestKind, asyncio.Task] = {}
+
+    @staticmethod
+    async def _versions(db: AsyncSession, kind: SuggestKind) -> Tuple[int, ...]:
+        return tuple(
+            [
+                await get_data_version(db, model.__tablename__)
+                for model in SUGGEST_SOURCES[kind]
+            ]
+        )
+
+    def _start_rebuild(self, kind: SuggestKind) -> None:
+        if kind not in self._tasks:
+            self._tasks[kind] = asyncio.create_task(self._rebuild(kind))
+
+    async def _rebuild(self, kind: SuggestKind) -> None:
+        """Build a kind's index on its own session and swap it in."""
+        try:
+            async with self.session() as db:
+                versions = await self._versions(db, kind)
+                values = await collect_values(db, kind)
+            loop = asyncio.get_running_loop()
+            index = await loop.run_in_executor(None, PrefixIndex, values)
+            self._indexes[kind] = (versions, time.monotonic(), index)
+        except (SQLAlchemyError, OSError) as e:
+            # Keep the old index; the next stale lookup tries again
+            logger.warning("Typeahead index %s not rebuilt: %s", kind.value, e)
+        finally:
+            self._tasks.pop(kind, None)
+
+    async def index(self, db: AsyncSession, kind: SuggestKind) -> PrefixIndex:
+        """The current index of a kind; starts a rebuild if it is missing or stale."""
+        entry = self._indexes.get(kind)
+        if entry is None:
+            self._start_rebuild(kind)
+            return PrefixIndex([])
+
+        built_versions, checked_at, index = entry
+        if kind in self._tasks or time.monotonic() - checked_at < self.rebuild_interval:
+            return index
+
+        versions = await self._versions(db, kind)
+        if versions == built_versions:
+            self._indexes[kind] = (versions, time.monotonic(), index)
+        else:
+            self._start_rebuild(kind)
+        return index
+
+    async def lookup(
+        self, db: AsyncSession, kind: SuggestKind, prefix: str, limit: int = 10
+    ) -> List[str]:
+        """Up to limit suggestions of a kind starting with prefix."""
+        return (await self.index(db, kind)).lookup(prefix, limit)
+
+    def warm(self) -> None:
+        """Start building every index in the background, e.g. at startup."""
+        for kind in SuggestKind:
+            self._start_rebuild(kind)
+
+    async def close(self) -> None:
+        """Cancel rebuilds still running, e.g. at shutdown."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Indexed values per built kind."""
+        return {
+            kind.value: {"values": len(index)}
+            for kind, (_, _, index) in self._indexes.items()
+        }
+
+
+suggestions = Suggestions(rebuild_interval=settings.SUGGEST_REBUILD_INTERVAL_SECONDS)
@@ -1,3 +1,18 @@
+"""District -> city lookup for the raw government files.
+
+Files only carry the district (鄉鎮市區); the city comes from the file name
+(a_lvr_land_a.csv is 台北市 by its leading code letter) or, failing that,
+from the district name itself.
+"""
+
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
 DISTRICT_TO_CITY = {
     "中正區": "台北市",
     "大同區": "台北市",
@@ -374,8 +389,144 @@ DISTRICT_TO_CITY = {
 }
 
 
+# District names used by more than one city; the first city is assumed when
+# the file name does not say (duplicate keys above keep only the last one)
+AMBIGUOUS_DISTRICTS = {
+    "中正區": ("台北市", "基隆市"),
+    "中山區": ("台北市", "基隆市"),
+    "信義區": ("台北市", "基隆市"),
+    "大安區": ("台北市", "台中市"),
+    "東區": ("嘉義市", "台中市", "台南市", "新竹市"),
+    "西區": ("嘉義市", "台中市"),
+    "南區": ("台南市", "台中市"),
+    "北區": ("新竹市", "台中市", "台南市"),
+}
+
+# District -> every city it exists in, most likely first
+DISTRICT_CITIES: Dict[str, Tuple[str, ...]] = {
+    district: AMBIGUOUS_DISTRICTS.get(district, (city,))
+    for district, city in DISTRICT_TO_CITY.items()
+}
+
+# City code letter leading the government file names (x_lvr_land_*.csv)
+FILE_CITY_CODES = {
+    "a": "台北市",
+    "b": "台中市",
+    "c": "基隆市",
+    "d": "台南市",
+    "e": "高雄市",
+    "f": "新北市",
+    "g": "宜蘭縣",
+    "h": "桃園市",
+    "i": "嘉義市",
+    "j": "新竹縣",
+    "k": "苗栗縣",
+    "m": "南投縣",
+    "n": "彰化縣",
+    "o": "新竹市",
+    "p": "雲林縣",
+    "q": "嘉義縣",
+    "t": "屏東縣",
+    "u": "花蓮縣",
+    "v": "台東縣",
+    "w": "金門縣",
+    "x": "澎湖縣",
+    "z": "連江縣",
+}
+
+_FILE_NAME = re.compile(r"^([a-z])_lvr_land_[a-z]", re.IGNORECASE)
+
+
+def city_from_file_name(file_path: str) -> Optional[str]:
+    """City of a government file from its code letter, e.g. f_lvr_land_a.csv -> 新北市."""
+    match = _FILE_NAME.match(Path(file_path).name)
+    return FILE_CITY_CODES.get(match.group(1).lower()) if match else None
+
+
+def resolve_city(district: str, city_hint: Optional[str] = None) -> Optional[str]:
+    """City of one district name, preferring city_hint among ambiguous ones."""
+    cities = DISTRICT_CITIES.get(district)
+    if not cities:
+        return None
+    return city_hint if city_hint in cities else cities[0]
+
+
 def get_city_from_district(district: str) -> str:
-    city = DISTRICT_TO_CITY.get(district)
+    city = resolve_city(district)
     if not city:
         print(f"Warning: Unknown district '{district}', setting city to NULL")
     return city
+
+
+class DistrictResolver:
+    """
+    Vectorized district -> city mapping that tallies unknown districts
+
+    A Series is mapped through its categories, so each distinct district is
+    looked up once per chunk however many rows share it. Unknown and
+    ambiguous districts are counted across chunks and reported once by
+    report() instead of a warning per row.
+
+    Example:
+        resolver = DistrictResolver(city_from_file_name("f_lvr_land_a.csv"))
+        df["city"] = resolver.resolve(df["鄉鎮市區"])
+        resolver.report("f_lvr_land_a.csv")
+    """
+
+    def __init__(self, city_hint: Optional[str] = None):
+        """
+        Initialize resolver
+
+        Args:
+            city_hint: City every row is known to be in (from the file
+                name), used to settle ambiguous names such as 東區
+        """
+        self.city_hint = city_hint
+        self.unknown: Counter = Counter()
+        # Ambiguous districts settled without a hint: (district, city) -> rows
+        self.guessed: Counter = Counter()
+
+    def resolve(self, districts: pd.Series) -> pd.Series:
+        """Cities of a Series of district names (None where unknown)."""
+        categorical = pd.Categorical(districts)
+        names = categorical.categories
+        # Trailing None is picked up by the -1 code of missing districts
+        cities = np.array(
+            [resolve_city(name, self.city_hint) for name in names] + [None],
+            dtype=object,
+        )
+        counts = np.bincount(categorical.codes + 1, minlength=len(names) + 1)
+
+        missing = int(counts[0])
+        if missing:
+            self.unknown["(blank)"] += missing
+        for i, name in enumerate(names):
+            rows = int(counts[i + 1])
+            if rows and cities[i] is None:
+                self.unknown[name] += rows
+            elif rows and self.city_hint is None and name in AMBIGUOUS_DISTRICTS:
+                self.guessed[(name, cities[i])] += rows
+
+        return pd.Series(cities[categorical.codes], index=districts.index, dtype=object)
+
+    def report(self, source: str = "") -> None:
+        """Print one summary of unknown and guessed districts, if there were any."""
+        where = f" in {source}" if source else ""
+        if self.unknown:
+            rows = sum(self.unknown.values())
+            summary = ", ".join(
+                f"{name} ×{count:,}" for name, count in self.unknown.most_common()
+            )
+            print(
+                f"  Warning: {rows:,} rows with unknown districts{where}, "
+                f"city set to NULL: {summary}"
+            )
+        if self.guessed:
+            summary = ", ".join(
+                f"{name}→{city} ×{count:,}"
+                for (name, city), count in self.guessed.most_common()
+            )
+            print(
+                f"  Warning: ambiguous districts{where} assumed without a city "
+                f"code in the file name: {summary}"
+            )
@@ -0,0 +1,345 @@
+"""Bulk loading of cleaned DataFrames into the property tables."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Boolean, Date, Integer, Numeric, String, delete, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.core.data_version import bump_data_version
+from app.core.partitions import PERIOD_COLUMN, PERIOD_SOURCES, period_months
+from app.etl.rollups import touched_months
+from app.etl.search_texts import sync_search_texts
+
+# Natural key of a government record (編號)
+KEY_COLUMN = "serial_number"
+HASH_COLUMN = "row_hash"
+
+# Boolean spellings found in cleaned CSVs and in nullable boolean columns
+BOOLEAN_VALUES = {True: True, False: False, "True": True, "False": False}
+
+
+@dataclass
+class LoadStats:
+    """Row counts produced by loading one or more files."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # Rows left out because they have no serial_number to be matched on
+    skipped: int = 0
+    # Months (year * 100 + month) of written rows, for refreshing stats rollups
+    months: Set[Optional[int]] = field(default_factory=set)
+
+    @property
+    def total(self) -> int:
+        """Rows processed, including unchanged ones."""
+        return self.inserted + self.updated + self.unchanged
+
+    def __add__(self, other: "LoadStats") -> "LoadStats":
+        return LoadStats(
+            self.inserted + other.inserted,
+            self.updated + other.updated,
+            self.unchanged + other.unchanged,
+            self.skipped + other.skipped,
+            self.months | other.months,
+        )
+
+    def __str__(self) -> str:
+        text = (
+            f"{self.inserted:,} inserted, {self.updated:,} updated, "
+            f"{self.unchanged:,} unchanged"
+        )
+        if self.skipped:
+            text += f", {self.skipped:,} skipped"
+        return text
+
+
+def coerce_frame(model, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast cleaned columns to one canonical dtype per model column type.
+
+    Cleaned data reaches the loader from CSV files, Parquet checkpoints or
+    straight from the transformers; normalizing here keeps the values and
+    row hashes identical whichever way it came.
+    """
+    df = df.copy()
+
+    for column in model.__table__.columns:
+        if column.name not in df.columns:
+            continue
+        series = df[column.name]
+
+        if isinstance(column.type, Date):
+            dates = pd.to_datetime(series, errors="coerce")
+            series = dates.dt.date
+        elif isinstance(column.type, Boolean):
+            series = series.map(BOOLEAN_VALUES)
+        elif isinstance(column.type, (Integer, Numeric)):
+            series = pd.to_numeric(series, errors="coerce").astype("float64")
+        elif isinstance(column.type, String):
+            series = series.astype("string")
+
+        if not isinstance(column.type, (Integer, Numeric)):
+            series = series.astype(object).where(series.notna(), None)
+        df[column.name] = series
+
+    # Partitioning period, year * 10 + quarter of the parsed date (0 if unknown)
+    date_column = PERIOD_SOURCES.get(model.__tablename__)
+    if date_column in df.columns:
+        dates = pd.to_datetime(df[date_column], errors="coerce")
+        periods = dates.dt.year * 10 + dates.dt.quarter
+        df[PERIOD_COLUMN] = periods.fillna(0).astype("int64")
+
+    return df
+
+
+def read_cleaned_csv(file_path: str, model) -> pd.DataFrame:
+    """
+    Read a cleaned CSV using the model's column types.
+
+    String columns stay strings (ROC dates like "1120315" are not turned
+    into floats such as 1120315.0) and Date columns become date objects.
+    """
+    columns = model.__table__.columns
+    df = pd.read_csv(
+        file_path,
+        dtype={c.name: str for c in columns if isinstance(c.type, String)},
+    )
+    return coerce_frame(model, df)
+
+
+def read_cleaned_file(file_path: str, model) -> pd.DataFrame:
+    """Read a cleaned CSV or Parquet checkpoint, chosen by file suffix."""
+    if Path(file_path).suffix == ".parquet":
+        return coerce_frame(model, pd.read_parquet(file_path))
+    return read_cleaned_csv(file_path, model)
+
+
+def frame_to_rows(df: pd.DataFrame, columns: List[str]) -> List[tuple]:
+    """Convert DataFrame columns into DB-API parameter tuples (NaN -> None)."""
+    data = []
+    for column in columns:
+        series = df[column].astype(object)
+        data.append(series.where(series.notna(), None).tolist())
+    return list(zip(*data))
+
+
+def with_row_hash(model, df: pd.DataFrame) -> pd.DataFrame:
+    """Add a content hash of each row's data columns as row_hash."""
+    # period is derived from the date, so it is left out like the hash itself
+    derived = (HASH_COLUMN, PERIOD_COLUMN)
+    columns = [c for c in insert_columns(model, df) if c not in derived]
+    hashes = pd.util.hash_pandas_object(df[columns], index=False)
+    # Store the uint64 hash bit-for-bit in a signed BIGINT column
+    return df.assign(**{HASH_COLUMN: hashes.to_numpy().view(np.int64)})
+
+
+def insert_columns(model, df: pd.DataFrame) -> List[str]:
+    """Table columns present in the DataFrame, excluding the primary key."""
+    return [
+        column.name
+        for column in model.__table__.columns
+        if column.name in df.columns and not column.primary_key
+    ]
+
+
+def build_insert_sql(model, columns: List[str], dialect) -> str:
+    """Plain INSERT ... VALUES statement in the driver's paramstyle."""
+    preparer = dialect.identifier_preparer
+    placeholder = "?" if dialect.paramstyle == "qmark" else "%s"
+    return (
+        f"INSERT INTO {preparer.format_table(model.__table__)} "
+        f"({', '.join(preparer.quote(c) for c in columns)}) "
+        f"VALUES ({', '.join([placeholder] * len(columns))})"
+    )
+
+
+def keyed_rows(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """
+    Rows that have a serial_number, and how many were left out.
+
+    Records are matched on serial_number across imports, so a row without
+    one could not be recognized on the next run and would be inserted again.
+    Its text could not be mirrored for full-text search either, since the
+    search texts are synced by serial_number (see sync_search_texts).
+    """
+    keyed = df[KEY_COLUMN].notna()
+    skipped = int((~keyed).sum())
+    if skipped:
+        print(f"  ⚠️ Skipped {skipped:,} rows without a serial number")
+    return df[keyed], skipped
+
+
+def check_new_serials(db, model, df: pd.DataFrame, batch_size: int = 1000) -> None:
+    """
+    Refuse a plain (non-incremental) insert of already loaded records.
+
+    Plain inserts commit batch by batch, so a serial_number that is already
+    stored, or repeated within the frame, would otherwise fail on the unique
+    key halfway through, after earlier batches were written.
+
+    Raises:
+        ValueError: If a serial number repeats within the frame or is
+            already stored in the model's table
+    """
+    serials = df[KEY_COLUMN].dropna()
+    repeated = df.loc[df[KEY_COLUMN].notna() & df.duplicated(KEY_COLUMN), KEY_COLUMN]
+    if len(repeated):
+        raise ValueError(
+            f"{len(repeated):,} serial numbers repeat within the file "
+            f"(e.g. {repeated.iloc[0]}); use --incremental to keep the last one"
+        )
+
+    column = model.__table__.c[KEY_COLUMN]
+    values = serials.unique().tolist()
+    for i in range(0, len(values), batch_size):
+        stored = db.scalar(
+            select(column).where(column.in_(values[i : i + batch_size])).limit(1)
+        )
+        if stored is not None:
+            raise ValueError(
+                f"Serial number {stored} is already in {model.__tablename__}; "
+                "use --incremental to update existing records"
+            )
+
+
+def bulk_insert(db, model, df: pd.DataFrame, batch_size: int = 1000) -> int:
+    """
+    Insert a cleaned DataFrame without building ORM objects.
+
+    Each batch is converted column by column into parameter tuples and
+    sent through the driver's executemany, which PyMySQL rewrites into
+    multi-row INSERT statements. Nothing is written when the frame holds
+    serial numbers that are already loaded (see check_new_serials). Rows
+    without a serial_number are left out (see keyed_rows).
+
+    Returns:
+        Number of inserted rows
+    """
+    df, _ = keyed_rows(df)
+    total_records = len(df)
+    if total_records == 0:
+        return 0
+
+    check_new_serials(db, model, df, batch_size)
+    df = with_row_hash(model, df)
+    columns = insert_columns(model, df)
+    sql = build_insert_sql(model, columns, db.get_bind().dialect)
+    imported_count = 0
+
+    for i in range(0, total_records, batch_size):
+        batch = df.iloc[i : i + batch_size]
+        rows = frame_to_rows(batch, columns)
+        db.connection().exec_driver_sql(sql, rows)
+        sync_search_texts(db, model, batch[KEY_COLUMN])
+        bump_data_version(db, model.__tablename__)
+        db.commit()
+        imported_count += len(rows)
+
+        progress = imported_count / total_records * 100
+        print(f"  Progress: {progress:.1f}% ({imported_count}/{total_records})")
+
+    return imported_count
+
+
+def build_upsert(model, columns: List[str], dialect):
+    """
+    INSERT ... ON DUPLICATE KEY UPDATE keyed on (serial_number, period)
+
+    Partitioned tables can only have unique keys that include the
+    partitioning column, so period is part of the key. Records are still
+    identified by serial_number alone: upsert() removes a record's row in
+    another quarter before writing it, so the key only ever matches rows
+    with the same serial_number.
+    """
+    table = model.__table__
+    update_columns = [c for c in columns if c not in (KEY_COLUMN, PERIOD_COLUMN)]
+
+    if dialect.name == "mysql":
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(
+            {c: stmt.inserted[c] for c in update_columns}
+        )
+    if dialect.name == "sqlite":
+        stmt = sqlite_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=[KEY_COLUMN, PERIOD_COLUMN],
+            set_={c: stmt.excluded[c] for c in update_columns},
+        )
+    raise NotImplementedError(f"Incremental import is not supported on {dialect.name}")
+
+
+def upsert(db, model, df: pd.DataFrame, batch_size: int = 1000) -> LoadStats:
+    """
+    Idempotently load a cleaned DataFrame keyed on serial_number.
+
+    Rows whose serial_number is new are inserted, rows whose content hash
+    differs from the stored row_hash are updated, and identical rows are
+    skipped without being written. Rows without a serial_number cannot be
+    matched on a later run, so they are left out and counted as skipped.
+
+    Returns:
+        LoadStats with inserted, updated, unchanged and skipped counts
+    """
+    stats = LoadStats()
+    table = model.__table__
+
+    df, stats.skipped = keyed_rows(df)
+    # Keep the last occurrence of a serial number repeated within the file
+    df = with_row_hash(model, df[~df.duplicated(KEY_COLUMN, keep="last")])
+    total_records = len(df)
+    if total_records == 0:
+        return stats
+
+    columns = insert_columns(model, df)
+    stmt = build_upsert(model, columns, db.get_bind().dialect)
+
+    for i in range(0, total_records, batch_size):
+        batch = df.iloc[i : i + batch_size]
+
+        serials = batch[KEY_COLUMN].tolist()
+        stored = db.execute(
+            select(
+                table.c[KEY_COLUMN], table.c[HASH_COLUMN], table.c[PERIOD_COLUMN]
+            ).where(table.c[KEY_COLUMN].in_(serials))
+        ).all()
+        existing = {serial: row_hash for serial, row_hash, _ in stored}
+        stored_periods = {serial: period for serial, _, period in stored}
+        exists = batch[KEY_COLUMN].isin(list(existing))
+        same = exists & (batch[KEY_COLUMN].map(existing) == batch[HASH_COLUMN])
+
+        # A changed date can move a record to another quarter; the upsert
+        # would not match its old (serial_number, period) row, so drop it
+        old_periods = batch[KEY_COLUMN].map(stored_periods)
+        moved = exists & ~same & (old_periods != batch[PERIOD_COLUMN])
+        if moved.any():
+            db.execute(
+                delete(table).where(
+                    table.c[KEY_COLUMN].in_(batch.loc[moved, KEY_COLUMN].tolist())
+                )
+            )
+            for period in set(old_periods[moved].astype(int)):
+                stats.months.update(period_months(period) if period else [None])
+
+        stats.inserted += int((~exists).sum())
+        stats.updated += int((exists & ~same).sum())
+        stats.unchanged += int(same.sum())
+
+        changed = batch[~same]
+        if len(changed):
+            rows = frame_to_rows(changed, columns)
+            db.execute(stmt, [dict(zip(columns, row)) for row in rows])
+            sync_search_texts(db, model, changed[KEY_COLUMN])
+            bump_data_version(db, model.__tablename__)
+            stats.months |= touched_months(model, changed)
+        db.commit()
+
+        progress = stats.total / total_records * 100
+        print(f"  Progress: {progress:.1f}% ({stats.total}/{total_records}) {stats}")
+
+    return stats
@@ -0,0 +1,148 @@
+"""Concurrent import of cleaned CSV files with one worker process per file."""
+
+import contextlib
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from app.core.database import SessionLocal, engine
+from app.etl.loader import LoadStats
+
+
+@dataclass
+class FileResult:
+    """Outcome of importing a single file."""
+
+    file_path: str
+    stats: LoadStats = field(default_factory=LoadStats)
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def rate(self) -> float:
+        return self.stats.total / max(self.seconds, 1e-9)
+
+
+def _init_worker() -> None:
+    """Give each worker its own connection pool instead of the parent's."""
+    # Forked workers must not reuse sockets inherited from the parent
+    engine.dispose(close=False)
+
+
+def _import_one(
+    import_file: Callable,
+    file_path: str,
+    batch_size: int,
+    use_orm: bool,
+    incremental: bool,
+) -> FileResult:
+    """Import one file on a fresh session inside a worker process."""
+    db = SessionLocal()
+    started = time.perf_counter()
+
+    try:
+        # Per-batch progress from concurrent workers would interleave;
+        # the parent reports aggregated progress instead
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = import_file(file_path, db, batch_size, use_orm, incremental)
+        return FileResult(file_path, stats, time.perf_counter() - started)
+    except Exception as e:
+        db.rollback()
+        # Keep the first line; driver errors append the full SQL statement
+        message = str(e).splitlines()[0] if str(e) else ""
+        return FileResult(
+            file_path,
+            LoadStats(),
+            time.perf_counter() - started,
+            f"{type(e).__name__}: {message}",
+        )
+    finally:
+        db.close()
+
+
+def parallel_import(
+    files: List[str],
+    import_file: Callable,
+    workers: int,
+    batch_size: int = 1000,
+    use_orm: bool = False,
+    incremental: bool = False,
+) -> List[FileResult]:
+    """
+    Import files concurrently in a process pool.
+
+    Each worker handles one file at a time on its own engine/session and
+    commits batch by batch, so at most `workers` batches are in flight.
+
+    Args:
+        files: Cleaned CSV paths
+        import_file: Module-level import_*_file(file_path, db, batch_size,
+            use_orm, incremental) function from an import script
+        workers: Number of worker processes
+        batch_size: Rows per INSERT batch
+        use_orm: Use the ORM fallback path
+        incremental: Upsert on serial_number instead of plain inserts
+
+    Returns:
+        One FileResult per file, in completion order
+    """
+    results: List[FileResult] = []
+    total = LoadStats()
+    started = time.perf_counter()
+
+    print(f"Importing {len(files)} files with {workers} workers")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(
+                _import_one, import_file, file_path, batch_size, use_orm, incremental
+            )
+            for file_path in files
+        ]
+
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            total += result.stats
+
+            status = "✓" if result.ok else "✗"
+            rate = total.total / max(time.perf_counter() - started, 1e-9)
+            print(
+                f"  [{len(results)}/{len(files)}] {status} "
+                f"{Path(result.file_path).name} | "
+                f"{total} so far ({rate:,.0f} rows/s)"
+            )
+
+    print_summary(results, time.perf_counter() - started)
+    return results
+
+
+def print_summary(results: List[FileResult], seconds: float) -> None:
+    """Print per-file success/failure and overall throughput."""
+    print("\nSummary:")
+    for result in sorted(results, key=lambda r: r.file_path):
+        name = Path(result.file_path).name
+        if result.ok:
+            print(
+                f"  ✓ {name}: {result.stats} in {result.seconds:.1f}s "
+                f"({result.rate:,.0f} rows/s)"
+            )
+        else:
+            print(f"  ✗ {name}: {result.error}")
+
+    total = sum((r.stats for r in results), LoadStats())
+    failed = sum(not r.ok for r in results)
+    rate = total.total / max(seconds, 1e-9)
+    print(
+        f"\n{'❌' if failed else '✅'} Total: {total} from "
+        f"{len(results) - failed}/{len(results)} files ({rate:,.0f} rows/s)"
+    )
+    if failed:
+        print("  Failed files may be partially imported up to their last batch")
@@ -0,0 +1,135 @@
+"""Single-pass clean-and-load of raw government CSVs."""
+
+from decimal import Decimal
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import Boolean, Date, Integer, Numeric, String
+
+from app.etl.district_mapping import DistrictResolver
+from app.etl.loader import LoadStats, bulk_insert, coerce_frame, upsert
+from app.etl.rollups import touched_months
+from app.etl.streaming import DEFAULT_CHUNKSIZE, iter_clean_chunks
+
+
+class ParquetCheckpoint:
+    """
+    Append cleaned chunks to a Parquet file.
+
+    The Arrow schema comes from the model's column types rather than from
+    the first chunk, so chunks with all-empty columns still line up and the
+    file keeps its dtypes when read back: Integer columns are int64 and
+    Numeric columns decimal128 with the column's precision and scale, as in
+    Parquet exports (see app.core.export).
+    """
+
+    def __init__(self, path: str, model):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet checkpoints require pyarrow (pip install pyarrow)"
+            ) from e
+
+        self._pa = pa
+        self.columns = [c for c in model.__table__.columns if not c.primary_key]
+        self.schema = pa.schema(
+            [(column.name, self._arrow_type(column.type)) for column in self.columns]
+        )
+        self._writer = pq.ParquetWriter(path, self.schema)
+
+    def _arrow_type(self, column_type):
+        if isinstance(column_type, Date):
+            return self._pa.date32()
+        if isinstance(column_type, Boolean):
+            return self._pa.bool_()
+        if isinstance(column_type, Numeric):
+            return self._pa.decimal128(column_type.precision, column_type.scale)
+        if isinstance(column_type, Integer):
+            return self._pa.int64()
+        return self._pa.string()
+
+    @staticmethod
+    def _cast(series: pd.Series, column_type) -> pd.Series:
+        """Turn coerce_frame's float64 numbers back into the column's type."""
+        if isinstance(column_type, Numeric):
+            # The shortest repr of the float is the value parsed from the file
+            exponent = Decimal(1).scaleb(-column_type.scale)
+            return series.astype(object).map(
+                lambda v: None if pd.isna(v) else Decimal(repr(v)).quantize(exponent)
+            )
+        if isinstance(column_type, Integer):
+            return series.round().astype("Int64")
+        return series
+
+    def write(self, df: pd.DataFrame) -> None:
+        frame = df.reindex(columns=self.schema.names)
+        for column in self.columns:
+            frame[column.name] = self._cast(frame[column.name], column.type)
+        table = self._pa.Table.from_pandas(
+            frame, schema=self.schema, preserve_index=False
+        )
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def run_file(
+    db,
+    model,
+    input_path: str,
+    clean_chunk: Callable[[pd.DataFrame, DistrictResolver], pd.DataFrame],
+    chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+    batch_size: int = 1000,
+    incremental: bool = False,
+    checkpoint_path: Optional[str] = None,
+    load: bool = True,
+) -> Tuple[int, LoadStats]:
+    """
+    Clean a raw CSV and load it into the model's table in one pass.
+
+    Each chunk goes raw -> transformers -> loader without an intermediate
+    CSV, so values are parsed once and keep their dtypes.
+
+    Args:
+        db: Database session
+        model: Target ORM model
+        input_path: Raw government CSV
+        clean_chunk: clean_*_chunk function for the dataset
+        chunksize: Rows per chunk, or None to read the whole file at once
+        batch_size: Rows per INSERT batch
+        incremental: Upsert on serial_number instead of plain inserts
+        checkpoint_path: Also write the cleaned rows to this Parquet file
+        load: Write to the database (disable to only produce a checkpoint)
+
+    Returns:
+        Number of cleaned rows and the load statistics
+    """
+    checkpoint = ParquetCheckpoint(checkpoint_path, model) if checkpoint_path else None
+    cleaned_count = 0
+    stats = LoadStats()
+
+    try:
+        for cleaned in iter_clean_chunks(input_path, clean_chunk, chunksize):
+            frame = coerce_frame(model, cleaned)
+            cleaned_count += len(frame)
+
+            if checkpoint:
+                checkpoint.write(frame)
+            if not load:
+                continue
+
+            if incremental:
+                stats += upsert(db, model, frame, batch_size)
+            else:
+                inserted = bulk_insert(db, model, frame, batch_size)
+                stats += LoadStats(
+                    inserted=inserted, months=touched_months(model, frame)
+                )
+    finally:
+        if checkpoint:
+            checkpoint.close()
+
+    return cleaned_count, stats
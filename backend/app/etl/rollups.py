@@ -0,0 +1,187 @@
+"""Build and refresh the stats_rollups table from the property tables."""
+
+import math
+import time
+from datetime import date
+from typing import Iterable, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, delete, insert, or_, select
+
+from app.core.data_version import (
+    data_version,
+    mark_rollups_current,
+    mark_rollups_stale,
+)
+from app.core.partitions import date_period
+from app.core.rollups import ROLLUP_SOURCES
+from app.core.stats import month_expression
+from app.models.stats_rollup import StatsRollup
+
+# Group columns of a rollup row (year_month is computed from the date column)
+GRAIN = ["city", "district", "building_type", "year_month"]
+
+# Histogram buckets are 5% wide: bucket n holds values in [1.05^n, 1.05^(n+1))
+BUCKET_RATIO = 1.05
+# Zero and negative values (e.g. a 0 NTD parking price) sort below every bucket
+NON_POSITIVE_BUCKET = -1000
+
+# Months rebuilt per transaction, to bound memory on a full rebuild
+MONTHS_PER_BATCH = 12
+
+
+def value_buckets(values: pd.Series) -> pd.Series:
+    """Histogram bucket of each value (NaN where the value is missing)."""
+    positive = values.where(values > 0)
+    buckets = np.floor(np.log(positive) / math.log(BUCKET_RATIO))
+    return buckets.where(values.isna() | (values > 0), NON_POSITIVE_BUCKET)
+
+
+def touched_months(model, df: pd.DataFrame) -> Set[Optional[int]]:
+    """Year * 100 + month values of a loaded frame's rows (None for no date)."""
+    date_name = ROLLUP_SOURCES[model.__tablename__][0]
+    if date_name not in df.columns or df.empty:
+        return set()
+    dates = pd.to_datetime(df[date_name], errors="coerce")
+    months = set((dates.dt.year * 100 + dates.dt.month).dropna().astype(int))
+    if dates.isna().any():
+        months.add(None)
+    return months
+
+
+def _month_range(month: int):
+    """First day of a month and of the month after it."""
+    year, month = divmod(month, 100)
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def _months_condition(column, months: List[Optional[int]], dates: bool):
+    """Rows of the given months, on a date column or on rollup year_month."""
+    conditions = []
+    known = [month for month in months if month is not None]
+    if dates:
+        for month in known:
+            start, end = _month_range(month)
+            conditions.append(and_(column >= start, column < end))
+    elif known:
+        conditions.append(column.in_(known))
+    if None in months:
+        conditions.append(column.is_(None))
+    return or_(*conditions)
+
+
+def build_rollups(frame: pd.DataFrame, table_name: str, value_column: str) -> list:
+    """Rollup rows of one value column for a frame of grain + value columns."""
+    values = pd.to_numeric(frame[value_column], errors="coerce").astype("float64")
+    keys = frame[GRAIN].assign(bucket=value_buckets(values), value=values)
+    grouped = keys.groupby(GRAIN + ["bucket"], dropna=False)["value"]
+
+    rollups = pd.DataFrame(
+        {
+            "row_count": grouped.size(),
+            "value_sum": grouped.sum(min_count=1),
+            "value_min": grouped.min(),
+            "value_max": grouped.max(),
+        }
+    ).reset_index()
+    rollups["year_month"] = rollups["year_month"].astype("Int64")
+    rollups["bucket"] = rollups["bucket"].astype("Int64")
+    rollups = rollups.assign(table_name=table_name, value_column=value_column)
+
+    rollups = rollups.astype(object).where(rollups.notna(), None)
+    return rollups.to_dict("records")
+
+
+def refresh_rollups(db, model, months: Optional[Iterable[Optional[int]]] = None) -> int:
+    """
+    Rebuild a table's stats rollups and mark them current
+
+    Whole months are recomputed from the source table, so a refresh after
+    an import only has to cover the months the import wrote to. Rollups
+    are marked stale first and current again at the end, so the stats
+    endpoints read the source table while the refresh is running. They
+    are only marked current if no import bumped the table's data version
+    in the meantime (see mark_rollups_current).
+
+    Args:
+        db: Database session
+        model: Source ORM model (one of ROLLUP_SOURCES)
+        months: Year * 100 + month values to recompute (None for a row
+            without a date), or None to rebuild the whole table
+
+    Returns:
+        Number of rollup rows written
+    """
+    table_name = model.__tablename__
+    date_name, value_columns = ROLLUP_SOURCES[table_name]
+    date_column = getattr(model, date_name)
+    rollups = StatsRollup.__table__
+
+    version = data_version(db, table_name)
+    mark_rollups_stale(db, table_name)
+    if months is None:
+        db.execute(delete(rollups).where(rollups.c.table_name == table_name))
+        months = db.scalars(select(month_expression(date_column)).distinct()).all()
+    db.commit()
+
+    months = sorted(months, key=lambda month: (month is None, month or 0))
+    written = 0
+
+    for i in range(0, len(months), MONTHS_PER_BATCH):
+        batch = months[i : i + MONTHS_PER_BATCH]
+        db.execute(
+            delete(rollups).where(
+                rollups.c.table_name == table_name,
+                _months_condition(rollups.c.year_month, batch, dates=False),
+            )
+        )
+
+        periods = sorted({date_period(_month_range(m)[0]) if m else 0 for m in batch})
+        result = db.execute(
+            select(
+                model.city,
+                model.district,
+                model.building_type,
+                month_expression(date_column).label("year_month"),
+                *[getattr(model, name) for name in value_columns],
+            ).where(
+                _months_condition(date_column, batch, dates=True),
+                # Lets MySQL prune to the partitions of these months
+                model.period.in_(periods),
+            )
+        )
+        frame = pd.DataFrame(result.all(), columns=list(result.keys()))
+
+        if len(frame):
+            for value_column in value_columns:
+                rows = build_rollups(frame, table_name, value_column)
+                db.execute(insert(rollups), rows)
+                written += len(rows)
+        db.commit()
+
+    if version is not None and not mark_rollups_current(db, table_name, version):
+        print(f"  ⚠️ {table_name} changed during the refresh; rollups left stale")
+    db.commit()
+    return written
+
+
+def refresh_after_import(
+    db, model, months: Set[Optional[int]], were_current: bool
+) -> None:
+    """
+    Bring the stats rollups up to date after a successful import
+
+    Rollups that were current before the import only need the months it
+    wrote to recomputed; otherwise (never built, or left stale by a failed
+    import) the table's rollups are rebuilt from scratch.
+    """
+    started = time.perf_counter()
+    written = refresh_rollups(db, model, months if were_current else None)
+    scope = f"{len(months)} months" if were_current else "full rebuild"
+    print(
+        f"  ✓ Stats rollups refreshed ({scope}, {written:,} rows, "
+        f"{time.perf_counter() - started:.1f}s)"
+    )
@@ -0,0 +1,40 @@
+"""Mirror the searchable text of property rows into property_search_texts."""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, insert
+
+from app.core.fulltext import search_text_select
+from app.models.property_search_text import PropertySearchText
+
+
+def sync_search_texts(db, model, serials: Optional[Iterable[str]] = None) -> int:
+    """
+    Re-copy property rows' project name and address for full-text search
+
+    Runs in the caller's transaction, so the copies are committed together
+    with the rows they were taken from. Rows are matched by serial number:
+    a record that moved to another quarter keeps its serial but not its id.
+
+    Args:
+        db: Database session
+        model: Property ORM model whose rows were written
+        serials: Serial numbers of the written rows, or None to re-copy the
+            whole table
+
+    Returns:
+        Number of rows copied
+    """
+    texts = PropertySearchText.__table__
+    stale = delete(texts).where(texts.c.table_name == model.__tablename__)
+    condition = None
+    if serials is not None:
+        serials = list(serials)
+        if not serials:
+            return 0
+        stale = stale.where(texts.c.serial_number.in_(serials))
+        condition = model.serial_number.in_(serials)
+
+    db.execute(stale)
+    columns, query = search_text_select(model, condition)
+    return db.execute(insert(texts).from_select(columns, query)).rowcount
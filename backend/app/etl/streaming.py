@@ -0,0 +1,60 @@
+"""Chunked cleaning of raw government CSVs with bounded memory."""
+
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+
+from app.etl.district_mapping import DistrictResolver, city_from_file_name
+
+# Rows per chunk; keeps peak memory around a few hundred MB per worker
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def iter_clean_chunks(
+    input_path: str,
+    clean_chunk: Callable[[pd.DataFrame, DistrictResolver], pd.DataFrame],
+    chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield cleaned chunks of a raw CSV.
+
+    Args:
+        input_path: Raw CSV (second row holds English column names)
+        clean_chunk: Function turning a raw DataFrame into cleaned rows,
+            resolving cities with the file's DistrictResolver
+        chunksize: Rows per chunk, or None to read the whole file at once
+    """
+    with pd.read_csv(
+        input_path, skiprows=[1], dtype=str, chunksize=chunksize or None, iterator=True
+    ) as reader:
+        districts = DistrictResolver(city_from_file_name(input_path))
+        for chunk in reader:
+            yield clean_chunk(chunk, districts)
+        # One summary per file instead of a warning per row
+        districts.report(input_path)
+
+
+def clean_csv(
+    input_path: str,
+    output_path: str,
+    clean_chunk: Callable[[pd.DataFrame, DistrictResolver], pd.DataFrame],
+    chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+) -> int:
+    """
+    Clean a raw CSV chunk by chunk, appending each result to the output.
+
+    Only one raw chunk and its cleaned counterpart are held in memory at a
+    time, so file size does not affect peak memory.
+
+    Returns:
+        Number of cleaned rows written
+    """
+    total_records = 0
+
+    for i, cleaned in enumerate(iter_clean_chunks(input_path, clean_chunk, chunksize)):
+        cleaned.to_csv(
+            output_path, mode="w" if i == 0 else "a", header=i == 0, index=False
+        )
+        total_records += len(cleaned)
+
+    return total_records
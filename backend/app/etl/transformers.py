@@ -1,5 +1,10 @@
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+from app.core.roc_calendar import ROC_YEAR_OFFSET, parse_roc_year, roc_to_date
+
 
 def clean_yes_no(value: str) -> bool:
     if pd.isna(value):
@@ -27,3 +32,59 @@ def has_content(value) -> bool:
     if pd.isna(value):
         return False
     return str(value).strip() != ""
+
+
+def to_roc_year(value) -> Optional[int]:
+    if pd.isna(value):
+        return None
+    return parse_roc_year(value)
+
+
+def to_ad_date(value):
+    if pd.isna(value):
+        return None
+    return roc_to_date(value)
+
+
+# Column-level versions of the transformers above. They operate on a whole
+# Series at once and produce the same values without a Python call per cell.
+
+
+def clean_string_column(series: pd.Series) -> pd.Series:
+    stripped = series.astype("string").str.strip()
+    return stripped.mask(stripped == "")
+
+
+def to_numeric_column(series: pd.Series) -> pd.Series:
+    # Always float so the output format does not depend on which rows are blank
+    return pd.to_numeric(series, errors="coerce").astype("float64")
+
+
+def clean_yes_no_column(series: pd.Series) -> pd.Series:
+    return series.eq("有").astype("boolean").mask(series.isna())
+
+
+def parse_roc_date_column(series: pd.Series) -> pd.Series:
+    return np.trunc(pd.to_numeric(series, errors="coerce")).astype("Int64")
+
+
+def _roc_number_column(series: pd.Series) -> pd.Series:
+    # Whole-number form of a ROC date; NaN unless it has 5-7 digits
+    numbers = np.trunc(pd.to_numeric(series, errors="coerce"))
+    return numbers.where((numbers >= 10_000) & (numbers < 10_000_000))
+
+
+def to_roc_year_column(series: pd.Series) -> pd.Series:
+    return (_roc_number_column(series) // 10_000).astype("Int64")
+
+
+def to_ad_date_column(series: pd.Series) -> pd.Series:
+    numbers = _roc_number_column(series)
+    parts = pd.DataFrame(
+        {
+            "year": numbers // 10_000 + ROC_YEAR_OFFSET,
+            "month": numbers // 100 % 100,
+            "day": numbers % 100,
+        }
+    )
+    return pd.to_datetime(parts, errors="coerce")
@@ -1,17 +1,32 @@
 """FastAPI Application Entry Point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.core.suggest import suggestions
 from app.api.v1.router import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start building the typeahead indexes without delaying startup."""
+    suggestions.warm()
+    yield
+    await suggestions.close()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware configuration
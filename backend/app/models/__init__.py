@@ -3,9 +3,15 @@
 from app.models.property_transaction import PropertyTransaction
 from app.models.property_presale import PropertyPresale
 from app.models.property_rental import PropertyRental
+from app.models.data_version import DataVersion
+from app.models.stats_rollup import StatsRollup
+from app.models.property_search_text import PropertySearchText
 
 __all__ = [
     "PropertyTransaction",
     "PropertyPresale",
     "PropertyRental",
+    "DataVersion",
+    "StatsRollup",
+    "PropertySearchText",
 ]
@@ -0,0 +1,22 @@
+"""Data Version Model"""
+
+from sqlalchemy import Column, DateTime, Integer, String, func
+from app.core.database import Base
+
+
+class DataVersion(Base):
+    """Per-table data version, bumped whenever an import writes rows"""
+
+    __tablename__ = "data_versions"
+
+    table_name = Column(String(64), primary_key=True, comment="資料表名稱")
+    version = Column(Integer, nullable=False, default=0, comment="資料版本")
+    # Version the stats rollups were last refreshed at (current when equal)
+    rollup_version = Column(Integer, comment="統計彙總版本")
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="最後更新時間",
+    )
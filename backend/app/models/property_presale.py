@@ -1,15 +1,53 @@
 """Property Presale Model"""
 
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    BigInteger,
+    String,
+    Numeric,
+    Boolean,
+    Text,
+    Date,
+    Index,
+    UniqueConstraint,
+)
 from app.core.database import Base
+from app.core.partitions import period_default
 
 
 class PropertyPresale(Base):
     """Property presale model"""
 
     __tablename__ = "property_presales"
+    __table_args__ = (
+        # Government record number identifies a row across repeated imports
+        # (with period: MySQL unique keys must contain the partitioning column)
+        UniqueConstraint("serial_number", "period", name="uq_presale_serial_number"),
+        # Composite indexes matching the search endpoint filter combinations
+        Index(
+            "idx_presale_city_district_date",
+            "city",
+            "district",
+            "transaction_date_ad",
+            "id",
+        ),
+        Index("idx_presale_city_date", "city", "transaction_date_ad", "id"),
+        Index(
+            "idx_presale_city_type_price",
+            "city",
+            "building_type",
+            "total_price_ntd",
+        ),
+    )
 
     # Primary Key
+    # Deliberately id alone, while MySQL's is (id, period) (migration
+    # 5533a1d79403): a partitioned table's unique keys must contain the
+    # partitioning column. id is AUTO_INCREMENT and unique by itself, so
+    # lookups by id are unaffected; SQLite cannot autoincrement a composite
+    # key; and Alembic autogenerate does not compare primary keys, so it
+    # does not propose reverting the difference.
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     # Common Fields (20) - Shared by all tables
@@ -54,6 +92,23 @@ class PropertyPresale(Base):
     building_number = Column(String(100), comment="棟及號")
     termination_status = Column(String(50), comment="解約情形")
 
+    # Parsed Fields (2) - Derived from ROC strings during ETL for indexed filtering
+    construction_year_roc = Column(Integer, index=True, comment="建築完成年(民國)")
+    transaction_date_ad = Column(Date, index=True, comment="交易年月日(西元)")
+
+    # Import Bookkeeping (1) - Content hash used to detect changed rows on re-import
+    row_hash = Column(BigInteger, comment="匯入內容雜湊")
+
+    # Partitioning (1) - Quarter of transaction_date_ad, the MySQL RANGE partitioning key
+    # (part of the MySQL primary key, not of the model's; see id above)
+    period = Column(
+        Integer,
+        nullable=False,
+        default=period_default("transaction_date_ad"),
+        server_default="0",
+        comment="交易季度(西元年*10+季)",
+    )
+
     def __repr__(self) -> str:
         """String representation."""
         return f"<PropertyPresale(id={self.id}, city={self.city}, project_name={self.project_name})>"
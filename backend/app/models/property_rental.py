@@ -1,15 +1,53 @@
 """Property Rental Model"""
 
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    BigInteger,
+    String,
+    Numeric,
+    Boolean,
+    Text,
+    Date,
+    Index,
+    UniqueConstraint,
+)
 from app.core.database import Base
+from app.core.partitions import period_default
 
 
 class PropertyRental(Base):
     """Property rental model"""
 
     __tablename__ = "property_rentals"
+    __table_args__ = (
+        # Government record number identifies a row across repeated imports
+        # (with period: MySQL unique keys must contain the partitioning column)
+        UniqueConstraint("serial_number", "period", name="uq_rental_serial_number"),
+        # Composite indexes matching the search endpoint filter combinations
+        Index(
+            "idx_rental_city_district_date",
+            "city",
+            "district",
+            "rental_date_ad",
+            "id",
+        ),
+        Index("idx_rental_city_date", "city", "rental_date_ad", "id"),
+        Index(
+            "idx_rental_city_type_price",
+            "city",
+            "building_type",
+            "monthly_rent_ntd",
+        ),
+    )
 
     # Primary Key
+    # Deliberately id alone, while MySQL's is (id, period) (migration
+    # 5533a1d79403): a partitioned table's unique keys must contain the
+    # partitioning column. id is AUTO_INCREMENT and unique by itself, so
+    # lookups by id are unaffected; SQLite cannot autoincrement a composite
+    # key; and Alembic autogenerate does not compare primary keys, so it
+    # does not propose reverting the difference.
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     # Common Fields (20) - Shared by all tables
@@ -54,6 +92,23 @@ class PropertyRental(Base):
     parking_area_sqm = Column(Numeric(15, 2), comment="車位面積平方公尺")
     parking_rent_ntd = Column(Numeric(15, 2), comment="車位總額元")
 
+    # Parsed Fields (2) - Derived from ROC strings during ETL for indexed filtering
+    construction_year_roc = Column(Integer, index=True, comment="建築完成年(民國)")
+    rental_date_ad = Column(Date, index=True, comment="租賃年月日(西元)")
+
+    # Import Bookkeeping (1) - Content hash used to detect changed rows on re-import
+    row_hash = Column(BigInteger, comment="匯入內容雜湊")
+
+    # Partitioning (1) - Quarter of rental_date_ad, the MySQL RANGE partitioning key
+    # (part of the MySQL primary key, not of the model's; see id above)
+    period = Column(
+        Integer,
+        nullable=False,
+        default=period_default("rental_date_ad"),
+        server_default="0",
+        comment="租賃季度(西元年*10+季)",
+    )
+
     def __repr__(self) -> str:
         """String representation."""
         return f"<PropertyRental(id={self.id}, city={self.city}, district={self.district})>"
@@ -0,0 +1,61 @@
+"""Property Search Text Model"""
+
+from sqlalchemy import Column, Integer, String, Text, Index
+from app.core.database import Base
+
+
+class PropertySearchText(Base):
+    """Searchable text of property rows, indexed for ngram full-text search
+
+    MySQL cannot build FULLTEXT indexes on partitioned tables, so the
+    project name and address of every property row are copied here (by the
+    loaders, in the same transaction as the row itself) and searched with
+    MATCH ... AGAINST; see BaseRepository.text_filter().
+    """
+
+    __tablename__ = "property_search_texts"
+    __table_args__ = (
+        # Loaders replace a batch's rows by serial number
+        Index("idx_search_table_serial", "table_name", "serial_number"),
+        # Truncating a quarter's partition removes its rows here as well
+        Index("idx_search_table_period", "table_name", "period"),
+        # ngram parser: CJK text has no spaces to split words on
+        Index(
+            "ft_search_project",
+            "project_name",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+        Index(
+            "ft_search_address",
+            "land_section",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+        Index(
+            "ft_search_project_address",
+            "project_name",
+            "land_section",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Source Row (4) - Table, id, serial number and partition of the property row
+    table_name = Column(String(64), nullable=False, comment="來源資料表")
+    record_id = Column(Integer, nullable=False, comment="來源資料編號")
+    serial_number = Column(String(100), comment="編號")
+    period = Column(Integer, nullable=False, server_default="0", comment="季度(西元年*10+季)")
+
+    # Searchable Text (2)
+    project_name = Column(String(200), comment="建案名稱")
+    land_section = Column(Text, comment="土地位置建物門牌")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<PropertySearchText(table={self.table_name}, record_id={self.record_id})>"
+        )
@@ -1,15 +1,52 @@
 """Property Transaction Model"""
 
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    BigInteger,
+    String,
+    Numeric,
+    Boolean,
+    Text,
+    Date,
+    Index,
+    UniqueConstraint,
+    bindparam,
+    case,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.core.database import Base
+from app.core.partitions import period_default
+from app.core.roc_calendar import current_roc_year
 
 
 class PropertyTransaction(Base):
     """Property transaction model"""
 
     __tablename__ = "property_transactions"
+    __table_args__ = (
+        # Government record number identifies a row across repeated imports
+        # (with period: MySQL unique keys must contain the partitioning column)
+        UniqueConstraint("serial_number", "period", name="uq_trans_serial_number"),
+        # Composite indexes matching the search endpoint filter combinations
+        Index(
+            "idx_trans_city_district_date",
+            "city",
+            "district",
+            "transaction_date_ad",
+            "id",
+        ),
+        Index("idx_trans_city_date", "city", "transaction_date_ad", "id"),
+        Index("idx_trans_city_type_price", "city", "building_type", "total_price_ntd"),
+    )
 
     # Primary Key
+    # Deliberately id alone, while MySQL's is (id, period) (migration
+    # 5533a1d79403): a partitioned table's unique keys must contain the
+    # partitioning column. id is AUTO_INCREMENT and unique by itself, so
+    # lookups by id are unaffected; SQLite cannot autoincrement a composite
+    # key; and Alembic autogenerate does not compare primary keys, so it
+    # does not propose reverting the difference.
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     # Common Fields (20) - Shared by all tables
@@ -55,6 +92,45 @@ class PropertyTransaction(Base):
     balcony_area = Column(Numeric(15, 2), comment="陽台面積")
     has_elevator = Column(Boolean, index=True, comment="有無電梯")
 
+    # Parsed Fields (2) - Derived from ROC strings during ETL for indexed filtering
+    construction_year_roc = Column(Integer, index=True, comment="建築完成年(民國)")
+    transaction_date_ad = Column(Date, index=True, comment="交易年月日(西元)")
+
+    # Import Bookkeeping (1) - Content hash used to detect changed rows on re-import
+    row_hash = Column(BigInteger, comment="匯入內容雜湊")
+
+    # Partitioning (1) - Quarter of transaction_date_ad, the MySQL RANGE partitioning key
+    # (part of the MySQL primary key, not of the model's; see id above)
+    period = Column(
+        Integer,
+        nullable=False,
+        default=period_default("transaction_date_ad"),
+        server_default="0",
+        comment="交易季度(西元年*10+季)",
+    )
+
+    @hybrid_property
+    def building_age(self):
+        """Building age in years (current ROC year - construction year)."""
+        if self.construction_year_roc is None:
+            return None
+        age = current_roc_year() - self.construction_year_roc
+        return age if age >= 0 else None
+
+    @building_age.expression
+    def building_age(cls):
+        """SQL form of building_age; the current year is bound at execution."""
+        current_year = bindparam(
+            "current_roc_year", callable_=current_roc_year, type_=Integer
+        )
+        return case(
+            (
+                cls.construction_year_roc <= current_year,
+                current_year - cls.construction_year_roc,
+            ),
+            else_=None,
+        )
+
     def __repr__(self) -> str:
         """String representation."""
         return f"<PropertyTransaction(id={self.id}, city={self.city}, district={self.district})>"
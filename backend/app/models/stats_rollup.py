@@ -0,0 +1,43 @@
+"""Stats Rollup Model"""
+
+from sqlalchemy import Column, Integer, String, Numeric, Index
+from app.core.database import Base
+
+
+class StatsRollup(Base):
+    """Pre-aggregated value histogram per (city, district, building type, month)"""
+
+    __tablename__ = "stats_rollups"
+    __table_args__ = (
+        # Refreshes replace whole months of one source table and value column
+        Index(
+            "idx_rollup_table_value_month", "table_name", "value_column", "year_month"
+        ),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Source - Table and value column the row summarizes
+    table_name = Column(String(64), nullable=False, comment="來源資料表")
+    value_column = Column(String(64), nullable=False, comment="統計欄位")
+
+    # Grain - One row per group and histogram bucket
+    city = Column(String(50), comment="縣市")
+    district = Column(String(50), comment="鄉鎮市區")
+    building_type = Column(String(100), comment="建物型態")
+    year_month = Column(Integer, comment="年月(西元, 例 202303)")
+    bucket = Column(Integer, comment="價格區間(NULL 為無值)")
+
+    # Aggregates - Over the rows of the group that fall in the bucket
+    row_count = Column(Integer, nullable=False, comment="筆數")
+    value_sum = Column(Numeric(24, 2), comment="合計")
+    value_min = Column(Numeric(20, 2), comment="最小值")
+    value_max = Column(Numeric(20, 2), comment="最大值")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<StatsRollup(table={self.table_name}, value={self.value_column}, "
+            f"district={self.district}, year_month={self.year_month})>"
+        )
@@ -1,15 +1,31 @@
 """Data access repositories."""
 
-from app.repositories.base import BaseRepository
+from app.repositories.base import (
+    AsyncBaseRepository,
+    BaseRepository,
+    RepositoryQueries,
+)
 from app.repositories.property_transaction_repository import (
+    AsyncPropertyTransactionRepository,
     PropertyTransactionRepository,
 )
-from app.repositories.property_presale_repository import PropertyPresaleRepository
-from app.repositories.property_rental_repository import PropertyRentalRepository
+from app.repositories.property_presale_repository import (
+    AsyncPropertyPresaleRepository,
+    PropertyPresaleRepository,
+)
+from app.repositories.property_rental_repository import (
+    AsyncPropertyRentalRepository,
+    PropertyRentalRepository,
+)
 
 __all__ = [
+    "RepositoryQueries",
     "BaseRepository",
+    "AsyncBaseRepository",
     "PropertyTransactionRepository",
     "PropertyPresaleRepository",
     "PropertyRentalRepository",
+    "AsyncPropertyTransactionRepository",
+    "AsyncPropertyPresaleRepository",
+    "AsyncPropertyRentalRepository",
 ]
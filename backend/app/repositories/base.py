@@ -1,15 +1,358 @@
 """Base Repository - Generic Data Access Layer Base Class"""
 
-from typing import Generic, TypeVar, Type, Optional
+import hashlib
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+    Type,
+    Optional,
+)
+from sqlalchemy import ColumnElement, Select, and_, func, inspect, or_, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.data_version import data_version, get_data_version
 from app.core.database import Base
+from app.core.fulltext import text_condition
+from app.core.pagination import (
+    CountStrategy,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from app.core.roc_calendar import roc_to_date
+from app.core.rollups import ROLLUP_FILTERS, rollup_statement
+from app.core.stats import (
+    StatsGroupBy,
+    StatsMetric,
+    month_expression,
+    stats_statement,
+)
 
 
 # Define generic constraint: only accept ORM Models that inherit from Base
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Shared across requests: (table, data version, filter signature) -> total row count
+_count_cache = TTLCache(
+    max_entries=settings.COUNT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+)
 
-class BaseRepository(Generic[ModelType]):
+
+def parse_date_filter(value: str) -> date:
+    """
+    Convert a ROC date filter value to a Gregorian date
+
+    Args:
+        value: ROC date string, e.g. "1120315"
+
+    Raises:
+        ValueError: If the value is not a valid ROC date
+    """
+    parsed = roc_to_date(value)
+    if parsed is None:
+        raise ValueError(f"Invalid ROC date '{value}', expected e.g. 1120315")
+    return parsed
+
+
+class RepositoryQueries(Generic[ModelType]):
+    """
+    Statement building shared by BaseRepository and AsyncBaseRepository
+
+    Nothing here executes a statement: filters, keyset cursors, ordering,
+    column selection and statistics are built as select()s, which the sync
+    and async repositories then run on their own session. Table-specific
+    builders (build_search_query) live on per-table mixins of this class.
+    """
+
+    model: Type[ModelType]
+    db: Any  # Session or AsyncSession
+
+    def page_statement(
+        self,
+        query: Select,
+        order_column: Any,
+        order_desc: bool,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+    ) -> Select:
+        """
+        Apply the keyset cursor, ordering and paging to a filtered query
+
+        The keyset is (order_column IS NULL, order_column, id). MySQL (and
+        SQLite) sort NULLs below every value, so rows with a NULL order
+        value (e.g. an unparseable date) come last when descending and
+        first when ascending. A cursor taken on such a row carries a NULL
+        value, and the next page continues within the NULL block (and, when
+        ascending, on into the non-NULL rows).
+        """
+        if cursor:
+            value, last_id = decode_cursor(cursor, order_column.key)
+            query = query.filter(
+                self._after_cursor(order_column, value, last_id, order_desc)
+            )
+
+        query = self.order(query, order_column, order_desc)
+
+        # Fetch one extra row to find out whether a next page exists
+        return query.offset(skip).limit(limit + 1)
+
+    def _after_cursor(
+        self, order_column: Any, value: Any, last_id: int, order_desc: bool
+    ) -> ColumnElement:
+        """Condition keeping the rows ordered after a cursor's keyset position."""
+        id_column = self.model.id
+        if value is None:
+            after_id = id_column < last_id if order_desc else id_column > last_id
+            within_nulls = and_(order_column.is_(None), after_id)
+            if order_desc:
+                return within_nulls
+            return or_(within_nulls, order_column.is_not(None))
+
+        value = self._coerce_cursor_value(order_column, value)
+        if order_desc:
+            return or_(
+                order_column < value,
+                and_(order_column == value, id_column < last_id),
+                order_column.is_(None),
+            )
+        return or_(
+            order_column > value,
+            and_(order_column == value, id_column > last_id),
+        )
+
+    @staticmethod
+    def page_result(
+        rows: List[Any],
+        order_column: Any,
+        skip: int,
+        limit: int,
+        total: Optional[int],
+        count_strategy: CountStrategy,
+    ) -> Dict[str, Any]:
+        """Build the paginate() result from the limit + 1 fetched rows."""
+        items = rows[:limit]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            last_value = getattr(last, order_column.key)
+            next_cursor = encode_cursor(order_column.key, last_value, last.id)
+
+        return {
+            "total": total,
+            "items": items,
+            "page": (skip // limit) + 1,
+            "page_size": limit,
+            "total_pages": (total + limit - 1) // limit if total is not None else None,
+            "next_cursor": next_cursor,
+            "has_next": len(rows) > limit,
+            "count_strategy": count_strategy,
+        }
+
+    def aggregate_statement(
+        self,
+        query: Select,
+        group_by: List[StatsGroupBy],
+        date_column: Any,
+        value: Any,
+        metrics: List[StatsMetric],
+    ) -> Select:
+        """
+        Grouped statistics over a filtered query, computed in the database
+
+        Args:
+            query: Filtered select() on self.model
+            group_by: Dimensions to group by (none for one overall row)
+            date_column: Date column that month groups are taken from
+            value: Column the value metrics are computed over
+            metrics: Metrics to compute (see app.core.stats.StatsMetric)
+
+        Returns:
+            Select yielding one row per group: group values, then one value
+            per metric
+        """
+        groups = {
+            dimension.value: (
+                month_expression(date_column)
+                if dimension == StatsGroupBy.MONTH
+                else getattr(self.model, dimension.value)
+            )
+            for dimension in group_by
+        }
+        return stats_statement(query, groups, value, metrics)
+
+    def rollup_filters(self, filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Restate search filters at stats rollup grain
+
+        Args:
+            filters: Search filters (unset ones already dropped)
+
+        Returns:
+            Keyword arguments for rollup_statement(), or None when a filter
+            is finer than the rollup grain (e.g. a price range, or a date
+            range that does not start and end on month boundaries)
+
+        Raises:
+            ValueError: If a date filter is not a valid ROC date
+        """
+        if set(filters) - ROLLUP_FILTERS:
+            return None
+
+        restated = {
+            name: filters.get(name) for name in ("city", "district", "building_types")
+        }
+        if filters.get("date_from"):
+            start = parse_date_filter(filters["date_from"])
+            if start.day != 1:
+                return None
+            restated["month_from"] = start.year * 100 + start.month
+        if filters.get("date_to"):
+            end = parse_date_filter(filters["date_to"])
+            if (end + timedelta(days=1)).day != 1:
+                return None
+            restated["month_to"] = end.year * 100 + end.month
+        return restated
+
+    def rollup_aggregate_statement(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        rollup_filters: Dict[str, Any],
+    ) -> Select:
+        """
+        Grouped rollup rows of this table (reduce them with rollup_rows())
+
+        Args:
+            group_by: Dimensions to group by
+            value: Rolled-up value column
+            metrics: Metrics to compute
+            rollup_filters: Filters from rollup_filters()
+        """
+        return rollup_statement(
+            self.model.__tablename__, value, group_by, metrics, **rollup_filters
+        )
+
+    def stream_statement(
+        self, query: Select, order_column: Any, fields: List[str]
+    ) -> Select:
+        """Column select of every row of a filtered query, in stable order."""
+        return self.select_fields(self.order(query, order_column), fields, order_column)
+
+    def select_fields(
+        self, query: Select, fields: List[str], order_column: Any
+    ) -> Select:
+        """
+        Narrow a select() on self.model to some of its columns
+
+        Args:
+            query: select() on self.model
+            fields: Column or hybrid property names to select (other names
+                are ignored); hybrids are evaluated in SQL
+            order_column: Order column, always selected so a cursor can be built
+
+        Returns:
+            Column select whose rows carry id, the order column and the fields
+        """
+        descriptors = inspect(self.model).all_orm_descriptors
+        columns = {self.model.id.key: self.model.id, order_column.key: order_column}
+        for name in fields:
+            if name in self.model.__table__.columns:
+                columns[name] = getattr(self.model, name)
+            elif isinstance(descriptors.get(name), hybrid_property):
+                columns[name] = getattr(self.model, name).label(name)
+        return query.with_only_columns(*columns.values())
+
+    def text_filter(
+        self, query: Select, columns: List[str], value: Optional[str]
+    ) -> Select:
+        """
+        Keep rows whose text columns (any of them) contain a value
+
+        Matched with the ngram FULLTEXT indexes of property_search_texts on
+        MySQL, and with LIKE '%value%' elsewhere (see app.core.fulltext).
+
+        Args:
+            query: Filtered select() on self.model
+            columns: Text columns to search, e.g. ["land_section"]
+            value: Search text; blank values leave the query unchanged
+        """
+        if not value:
+            return query
+        dialect = self.db.get_bind().dialect
+        condition = text_condition(self.model, columns, value, dialect)
+        return query if condition is None else query.filter(condition)
+
+    def order(
+        self, query: Select, order_column: Any, order_desc: bool = True
+    ) -> Select:
+        """Order a query by (order_column, id) so every row has a stable position."""
+        if order_desc:
+            return query.order_by(order_column.desc(), self.model.id.desc())
+        return query.order_by(order_column.asc(), self.model.id.asc())
+
+    @staticmethod
+    def count_statement(query: Select) -> Select:
+        """SELECT COUNT(*) over a filtered query."""
+        return select(func.count()).select_from(query.order_by(None).subquery())
+
+    @staticmethod
+    def _filter_signature(query: Select) -> str:
+        """Build a cache key identifying the query's SQL and bound values."""
+        compiled = query.compile()
+        params = sorted((k, repr(v)) for k, v in compiled.params.items())
+        raw = f"{compiled}|{params}".encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+
+    def _count_key(self, query: Select, version: int) -> str:
+        """Count cache key: the query's filters at a data version of its table."""
+        table_name = self.model.__tablename__
+        return f"{table_name}:{version}:{self._filter_signature(query)}"
+
+    @staticmethod
+    def _estimate_from_plan(plan: List[Dict[str, Any]]) -> Optional[int]:
+        """rows * filtered / 100 from the first plan row, if any."""
+        if not plan:
+            return None
+
+        rows = plan[0].get("rows") or 0
+        filtered = plan[0].get("filtered") or 100
+        return int(rows * float(filtered) / 100)
+
+    @staticmethod
+    def _coerce_cursor_value(order_column: Any, value: Any) -> Any:
+        """Convert a decoded cursor value back to the column's Python type."""
+        try:
+            python_type = order_column.type.python_type
+        except NotImplementedError:
+            return value
+
+        try:
+            if python_type is Decimal:
+                return Decimal(str(value))
+            if issubclass(python_type, date):
+                return python_type.fromisoformat(value)
+            return python_type(value)
+        except (ValueError, TypeError, InvalidOperation) as e:
+            raise InvalidCursorError("Malformed pagination cursor") from e
+
+
+class BaseRepository(RepositoryQueries[ModelType]):
     """
     Generic Repository Base Class
 
@@ -48,4 +391,336 @@ class BaseRepository(Generic[ModelType]):
             if property:
                 print(property.city)
         """
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        return self._scalar(select(self.model).where(self.model.id == id))
+
+    def _scalar(self, stmt: Select) -> Any:
+        """Execute a statement and return the first column of the first row."""
+        return self.db.scalar(stmt)
+
+    def _scalars(self, stmt: Select) -> List[Any]:
+        """Execute a statement and return the first column of every row."""
+        return list(self.db.scalars(stmt).all())
+
+    def _rows(self, stmt: Select) -> List[Any]:
+        """
+        Execute a column select and return every row as a named tuple
+
+        Runs on the session's connection, so rows skip the ORM result layer.
+        """
+        return list(self.db.connection().execute(stmt).all())
+
+    def paginate(
+        self,
+        query: Select,
+        order_column: Any,
+        order_desc: bool = True,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Order and paginate a filtered query
+
+        Rows are ordered by (order_column, id) so that every row has a
+        stable position. When a cursor is given, the page continues after
+        the last (order_column, id) pair it encodes instead of using OFFSET,
+        so deep pages cost the same as the first one. Rows whose order value
+        is NULL are reached by cursors too (see page_statement).
+
+        Args:
+            query: Filtered select() on self.model
+            order_column: Model column to order by
+            order_desc: Order descending if True
+            skip: Records to skip (ignored when cursor is given)
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page's next_cursor
+            count_strategy: How to determine total (see CountStrategy)
+            fields: Select only these columns (see select_fields) and return
+                rows instead of model instances, skipping ORM hydration
+
+        Returns:
+            Dictionary with total, items, page, page_size, total_pages,
+            next_cursor, has_next and count_strategy. total and total_pages
+            are None when count_strategy is NONE.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        total, count_strategy = self.count(query, count_strategy)
+        if cursor:
+            skip = 0
+
+        stmt = self.page_statement(query, order_column, order_desc, skip, limit, cursor)
+        if fields:
+            rows = self._rows(self.select_fields(stmt, fields, order_column))
+        else:
+            rows = self._scalars(stmt)
+        return self.page_result(rows, order_column, skip, limit, total, count_strategy)
+
+    def aggregate(
+        self,
+        query: Select,
+        group_by: List[StatsGroupBy],
+        date_column: Any,
+        value: Any,
+        metrics: List[StatsMetric],
+    ) -> List[Any]:
+        """Compute grouped statistics in the database (see aggregate_statement)."""
+        return self._rows(
+            self.aggregate_statement(query, group_by, date_column, value, metrics)
+        )
+
+    def rollup_aggregate(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        rollup_filters: Dict[str, Any],
+    ) -> List[Any]:
+        """Grouped rollup rows of this table (see rollup_aggregate_statement)."""
+        return self._rows(
+            self.rollup_aggregate_statement(group_by, value, metrics, rollup_filters)
+        )
+
+    def stream(
+        self,
+        query: Select,
+        order_column: Any,
+        fields: List[str],
+        batch_size: int = 1000,
+    ) -> Iterator[List[Any]]:
+        """
+        Stream every row of a filtered query in batches
+
+        Rows are read through a server-side cursor (yield_per), so memory
+        stays bounded by batch_size whatever the result size.
+
+        Args:
+            query: Filtered select() on self.model
+            order_column: Column to order by (ties broken by id)
+            fields: Columns to select (see select_fields)
+            batch_size: Rows fetched from the cursor per batch
+
+        Yields:
+            Lists of up to batch_size rows
+        """
+        stmt = self.stream_statement(query, order_column, fields)
+        result = self.db.connection().execute(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        yield from result.partitions()
+
+    def count(
+        self, query: Select, count_strategy: CountStrategy
+    ) -> Tuple[Optional[int], CountStrategy]:
+        """
+        Count rows matched by a filtered query
+
+        Args:
+            query: Filtered select() on self.model (without ordering/paging)
+            count_strategy: EXACT runs COUNT(*); ESTIMATED reuses a cached
+                total for the same filters and data version (an import
+                invalidates it), falling back to the MySQL
+                EXPLAIN row estimate (or COUNT(*) on other backends);
+                NONE skips counting
+
+        Returns:
+            Tuple of (row count, strategy that produced it). The count is
+            None for NONE, and the strategy is EXACT whenever COUNT(*) ran,
+            including the fallback when EXPLAIN is unavailable.
+        """
+        if count_strategy == CountStrategy.NONE:
+            return None, count_strategy
+        if count_strategy == CountStrategy.EXACT:
+            return self._scalar(self.count_statement(query)), count_strategy
+
+        version = data_version(self.db, self.model.__tablename__) or 0
+        key = self._count_key(query, version)
+        total = _count_cache.get(key)
+        if total is None:
+            total = self._explain_estimate(query)
+            if total is None:
+                total = self._scalar(self.count_statement(query))
+                count_strategy = CountStrategy.EXACT
+            _count_cache.set(key, total)
+        return total, count_strategy
+
+    def explain(self, query: Select) -> List[Dict[str, Any]]:
+        """
+        Run MySQL EXPLAIN for a query
+
+        Args:
+            query: Query to explain (bound values are rendered inline)
+
+        Returns:
+            One dict per plan row (id, table, type, key, rows, filtered,
+            Extra, ...), or an empty list when the backend is not MySQL
+        """
+        dialect = self.db.get_bind().dialect
+        if dialect.name != "mysql":
+            return []
+
+        sql = str(
+            query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        )
+        # Binds are rendered inline, so skip the driver's parameter
+        # interpolation (it would trip over the % of LIKE patterns)
+        result = self.db.connection().exec_driver_sql(
+            f"EXPLAIN {sql}", execution_options={"no_parameters": True}
+        )
+        return [dict(row) for row in result.mappings()]
+
+    def _explain_estimate(self, query: Select) -> Optional[int]:
+        """
+        Estimate matching rows from MySQL's EXPLAIN plan
+
+        Returns:
+            rows * filtered / 100 from the plan, or None when the backend
+            is not MySQL or the plan cannot be read
+        """
+        try:
+            plan = self.explain(query)
+        except DBAPIError:
+            return None
+
+        return self._estimate_from_plan(plan)
+
+
+class AsyncBaseRepository(RepositoryQueries[ModelType]):
+    """
+    Async counterpart of BaseRepository for an AsyncSession
+
+    Statements are built by the shared RepositoryQueries methods; every
+    method that executes one is a coroutine (stream() is an async
+    generator), so no sync method can hand back an awaitable by accident.
+
+    Example:
+        class AsyncPropertyRepository(
+            PropertyQueries, AsyncBaseRepository[Property]
+        ):
+            def __init__(self, db: AsyncSession):
+                super().__init__(Property, db)
+    """
+
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        """
+        Initialize Repository
+
+        Args:
+            model: ORM Model class (must inherit from Base)
+            db: SQLAlchemy AsyncSession instance
+        """
+        self.model = model
+        self.db = db
+
+    async def get(self, id: int) -> Optional[ModelType]:
+        """Query single record by ID."""
+        return await self._scalar(select(self.model).where(self.model.id == id))
+
+    async def _scalar(self, stmt: Select) -> Any:
+        return await self.db.scalar(stmt)
+
+    async def _scalars(self, stmt: Select) -> List[Any]:
+        return list((await self.db.scalars(stmt)).all())
+
+    async def _rows(self, stmt: Select) -> List[Any]:
+        return list((await (await self.db.connection()).execute(stmt)).all())
+
+    async def paginate(
+        self,
+        query: Select,
+        order_column: Any,
+        order_desc: bool = True,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Order and paginate a filtered query (see BaseRepository.paginate)."""
+        total, count_strategy = await self.count(query, count_strategy)
+        if cursor:
+            skip = 0
+
+        stmt = self.page_statement(query, order_column, order_desc, skip, limit, cursor)
+        if fields:
+            rows = await self._rows(self.select_fields(stmt, fields, order_column))
+        else:
+            rows = await self._scalars(stmt)
+        return self.page_result(rows, order_column, skip, limit, total, count_strategy)
+
+    async def aggregate(
+        self,
+        query: Select,
+        group_by: List[StatsGroupBy],
+        date_column: Any,
+        value: Any,
+        metrics: List[StatsMetric],
+    ) -> List[Any]:
+        """Compute grouped statistics in the database (see aggregate_statement)."""
+        return await self._rows(
+            self.aggregate_statement(query, group_by, date_column, value, metrics)
+        )
+
+    async def rollup_aggregate(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        rollup_filters: Dict[str, Any],
+    ) -> List[Any]:
+        """Grouped rollup rows of this table (see rollup_aggregate_statement)."""
+        return await self._rows(
+            self.rollup_aggregate_statement(group_by, value, metrics, rollup_filters)
+        )
+
+    async def stream(
+        self,
+        query: Select,
+        order_column: Any,
+        fields: List[str],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Any]]:
+        """Stream a filtered query in row batches (see BaseRepository.stream)."""
+        stmt = self.stream_statement(query, order_column, fields)
+        connection = await self.db.connection()
+        result = await connection.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield partition
+
+    async def count(
+        self, query: Select, count_strategy: CountStrategy
+    ) -> Tuple[Optional[int], CountStrategy]:
+        """Count rows matched by a filtered query (see BaseRepository.count)."""
+        if count_strategy == CountStrategy.NONE:
+            return None, count_strategy
+        if count_strategy == CountStrategy.EXACT:
+            return await self._scalar(self.count_statement(query)), count_strategy
+
+        version = await get_data_version(self.db, self.model.__tablename__)
+        key = self._count_key(query, version)
+        total = _count_cache.get(key)
+        if total is None:
+            total = await self._explain_estimate(query)
+            if total is None:
+                total = await self._scalar(self.count_statement(query))
+                count_strategy = CountStrategy.EXACT
+            _count_cache.set(key, total)
+        return total, count_strategy
+
+    async def explain(self, query: Select) -> List[Dict[str, Any]]:
+        """Run MySQL EXPLAIN for a query (see BaseRepository.explain)."""
+        # The sync code path drives the async connection via run_sync
+        return await self.db.run_sync(
+            lambda session: BaseRepository(self.model, session).explain(query)
+        )
+
+    async def _explain_estimate(self, query: Select) -> Optional[int]:
+        try:
+            plan = await self.explain(query)
+        except DBAPIError:
+            return None
+
+        return self._estimate_from_plan(plan)
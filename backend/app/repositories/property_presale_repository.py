@@ -1,12 +1,73 @@
 """Property Presale Repository"""
 
-from typing import Optional, List, Dict, Any
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.pagination import CountStrategy
+from app.core.partitions import date_period
+from app.core.stats import StatsGroupBy, StatsMetric
 from app.models.property_presale import PropertyPresale
-from app.repositories.base import BaseRepository
+from app.repositories.base import (
+    AsyncBaseRepository,
+    BaseRepository,
+    RepositoryQueries,
+    parse_date_filter,
+)
 
 
-class PropertyPresaleRepository(BaseRepository[PropertyPresale]):
+class PropertyPresaleQueries(RepositoryQueries[PropertyPresale]):
+    """Presale search statements shared by the sync and async repositories."""
+
+    def build_search_query(
+        self,
+        city: Optional[str] = None,
+        district: Optional[str] = None,
+        q: Optional[str] = None,
+        address: Optional[str] = None,
+        project_name: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        price_min: Optional[int] = None,
+        price_max: Optional[int] = None,
+        building_types: Optional[List[str]] = None,
+    ) -> Select:
+        """Build the filtered (unordered, unpaginated) search query."""
+        query = select(self.model)
+
+        if city:
+            query = query.filter(self.model.city == city)
+        if district:
+            query = query.filter(self.model.district == district)
+        query = self.text_filter(query, ["project_name", "land_section"], q)
+        query = self.text_filter(query, ["land_section"], address)
+        query = self.text_filter(query, ["project_name"], project_name)
+        # Each date bound is repeated on period so MySQL prunes partitions
+        if date_from:
+            start = parse_date_filter(date_from)
+            query = query.filter(
+                self.model.transaction_date_ad >= start,
+                self.model.period >= date_period(start),
+            )
+        if date_to:
+            end = parse_date_filter(date_to)
+            query = query.filter(
+                self.model.transaction_date_ad <= end,
+                self.model.period <= date_period(end),
+            )
+        if price_min:
+            query = query.filter(self.model.total_price_ntd >= price_min)
+        if price_max:
+            query = query.filter(self.model.total_price_ntd <= price_max)
+        if building_types:
+            query = query.filter(self.model.building_type.in_(building_types))
+
+        return query
+
+
+class PropertyPresaleRepository(
+    PropertyPresaleQueries, BaseRepository[PropertyPresale]
+):
     """Repository for property presale data access."""
 
     def __init__(self, db: Session):
@@ -21,17 +82,19 @@ class PropertyPresaleRepository(BaseRepository[PropertyPresale]):
         self, city: str, district: Optional[str] = None, skip: int = 0, limit: int = 20
     ) -> List[PropertyPresale]:
         """Get presales by location with pagination."""
-        query = self.db.query(self.model).filter(self.model.city == city)
+        query = select(self.model).filter(self.model.city == city)
 
         if district:
             query = query.filter(self.model.district == district)
 
-        return query.offset(skip).limit(limit).all()
+        return self._scalars(query.offset(skip).limit(limit))
 
     def search(
         self,
         city: Optional[str] = None,
         district: Optional[str] = None,
+        q: Optional[str] = None,
+        address: Optional[str] = None,
         project_name: Optional[str] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
@@ -40,41 +103,131 @@ class PropertyPresaleRepository(BaseRepository[PropertyPresale]):
         building_types: Optional[List[str]] = None,
         skip: int = 0,
         limit: int = 20,
-        order_by: str = "transaction_date",
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+        order_by: str = "transaction_date_ad",
         order_desc: bool = True,
     ) -> Dict[str, Any]:
         """Search presales with filters."""
-        query = self.db.query(self.model)
+        query = self.build_search_query(
+            city=city,
+            district=district,
+            q=q,
+            address=address,
+            project_name=project_name,
+            date_from=date_from,
+            date_to=date_to,
+            price_min=price_min,
+            price_max=price_max,
+            building_types=building_types,
+        )
 
-        if city:
-            query = query.filter(self.model.city == city)
-        if district:
-            query = query.filter(self.model.district == district)
-        if project_name:
-            query = query.filter(self.model.project_name.like(f"%{project_name}%"))
-        if date_from:
-            query = query.filter(self.model.transaction_date >= date_from)
-        if date_to:
-            query = query.filter(self.model.transaction_date <= date_to)
-        if price_min:
-            query = query.filter(self.model.total_price_ntd >= price_min)
-        if price_max:
-            query = query.filter(self.model.total_price_ntd <= price_max)
-        if building_types:
-            query = query.filter(self.model.building_type.in_(building_types))
+        order_column = getattr(self.model, order_by, self.model.transaction_date_ad)
+
+        return self.paginate(
+            query,
+            order_column,
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=fields,
+        )
+
+    def export(
+        self, fields: List[str], batch_size: int = 1000, **filters: Any
+    ) -> Iterator[List[Any]]:
+        """Stream presales matching the search filters in batches of rows."""
+        query = self.build_search_query(**filters)
+        return self.stream(query, self.model.transaction_date_ad, fields, batch_size)
 
-        order_column = getattr(self.model, order_by, self.model.transaction_date)
-        query = query.order_by(
-            order_column.desc() if order_desc else order_column.asc()
+    def stats(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        **filters: Any,
+    ) -> List[Any]:
+        """Grouped statistics of presales matching the search filters."""
+        query = self.build_search_query(**filters)
+        return self.aggregate(
+            query,
+            group_by,
+            self.model.transaction_date_ad,
+            getattr(self.model, value),
+            metrics,
         )
 
-        total = query.count()
-        items = query.offset(skip).limit(limit).all()
 
-        return {
-            "total": total,
-            "items": items,
-            "page": (skip // limit) + 1,
-            "page_size": limit,
-            "total_pages": (total + limit - 1) // limit,
-        }
+class AsyncPropertyPresaleRepository(
+    PropertyPresaleQueries, AsyncBaseRepository[PropertyPresale]
+):
+    """Async presale repository; shares build_search_query with the sync one."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async database session."""
+        super().__init__(PropertyPresale, db)
+
+    async def get_by_id(self, property_id: int) -> Optional[PropertyPresale]:
+        """Get presale by ID."""
+        return await self.get(property_id)
+
+    async def get_by_location(
+        self, city: str, district: Optional[str] = None, skip: int = 0, limit: int = 20
+    ) -> List[PropertyPresale]:
+        """Get presales by location with pagination."""
+        query = self.build_search_query(city=city, district=district)
+        return await self._scalars(query.offset(skip).limit(limit))
+
+    async def search(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+        order_by: str = "transaction_date_ad",
+        order_desc: bool = True,
+        **filters: Any,
+    ) -> Dict[str, Any]:
+        """Search presales with filters (see build_search_query)."""
+        query = self.build_search_query(**filters)
+        order_column = getattr(self.model, order_by, self.model.transaction_date_ad)
+
+        return await self.paginate(
+            query,
+            order_column,
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=fields,
+        )
+
+    def export(
+        self, fields: List[str], batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[List[Any]]:
+        """Stream presales matching the search filters in batches of rows."""
+        # Built before streaming starts, so invalid filters raise right away
+        query = self.build_search_query(**filters)
+        return self.stream(query, self.model.transaction_date_ad, fields, batch_size)
+
+    async def stats(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        **filters: Any,
+    ) -> List[Any]:
+        """Grouped statistics of presales matching the search filters."""
+        query = self.build_search_query(**filters)
+        return await self.aggregate(
+            query,
+            group_by,
+            self.model.transaction_date_ad,
+            getattr(self.model, value),
+            metrics,
+        )
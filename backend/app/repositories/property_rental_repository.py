@@ -1,12 +1,73 @@
 """Property Rental Repository"""
 
-from typing import Optional, List, Dict, Any
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.pagination import CountStrategy
+from app.core.partitions import date_period
+from app.core.stats import StatsGroupBy, StatsMetric
 from app.models.property_rental import PropertyRental
-from app.repositories.base import BaseRepository
+from app.repositories.base import (
+    AsyncBaseRepository,
+    BaseRepository,
+    RepositoryQueries,
+    parse_date_filter,
+)
 
 
-class PropertyRentalRepository(BaseRepository[PropertyRental]):
+class PropertyRentalQueries(RepositoryQueries[PropertyRental]):
+    """Rental search statements shared by the sync and async repositories."""
+
+    def build_search_query(
+        self,
+        city: Optional[str] = None,
+        district: Optional[str] = None,
+        address: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        rent_min: Optional[int] = None,
+        rent_max: Optional[int] = None,
+        building_types: Optional[List[str]] = None,
+        has_elevator: Optional[bool] = None,
+        has_furniture: Optional[bool] = None,
+    ) -> Select:
+        """Build the filtered (unordered, unpaginated) search query."""
+        query = select(self.model)
+
+        if city:
+            query = query.filter(self.model.city == city)
+        if district:
+            query = query.filter(self.model.district == district)
+        query = self.text_filter(query, ["land_section"], address)
+        # Each date bound is repeated on period so MySQL prunes partitions
+        if date_from:
+            start = parse_date_filter(date_from)
+            query = query.filter(
+                self.model.rental_date_ad >= start,
+                self.model.period >= date_period(start),
+            )
+        if date_to:
+            end = parse_date_filter(date_to)
+            query = query.filter(
+                self.model.rental_date_ad <= end,
+                self.model.period <= date_period(end),
+            )
+        if rent_min:
+            query = query.filter(self.model.monthly_rent_ntd >= rent_min)
+        if rent_max:
+            query = query.filter(self.model.monthly_rent_ntd <= rent_max)
+        if building_types:
+            query = query.filter(self.model.building_type.in_(building_types))
+        if has_elevator is not None:
+            query = query.filter(self.model.has_elevator == has_elevator)
+        if has_furniture is not None:
+            query = query.filter(self.model.has_furniture == has_furniture)
+
+        return query
+
+
+class PropertyRentalRepository(PropertyRentalQueries, BaseRepository[PropertyRental]):
     """Repository for property rental data access."""
 
     def __init__(self, db: Session):
@@ -21,17 +82,18 @@ class PropertyRentalRepository(BaseRepository[PropertyRental]):
         self, city: str, district: Optional[str] = None, skip: int = 0, limit: int = 20
     ) -> List[PropertyRental]:
         """Get rentals by location with pagination."""
-        query = self.db.query(self.model).filter(self.model.city == city)
+        query = select(self.model).filter(self.model.city == city)
 
         if district:
             query = query.filter(self.model.district == district)
 
-        return query.offset(skip).limit(limit).all()
+        return self._scalars(query.offset(skip).limit(limit))
 
     def search(
         self,
         city: Optional[str] = None,
         district: Optional[str] = None,
+        address: Optional[str] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         rent_min: Optional[int] = None,
@@ -41,43 +103,131 @@ class PropertyRentalRepository(BaseRepository[PropertyRental]):
         has_furniture: Optional[bool] = None,
         skip: int = 0,
         limit: int = 20,
-        order_by: str = "rental_date",
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+        order_by: str = "rental_date_ad",
         order_desc: bool = True,
     ) -> Dict[str, Any]:
         """Search rentals with filters."""
-        query = self.db.query(self.model)
+        query = self.build_search_query(
+            city=city,
+            district=district,
+            address=address,
+            date_from=date_from,
+            date_to=date_to,
+            rent_min=rent_min,
+            rent_max=rent_max,
+            building_types=building_types,
+            has_elevator=has_elevator,
+            has_furniture=has_furniture,
+        )
 
-        if city:
-            query = query.filter(self.model.city == city)
-        if district:
-            query = query.filter(self.model.district == district)
-        if date_from:
-            query = query.filter(self.model.rental_date >= date_from)
-        if date_to:
-            query = query.filter(self.model.rental_date <= date_to)
-        if rent_min:
-            query = query.filter(self.model.monthly_rent_ntd >= rent_min)
-        if rent_max:
-            query = query.filter(self.model.monthly_rent_ntd <= rent_max)
-        if building_types:
-            query = query.filter(self.model.building_type.in_(building_types))
-        if has_elevator is not None:
-            query = query.filter(self.model.has_elevator == has_elevator)
-        if has_furniture is not None:
-            query = query.filter(self.model.has_furniture == has_furniture)
+        order_column = getattr(self.model, order_by, self.model.rental_date_ad)
+
+        return self.paginate(
+            query,
+            order_column,
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=fields,
+        )
+
+    def export(
+        self, fields: List[str], batch_size: int = 1000, **filters: Any
+    ) -> Iterator[List[Any]]:
+        """Stream rentals matching the search filters in batches of rows."""
+        query = self.build_search_query(**filters)
+        return self.stream(query, self.model.rental_date_ad, fields, batch_size)
+
+    def stats(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        **filters: Any,
+    ) -> List[Any]:
+        """Grouped statistics of rentals matching the search filters."""
+        query = self.build_search_query(**filters)
+        return self.aggregate(
+            query,
+            group_by,
+            self.model.rental_date_ad,
+            getattr(self.model, value),
+            metrics,
+        )
 
-        order_column = getattr(self.model, order_by, self.model.rental_date)
-        query = query.order_by(
-            order_column.desc() if order_desc else order_column.asc()
+
+class AsyncPropertyRentalRepository(
+    PropertyRentalQueries, AsyncBaseRepository[PropertyRental]
+):
+    """Async rental repository; shares build_search_query with the sync one."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async database session."""
+        super().__init__(PropertyRental, db)
+
+    async def get_by_id(self, property_id: int) -> Optional[PropertyRental]:
+        """Get rental by ID."""
+        return await self.get(property_id)
+
+    async def get_by_location(
+        self, city: str, district: Optional[str] = None, skip: int = 0, limit: int = 20
+    ) -> List[PropertyRental]:
+        """Get rentals by location with pagination."""
+        query = self.build_search_query(city=city, district=district)
+        return await self._scalars(query.offset(skip).limit(limit))
+
+    async def search(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+        order_by: str = "rental_date_ad",
+        order_desc: bool = True,
+        **filters: Any,
+    ) -> Dict[str, Any]:
+        """Search rentals with filters (see build_search_query)."""
+        query = self.build_search_query(**filters)
+        order_column = getattr(self.model, order_by, self.model.rental_date_ad)
+
+        return await self.paginate(
+            query,
+            order_column,
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=fields,
         )
 
-        total = query.count()
-        items = query.offset(skip).limit(limit).all()
+    def export(
+        self, fields: List[str], batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[List[Any]]:
+        """Stream rentals matching the search filters in batches of rows."""
+        # Built before streaming starts, so invalid filters raise right away
+        query = self.build_search_query(**filters)
+        return self.stream(query, self.model.rental_date_ad, fields, batch_size)
 
-        return {
-            "total": total,
-            "items": items,
-            "page": (skip // limit) + 1,
-            "page_size": limit,
-            "total_pages": (total + limit - 1) // limit,
-        }
+    async def stats(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        **filters: Any,
+    ) -> List[Any]:
+        """Grouped statistics of rentals matching the search filters."""
+        query = self.build_search_query(**filters)
+        return await self.aggregate(
+            query,
+            group_by,
+            self.model.rental_date_ad,
+            getattr(self.model, value),
+            metrics,
+        )
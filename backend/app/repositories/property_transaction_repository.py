@@ -1,39 +1,30 @@
 """Property Transaction Repository"""
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from sqlalchemy import func, case, Integer
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.pagination import CountStrategy
+from app.core.partitions import date_period
+from app.core.stats import StatsGroupBy, StatsMetric
+from app.core.roc_calendar import current_roc_year
 from app.models.property_transaction import PropertyTransaction
-from app.repositories.base import BaseRepository
+from app.repositories.base import (
+    AsyncBaseRepository,
+    BaseRepository,
+    RepositoryQueries,
+    parse_date_filter,
+)
 
 
-class PropertyTransactionRepository(BaseRepository[PropertyTransaction]):
-    """Repository for property transaction data access."""
-
-    def __init__(self, db: Session):
-        """Initialize repository with database session."""
-        super().__init__(PropertyTransaction, db)
-
-    def get_by_id(self, property_id: int) -> Optional[PropertyTransaction]:
-        """Get transaction by ID."""
-        return self.get(property_id)
+class PropertyTransactionQueries(RepositoryQueries[PropertyTransaction]):
+    """Transaction search statements shared by the sync and async repositories."""
 
-    def get_by_location(
-        self, city: str, district: Optional[str] = None, skip: int = 0, limit: int = 20
-    ) -> List[PropertyTransaction]:
-        """Get transactions by location with pagination."""
-        query = self.db.query(self.model).filter(self.model.city == city)
-
-        if district:
-            query = query.filter(self.model.district == district)
-
-        return query.offset(skip).limit(limit).all()
-
-    def search(
+    def build_search_query(
         self,
         city: Optional[str] = None,
         district: Optional[str] = None,
+        address: Optional[str] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         price_min: Optional[int] = None,
@@ -42,22 +33,28 @@ class PropertyTransactionRepository(BaseRepository[PropertyTransaction]):
         has_elevator: Optional[bool] = None,
         age_min: Optional[int] = None,
         age_max: Optional[int] = None,
-        skip: int = 0,
-        limit: int = 20,
-        order_by: str = "transaction_date",
-        order_desc: bool = True,
-    ) -> Dict[str, Any]:
-        """Search transactions with filters."""
-        query = self.db.query(self.model)
+    ) -> Select:
+        """Build the filtered (unordered, unpaginated) search query."""
+        query = select(self.model)
 
         if city:
             query = query.filter(self.model.city == city)
         if district:
             query = query.filter(self.model.district == district)
+        query = self.text_filter(query, ["land_section"], address)
+        # Each date bound is repeated on period so MySQL prunes partitions
         if date_from:
-            query = query.filter(self.model.transaction_date >= date_from)
+            start = parse_date_filter(date_from)
+            query = query.filter(
+                self.model.transaction_date_ad >= start,
+                self.model.period >= date_period(start),
+            )
         if date_to:
-            query = query.filter(self.model.transaction_date <= date_to)
+            end = parse_date_filter(date_to)
+            query = query.filter(
+                self.model.transaction_date_ad <= end,
+                self.model.period <= date_period(end),
+            )
         if price_min:
             query = query.filter(self.model.total_price_ntd >= price_min)
         if price_max:
@@ -69,49 +66,188 @@ class PropertyTransactionRepository(BaseRepository[PropertyTransaction]):
 
         # Age filtering (convert age to construction year range)
         if age_min is not None or age_max is not None:
-            current_roc_year = datetime.now().year - 1911
-
-            # Extract construction year from construction_complete_date
-            # Handle 2-digit (YYMMDD, ≤6 chars) vs 3-digit (YYYMMDD, >6 chars) formats
-            construction_year_expr = func.cast(
-                case(
-                    (
-                        func.length(self.model.construction_complete_date) <= 6,
-                        func.substring(self.model.construction_complete_date, 1, 2),
-                    ),
-                    else_=func.substring(self.model.construction_complete_date, 1, 3),
-                ),
-                Integer,
-            )
+            current_year = current_roc_year()
 
             if age_min is not None:
                 # age >= age_min means construction_year <= current_year - age_min
-                max_construction_year = current_roc_year - age_min
                 query = query.filter(
-                    self.model.construction_complete_date.isnot(None),
-                    construction_year_expr <= max_construction_year,
+                    self.model.construction_year_roc <= current_year - age_min
                 )
 
             if age_max is not None:
                 # age <= age_max means construction_year >= current_year - age_max
-                min_construction_year = current_roc_year - age_max
                 query = query.filter(
-                    self.model.construction_complete_date.isnot(None),
-                    construction_year_expr >= min_construction_year,
+                    self.model.construction_year_roc >= current_year - age_max
                 )
 
-        order_column = getattr(self.model, order_by, self.model.transaction_date)
-        query = query.order_by(
-            order_column.desc() if order_desc else order_column.asc()
+        return query
+
+
+class PropertyTransactionRepository(
+    PropertyTransactionQueries, BaseRepository[PropertyTransaction]
+):
+    """Repository for property transaction data access."""
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        super().__init__(PropertyTransaction, db)
+
+    def get_by_id(self, property_id: int) -> Optional[PropertyTransaction]:
+        """Get transaction by ID."""
+        return self.get(property_id)
+
+    def get_by_location(
+        self, city: str, district: Optional[str] = None, skip: int = 0, limit: int = 20
+    ) -> List[PropertyTransaction]:
+        """Get transactions by location with pagination."""
+        query = select(self.model).filter(self.model.city == city)
+
+        if district:
+            query = query.filter(self.model.district == district)
+
+        return self._scalars(query.offset(skip).limit(limit))
+
+    def search(
+        self,
+        city: Optional[str] = None,
+        district: Optional[str] = None,
+        address: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        price_min: Optional[int] = None,
+        price_max: Optional[int] = None,
+        building_types: Optional[List[str]] = None,
+        has_elevator: Optional[bool] = None,
+        age_min: Optional[int] = None,
+        age_max: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+        order_by: str = "transaction_date_ad",
+        order_desc: bool = True,
+    ) -> Dict[str, Any]:
+        """Search transactions with filters."""
+        query = self.build_search_query(
+            city=city,
+            district=district,
+            address=address,
+            date_from=date_from,
+            date_to=date_to,
+            price_min=price_min,
+            price_max=price_max,
+            building_types=building_types,
+            has_elevator=has_elevator,
+            age_min=age_min,
+            age_max=age_max,
         )
 
-        total = query.count()
-        items = query.offset(skip).limit(limit).all()
+        order_column = getattr(self.model, order_by, self.model.transaction_date_ad)
+
+        return self.paginate(
+            query,
+            order_column,
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=fields,
+        )
 
-        return {
-            "total": total,
-            "items": items,
-            "page": (skip // limit) + 1,
-            "page_size": limit,
-            "total_pages": (total + limit - 1) // limit,
-        }
+    def export(
+        self, fields: List[str], batch_size: int = 1000, **filters: Any
+    ) -> Iterator[List[Any]]:
+        """Stream transactions matching the search filters in batches of rows."""
+        query = self.build_search_query(**filters)
+        return self.stream(query, self.model.transaction_date_ad, fields, batch_size)
+
+    def stats(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        **filters: Any,
+    ) -> List[Any]:
+        """Grouped statistics of transactions matching the search filters."""
+        query = self.build_search_query(**filters)
+        return self.aggregate(
+            query,
+            group_by,
+            self.model.transaction_date_ad,
+            getattr(self.model, value),
+            metrics,
+        )
+
+
+class AsyncPropertyTransactionRepository(
+    PropertyTransactionQueries, AsyncBaseRepository[PropertyTransaction]
+):
+    """Async transaction repository; shares build_search_query with the sync one."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async database session."""
+        super().__init__(PropertyTransaction, db)
+
+    async def get_by_id(self, property_id: int) -> Optional[PropertyTransaction]:
+        """Get transaction by ID."""
+        return await self.get(property_id)
+
+    async def get_by_location(
+        self, city: str, district: Optional[str] = None, skip: int = 0, limit: int = 20
+    ) -> List[PropertyTransaction]:
+        """Get transactions by location with pagination."""
+        query = self.build_search_query(city=city, district=district)
+        return await self._scalars(query.offset(skip).limit(limit))
+
+    async def search(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
+        order_by: str = "transaction_date_ad",
+        order_desc: bool = True,
+        **filters: Any,
+    ) -> Dict[str, Any]:
+        """Search transactions with filters (see build_search_query)."""
+        query = self.build_search_query(**filters)
+        order_column = getattr(self.model, order_by, self.model.transaction_date_ad)
+
+        return await self.paginate(
+            query,
+            order_column,
+            order_desc=order_desc,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=fields,
+        )
+
+    def export(
+        self, fields: List[str], batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[List[Any]]:
+        """Stream transactions matching the search filters in batches of rows."""
+        # Built before streaming starts, so invalid filters raise right away
+        query = self.build_search_query(**filters)
+        return self.stream(query, self.model.transaction_date_ad, fields, batch_size)
+
+    async def stats(
+        self,
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+        **filters: Any,
+    ) -> List[Any]:
+        """Grouped statistics of transactions matching the search filters."""
+        query = self.build_search_query(**filters)
+        return await self.aggregate(
+            query,
+            group_by,
+            self.model.transaction_date_ad,
+            getattr(self.model, value),
+            metrics,
+        )
@@ -12,6 +12,8 @@ from app.schemas.property_rental import (
     PropertyRentalResponse,
     PropertyRentalSearchResponse,
 )
+from app.schemas.stats import StatsResponse
+from app.schemas.suggest import SuggestResponse
 
 __all__ = [
     "PropertyTransactionResponse",
@@ -20,4 +22,6 @@ __all__ = [
     "PropertyPresaleSearchResponse",
     "PropertyRentalResponse",
     "PropertyRentalSearchResponse",
+    "StatsResponse",
+    "SuggestResponse",
 ]
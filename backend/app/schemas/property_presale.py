@@ -1,8 +1,9 @@
 """Property presale schemas for API request/response models"""
 
 from typing import Optional, List
-from decimal import Decimal
 from pydantic import BaseModel, ConfigDict
+from app.core.pagination import CountStrategy
+from app.core.responses import JSONDecimal
 
 
 class PropertyPresaleResponse(BaseModel):
@@ -27,7 +28,7 @@ class PropertyPresaleResponse(BaseModel):
     building_compartments: Optional[bool] = None
     has_management: Optional[bool] = None
     total_floor_number: Optional[int] = None
-    unit_price_ntd: Optional[Decimal] = None
+    unit_price_ntd: Optional[JSONDecimal] = None
     parking_type: Optional[str] = None
     remarks: Optional[str] = None
     serial_number: Optional[str] = None
@@ -35,12 +36,12 @@ class PropertyPresaleResponse(BaseModel):
     # Transaction shared fields
     transaction_date: str
     transaction_pen_number: Optional[str] = None
-    land_area_sqm: Optional[Decimal] = None
-    building_area_sqm: Optional[Decimal] = None
+    land_area_sqm: Optional[JSONDecimal] = None
+    building_area_sqm: Optional[JSONDecimal] = None
     building_floor_number: Optional[str] = None
-    total_price_ntd: Decimal
-    parking_area_sqm: Optional[Decimal] = None
-    parking_price_ntd: Optional[Decimal] = None
+    total_price_ntd: JSONDecimal
+    parking_area_sqm: Optional[JSONDecimal] = None
+    parking_price_ntd: Optional[JSONDecimal] = None
 
     # Presale-only fields
     city: str
@@ -54,8 +55,12 @@ class PropertyPresaleResponse(BaseModel):
 class PropertyPresaleSearchResponse(BaseModel):
     """Paginated search results response."""
 
-    total: int
+    # total/total_pages are produced by count_strategy (None for "none")
+    total: Optional[int] = None
     items: List[PropertyPresaleResponse]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_next: bool = False
+    count_strategy: CountStrategy = CountStrategy.EXACT
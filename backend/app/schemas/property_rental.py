@@ -1,8 +1,9 @@
 """Property rental schemas for API request/response models"""
 
 from typing import Optional, List
-from decimal import Decimal
 from pydantic import BaseModel, ConfigDict
+from app.core.pagination import CountStrategy
+from app.core.responses import JSONDecimal
 
 
 class PropertyRentalResponse(BaseModel):
@@ -27,7 +28,7 @@ class PropertyRentalResponse(BaseModel):
     building_compartments: Optional[bool] = None
     has_management: Optional[bool] = None
     total_floor_number: Optional[int] = None
-    unit_price_ntd: Optional[Decimal] = None
+    unit_price_ntd: Optional[JSONDecimal] = None
     parking_type: Optional[str] = None
     remarks: Optional[str] = None
     serial_number: Optional[str] = None
@@ -36,8 +37,8 @@ class PropertyRentalResponse(BaseModel):
     city: str
     rental_date: str
     rental_pen_number: Optional[str] = None
-    land_area_sqm: Optional[Decimal] = None
-    building_area_sqm: Optional[Decimal] = None
+    land_area_sqm: Optional[JSONDecimal] = None
+    building_area_sqm: Optional[JSONDecimal] = None
     building_floor_number: Optional[str] = None
     has_furniture: Optional[bool] = None
     rental_type: Optional[str] = None
@@ -46,9 +47,9 @@ class PropertyRentalResponse(BaseModel):
     has_elevator: Optional[bool] = None
     equipment: Optional[str] = None
     rental_service: Optional[str] = None
-    monthly_rent_ntd: Decimal
-    parking_area_sqm: Optional[Decimal] = None
-    parking_rent_ntd: Optional[Decimal] = None
+    monthly_rent_ntd: JSONDecimal
+    parking_area_sqm: Optional[JSONDecimal] = None
+    parking_rent_ntd: Optional[JSONDecimal] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -56,8 +57,12 @@ class PropertyRentalResponse(BaseModel):
 class PropertyRentalSearchResponse(BaseModel):
     """Paginated search results response."""
 
-    total: int
+    # total/total_pages are produced by count_strategy (None for "none")
+    total: Optional[int] = None
     items: List[PropertyRentalResponse]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_next: bool = False
+    count_strategy: CountStrategy = CountStrategy.EXACT
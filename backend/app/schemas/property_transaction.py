@@ -1,9 +1,9 @@
 """Property transaction schemas for API request/response models"""
 
 from typing import Optional, List
-from decimal import Decimal
-from datetime import datetime
-from pydantic import BaseModel, ConfigDict, computed_field
+from pydantic import BaseModel, ConfigDict
+from app.core.pagination import CountStrategy
+from app.core.responses import JSONDecimal
 
 
 class PropertyTransactionResponse(BaseModel):
@@ -28,7 +28,7 @@ class PropertyTransactionResponse(BaseModel):
     building_compartments: Optional[bool] = None
     has_management: Optional[bool] = None
     total_floor_number: Optional[int] = None
-    unit_price_ntd: Optional[Decimal] = None
+    unit_price_ntd: Optional[JSONDecimal] = None
     parking_type: Optional[str] = None
     remarks: Optional[str] = None
     serial_number: Optional[str] = None
@@ -36,52 +36,35 @@ class PropertyTransactionResponse(BaseModel):
     # Transaction shared fields
     transaction_date: str
     transaction_pen_number: Optional[str] = None
-    land_area_sqm: Optional[Decimal] = None
-    building_area_sqm: Optional[Decimal] = None
+    land_area_sqm: Optional[JSONDecimal] = None
+    building_area_sqm: Optional[JSONDecimal] = None
     building_floor_number: Optional[str] = None
-    total_price_ntd: Decimal
-    parking_area_sqm: Optional[Decimal] = None
-    parking_price_ntd: Optional[Decimal] = None
+    total_price_ntd: JSONDecimal
+    parking_area_sqm: Optional[JSONDecimal] = None
+    parking_price_ntd: Optional[JSONDecimal] = None
 
     # Transaction-only fields
     city: str
-    main_building_area: Optional[Decimal] = None
-    auxiliary_building_area: Optional[Decimal] = None
-    balcony_area: Optional[Decimal] = None
+    main_building_area: Optional[JSONDecimal] = None
+    auxiliary_building_area: Optional[JSONDecimal] = None
+    balcony_area: Optional[JSONDecimal] = None
     has_elevator: Optional[bool] = None
 
-    model_config = ConfigDict(from_attributes=True)
-
-    @computed_field
-    @property
-    def building_age(self) -> Optional[int]:
-        """Calculate building age in years (current year - construction year)."""
-        if not self.construction_complete_date:
-            return None
-
-        try:
-            # Get current ROC year (Taiwan calendar)
-            current_roc_year = datetime.now().year - 1911
+    # Derived from construction_year_roc (PropertyTransaction.building_age)
+    building_age: Optional[int] = None
 
-            # Parse construction year from ROC date format
-            # Format: "YYMMDD" (6 chars, 2-digit year) or "YYYMMDD" (7 chars, 3-digit year)
-            date_str = self.construction_complete_date
-            if len(date_str) <= 6:
-                construction_year = int(date_str[:2])  # "751024" -> 75
-            else:
-                construction_year = int(date_str[:3])  # "1051215" -> 105
-
-            age = current_roc_year - construction_year
-            return age if age >= 0 else None
-        except (ValueError, TypeError):
-            return None
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PropertyTransactionSearchResponse(BaseModel):
     """Paginated search results response."""
 
-    total: int
+    # total/total_pages are produced by count_strategy (None for "none")
+    total: Optional[int] = None
     items: List[PropertyTransactionResponse]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_next: bool = False
+    count_strategy: CountStrategy = CountStrategy.EXACT
@@ -0,0 +1,19 @@
+"""Statistics schemas for API response models"""
+
+from typing import Any, List
+from pydantic import BaseModel
+from app.core.stats import StatsGroupBy, StatsMetric
+
+
+class StatsResponse(BaseModel):
+    """Grouped statistics in column-oriented form."""
+
+    group_by: List[StatsGroupBy]
+    value: str
+    metrics: List[StatsMetric]
+    # group_by names followed by metric names
+    columns: List[str]
+    # One row per group, values in column order (metrics as JSON numbers)
+    rows: List[List[Any]]
+    # Percentiles estimated from rollup histogram buckets instead of exact
+    approximate: bool = False
@@ -0,0 +1,14 @@
+"""Typeahead suggestion schemas for API response models"""
+
+from typing import List
+from pydantic import BaseModel
+from app.core.suggest import SuggestKind
+
+
+class SuggestResponse(BaseModel):
+    """Values of one kind starting with a prefix."""
+
+    kind: SuggestKind
+    prefix: str
+    # Sorted, at most the requested limit
+    items: List[str]
@@ -1,47 +1,185 @@
 """Property rental business logic service"""
 
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
-from app.repositories.property_rental_repository import PropertyRentalRepository
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.data_version import async_rollups_current
+from app.core.fieldsets import items_adapter, resolve_fields, select_schemas
+from app.core.pagination import CountStrategy
+from app.core.rollups import ROLLUP_SOURCES, rollup_rows
+from app.core.search_cache import search_cache
+from app.core.stats import StatsGroupBy, StatsMetric, canonical, stats_rows
+from app.repositories.property_rental_repository import (
+    AsyncPropertyRentalRepository,
+)
 from app.schemas.property_rental import (
     PropertyRentalResponse,
     PropertyRentalSearchResponse,
 )
+from app.schemas.stats import StatsResponse
 
 
 class PropertyRentalService:
     """Service layer for property rental business logic."""
 
-    def __init__(self, db: Session):
-        """Initialize service with database session."""
-        self.repository = PropertyRentalRepository(db)
+    def __init__(self, db: AsyncSession):
+        """Initialize service with async database session."""
+        self.repository = AsyncPropertyRentalRepository(db)
 
-    def get_by_id(self, property_id: int) -> Optional[PropertyRentalResponse]:
+    async def get_by_id(self, property_id: int) -> Optional[PropertyRentalResponse]:
         """Get a single rental by ID."""
-        property_orm = self.repository.get(property_id)
+        property_orm = await self.repository.get(property_id)
 
         if property_orm is None:
             return None
 
         return PropertyRentalResponse.model_validate(property_orm)
 
-    def search(
-        self, filters: Optional[Dict[str, Any]] = None, skip: int = 0, limit: int = 20
+    async def search(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        fields: Optional[List[str]] = None,
     ) -> PropertyRentalSearchResponse:
-        """Search rentals with filters and pagination."""
+        """Search rentals with filters and pagination (cached per data version)."""
         if filters is None:
             filters = {}
+        if fields:
+            fields = resolve_fields(PropertyRentalResponse, fields)
+        _, response_schema = select_schemas(
+            PropertyRentalResponse, PropertyRentalSearchResponse, fields
+        )
 
-        result = self.repository.search(**filters, skip=skip, limit=limit)
+        params = {
+            **filters,
+            "skip": skip,
+            "limit": limit,
+            "cursor": cursor,
+            "count_strategy": count_strategy,
+            "fields": fields,
+        }
+        return await search_cache.fetch(
+            self.repository.db,
+            self.repository.model.__tablename__,
+            params,
+            response_schema,
+            lambda: self._search(filters, skip, limit, cursor, count_strategy, fields),
+        )
 
-        items = [
-            PropertyRentalResponse.model_validate(item) for item in result["items"]
-        ]
+    async def _search(
+        self,
+        filters: Dict[str, Any],
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        count_strategy: CountStrategy,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> PropertyRentalSearchResponse:
+        """Run the search against the database."""
+        item_schema, response_schema = select_schemas(
+            PropertyRentalResponse, PropertyRentalSearchResponse, fields
+        )
+        result = await self.repository.search(
+            **filters,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count_strategy,
+            fields=list(fields or PropertyRentalResponse.model_fields),
+        )
+
+        # Column rows skip ORM hydration and are validated as one list
+        # instead of one model_validate() per row
+        items = items_adapter(item_schema).validate_python(
+            [row._asdict() for row in result["items"]]
+        )
 
-        return PropertyRentalSearchResponse(
+        return response_schema(
             total=result["total"],
             items=items,
             page=result["page"],
             page_size=result["page_size"],
             total_pages=result["total_pages"],
+            next_cursor=result["next_cursor"],
+            has_next=result["has_next"],
+            count_strategy=result["count_strategy"],
+        )
+
+    def export(
+        self, filters: Dict[str, Any], fields: Optional[List[str]] = None
+    ) -> Tuple[Tuple[str, ...], AsyncIterator[List[Any]]]:
+        """Columns and streamed row batches of the matching rentals."""
+        columns = resolve_fields(
+            PropertyRentalResponse, fields or list(PropertyRentalResponse.model_fields)
+        )
+        batches = self.repository.export(
+            list(columns), settings.EXPORT_BATCH_SIZE, **filters
+        )
+        return columns, batches
+
+    async def stats(
+        self,
+        filters: Dict[str, Any],
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+    ) -> StatsResponse:
+        """Grouped statistics of the matching rentals (cached per data version)."""
+        # Same request in any order or with repeats -> same columns and cache key
+        group_by = canonical(group_by, StatsGroupBy)
+        metrics = canonical(metrics, StatsMetric)
+        if not metrics:
+            raise ValueError("At least one metric is required")
+
+        params = {
+            **filters,
+            "view": "stats",
+            "group_by": group_by,
+            "value": value,
+            "metrics": metrics,
+        }
+        return await search_cache.fetch(
+            self.repository.db,
+            self.repository.model.__tablename__,
+            params,
+            StatsResponse,
+            lambda: self._stats(filters, group_by, value, metrics),
+        )
+
+    async def _stats(
+        self,
+        filters: Dict[str, Any],
+        group_by: List[StatsGroupBy],
+        value: str,
+        metrics: List[StatsMetric],
+    ) -> StatsResponse:
+        """Aggregate from the rollups when they are current, else the table."""
+        table_name = self.repository.model.__tablename__
+        rollup_filters = self.repository.rollup_filters(filters)
+        approximate = False
+
+        if (
+            rollup_filters is not None
+            and value in ROLLUP_SOURCES[table_name][1]
+            and await async_rollups_current(self.repository.db, table_name)
+        ):
+            rows = await self.repository.rollup_aggregate(
+                group_by, value, metrics, rollup_filters
+            )
+            rows = rollup_rows(rows, group_by, metrics)
+            approximate = any(metric.percentile for metric in metrics)
+        else:
+            rows = await self.repository.stats(group_by, value, metrics, **filters)
+            rows = [row._mapping for row in rows]
+
+        return StatsResponse(
+            group_by=group_by,
+            value=value,
+            metrics=metrics,
+            columns=[g.value for g in group_by] + [m.value for m in metrics],
+            rows=stats_rows(rows),
+            approximate=approximate,
         )
@@ -0,0 +1,119 @@
+"""Benchmark response encoding of the search endpoints, before and after.
+
+Fetches one page from each search service against the configured database,
+then encodes the same result objects repeatedly with:
+
+- before: FastAPI's response_model pass (re-validate + convert to plain
+  Python) followed by Starlette's JSONResponse (json.dumps)
+- after:  model_response(), i.e. FastJSONResponse rendering the model with
+  its own serializer
+
+and prints encoded responses per second for each.
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+import sys
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.api.v1.endpoints import (
+    property_presales,
+    property_rentals,
+    property_transactions,
+)
+from app.core.config import settings
+from app.core.pagination import CountStrategy
+from app.core.responses import model_response
+from app.services.property_presale_service import PropertyPresaleService
+from app.services.property_rental_service import PropertyRentalService
+from app.services.property_transaction_service import PropertyTransactionService
+
+# endpoint router -> service producing its search result
+SERVICES = [
+    (property_transactions.router, PropertyTransactionService),
+    (property_rentals.router, PropertyRentalService),
+    (property_presales.router, PropertyPresaleService),
+]
+
+
+async def fetch_results(database_url: str, limit: int) -> list:
+    """One search result per endpoint, paired with the route's response field."""
+    engine = create_async_engine(database_url)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+
+    pairs = []
+    async with Session() as db:
+        for router, service_class in SERVICES:
+            result = await service_class(db).search(
+                limit=limit, count_strategy=CountStrategy.NONE
+            )
+            route = next(r for r in router.routes if r.path == "/")
+            pairs.append((route.response_field, result))
+
+    await engine.dispose()
+    return pairs
+
+
+async def encode_before(field, result) -> bytes:
+    content = await serialize_response(
+        field=field, response_content=result, is_coroutine=True
+    )
+    return JSONResponse(content).body
+
+
+async def encode_after(field, result) -> bytes:
+    return model_response(result, Response()).body
+
+
+async def throughput(encode, pairs: list, iterations: int) -> float:
+    """Encoded responses per second."""
+    started = time.perf_counter()
+    for i in range(iterations):
+        await encode(*pairs[i % len(pairs)])
+    return iterations / (time.perf_counter() - started)
+
+
+async def run(database_url: str, limit: int, iterations: int) -> None:
+    """Fetch the pages, time both encoders and print a report."""
+    pairs = await fetch_results(database_url, limit)
+
+    # Both encoders must produce the same JSON document
+    for pair in pairs:
+        assert await encode_before(*pair) == await encode_after(*pair)
+
+    results = {
+        "before": await throughput(encode_before, pairs, iterations),
+        "after": await throughput(encode_after, pairs, iterations),
+    }
+
+    print(
+        f"{limit}-row pages, {iterations} responses each, "
+        f"decimals as {settings.JSON_DECIMAL_MODE}"
+    )
+    for name, rate in results.items():
+        print(f"  {name:<7} {rate:>9.1f} responses/s")
+    print(f"  speedup {results['after'] / results['before']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--database-url",
+        default=settings.SQLALCHEMY_ASYNC_DATABASE_URI,
+        help="Async database URL (defaults to the configured MySQL database)",
+    )
+    parser.add_argument("--limit", type=int, default=100, help="Rows per page")
+    parser.add_argument(
+        "--iterations", type=int, default=1000, help="Responses to encode per path"
+    )
+
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.limit, args.iterations))
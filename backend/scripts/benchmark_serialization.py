@@ -0,0 +1,151 @@
+"""Benchmark ORM vs row-based serialization of a transaction search page.
+
+Seeds an in-memory SQLite database, then measures the CPU time of one
+search request (query, build items, dump JSON) for a full page with:
+
+- orm:  select(PropertyTransaction) entities + model_validate per row
+- rows: column select (building_age in SQL) + one TypeAdapter validation
+"""
+
+import argparse
+import random
+import time
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+from app.core.fieldsets import items_adapter
+from app.core.pagination import CountStrategy
+from app.models.property_transaction import PropertyTransaction
+from app.repositories.property_transaction_repository import (
+    PropertyTransactionRepository,
+)
+from app.schemas.property_transaction import (
+    PropertyTransactionResponse,
+    PropertyTransactionSearchResponse,
+)
+
+
+def seed(db, rows: int, seed: int = 42) -> None:
+    """Insert synthetic transactions with every response field populated."""
+    rng = random.Random(seed)
+    for i in range(rows):
+        year = rng.randint(70, 112)
+        db.add(
+            PropertyTransaction(
+                city="臺北市",
+                district=rng.choice(["大安區", "信義區", "中山區"]),
+                transaction_target="房地(土地+建物)",
+                land_section=f"臺北市大安區仁愛路{i}號",
+                urban_land_use_type="住",
+                building_type="住宅大樓(11層含以上有電梯)",
+                main_use="住家用",
+                main_building_materials="鋼筋混凝土造",
+                construction_complete_date=f"{year}0601",
+                building_rooms=rng.randint(1, 4),
+                building_halls=rng.randint(0, 2),
+                building_bathrooms=rng.randint(1, 3),
+                building_compartments=True,
+                has_management=rng.random() < 0.8,
+                total_floor_number=rng.randint(5, 30),
+                unit_price_ntd=Decimal(rng.randint(300_000, 1_500_000)),
+                parking_type="坡道平面",
+                serial_number=f"RPBENCH{i:08d}",
+                transaction_date=f"1120{rng.randint(1, 9)}15",
+                transaction_pen_number="土地1建物1車位1",
+                land_area_sqm=Decimal("12.34"),
+                building_area_sqm=Decimal(str(round(rng.uniform(20, 200), 2))),
+                building_floor_number="五層",
+                total_price_ntd=Decimal(rng.randint(5, 500) * 100_000),
+                parking_area_sqm=Decimal("10.50"),
+                parking_price_ntd=Decimal(1_500_000),
+                main_building_area=Decimal("55.10"),
+                auxiliary_building_area=Decimal("3.20"),
+                balcony_area=Decimal("6.70"),
+                has_elevator=True,
+                construction_year_roc=year,
+                transaction_date_ad=date(2023, rng.randint(1, 9), 15),
+            )
+        )
+    db.commit()
+
+
+def orm_page(db, limit: int) -> str:
+    """Previous path: hydrate entities and validate each one."""
+    result = PropertyTransactionRepository(db).search(
+        limit=limit, count_strategy=CountStrategy.NONE
+    )
+    items = [PropertyTransactionResponse.model_validate(r) for r in result["items"]]
+    return PropertyTransactionSearchResponse(
+        **{**result, "items": items}
+    ).model_dump_json()
+
+
+def rows_page(db, limit: int) -> str:
+    """Current path: column rows validated as a single list."""
+    result = PropertyTransactionRepository(db).search(
+        limit=limit,
+        count_strategy=CountStrategy.NONE,
+        fields=list(PropertyTransactionResponse.model_fields),
+    )
+    items = items_adapter(PropertyTransactionResponse).validate_python(
+        [row._asdict() for row in result["items"]]
+    )
+    return PropertyTransactionSearchResponse(
+        **{**result, "items": items}
+    ).model_dump_json()
+
+
+def run(limit: int, iterations: int, repeat: int) -> None:
+    """Seed the database, time both paths and print a report."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as db:
+        seed(db, limit + 1)
+
+    # Both paths must produce the same document
+    with Session() as db:
+        assert orm_page(db, limit) == rows_page(db, limit)
+
+    def per_request(page) -> float:
+        started = time.process_time()
+        for _ in range(iterations):
+            # Fresh session per request, as in the API
+            with Session() as db:
+                page(db, limit)
+        return (time.process_time() - started) / iterations * 1000
+
+    # Best of several interleaved rounds, to keep machine noise out
+    timings = {"orm": float("inf"), "rows": float("inf")}
+    for _ in range(repeat):
+        timings["orm"] = min(timings["orm"], per_request(orm_page))
+        timings["rows"] = min(timings["rows"], per_request(rows_page))
+
+    print(f"{limit}-row page, best of {repeat} x {iterations} requests (CPU ms)")
+    for name, ms in timings.items():
+        print(f"  {name:<5} {ms:>7.2f} ms")
+    print(f"  speedup {timings['orm'] / timings['rows']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=100, help="Rows per page")
+    parser.add_argument(
+        "--iterations", type=int, default=100, help="Requests per timing round"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds")
+
+    args = parser.parse_args()
+    run(args.limit, args.iterations, args.repeat)
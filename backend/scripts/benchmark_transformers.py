@@ -0,0 +1,129 @@
+"""Benchmark per-cell vs column-level ETL transformers on a synthetic file.
+
+Generates a raw-style CSV with the column kinds found in the government
+files (free text, numbers, 有/無 flags, ROC dates, districts), then times
+the old `.apply()` transformers against the vectorized *_column versions.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.etl.district_mapping import DistrictResolver, get_city_from_district
+from app.etl.transformers import (
+    clean_string,
+    clean_string_column,
+    clean_yes_no,
+    clean_yes_no_column,
+    parse_roc_date,
+    parse_roc_date_column,
+    to_ad_date,
+    to_ad_date_column,
+    to_numeric,
+    to_numeric_column,
+    to_roc_year,
+    to_roc_year_column,
+)
+
+# column -> (per-cell transformer, column transformer)
+TRANSFORMS = {
+    "土地位置建物門牌": (clean_string, clean_string_column),
+    "主要用途": (clean_string, clean_string_column),
+    "總價元": (to_numeric, to_numeric_column),
+    "建物移轉總面積平方公尺": (to_numeric, to_numeric_column),
+    "電梯": (clean_yes_no, clean_yes_no_column),
+    "有無管理組織": (clean_yes_no, clean_yes_no_column),
+    "交易年月日": (parse_roc_date, parse_roc_date_column),
+    "建築完成年月": (to_roc_year, to_roc_year_column),
+    "交易年月日(西元)": (to_ad_date, to_ad_date_column),
+    "鄉鎮市區": (get_city_from_district, lambda s: DistrictResolver().resolve(s)),
+}
+
+
+def generate_file(path: str, rows: int, seed: int = 42) -> None:
+    """Write a synthetic raw CSV with roughly realistic blanks."""
+    rng = np.random.default_rng(seed)
+
+    def blank(values: np.ndarray, ratio: float) -> np.ndarray:
+        values = values.astype(object)
+        values[rng.random(rows) < ratio] = ""
+        return values
+
+    roc_dates = (
+        rng.integers(100, 114, rows) * 10000
+        + rng.integers(1, 13, rows) * 100
+        + rng.integers(1, 29, rows)
+    ).astype(str)
+    df = pd.DataFrame(
+        {
+            "土地位置建物門牌": blank(
+                np.char.add(" 臺北市大安區仁愛路", rng.integers(1, 999, rows).astype(str)),
+                0.05,
+            ),
+            "鄉鎮市區": rng.choice(["大安區", "信義區", "板橋區", "東區"], rows),
+            "主要用途": blank(rng.choice(["住家用", "商業用", " 住商用 "], rows), 0.2),
+            "總價元": blank(rng.integers(5, 500, rows) * 100000, 0.02),
+            "建物移轉總面積平方公尺": blank(rng.uniform(10, 300, rows).round(2), 0.1),
+            "電梯": blank(rng.choice(["有", "無"], rows), 0.1),
+            "有無管理組織": blank(rng.choice(["有", "無"], rows), 0.1),
+            "交易年月日": roc_dates,
+            "建築完成年月": blank(
+                (rng.integers(60, 113, rows) * 10000 + 601).astype(str), 0.1
+            ),
+        }
+    )
+    df["交易年月日(西元)"] = df["交易年月日"]
+    df.to_csv(path, index=False)
+
+
+def run(rows: int, keep: bool) -> None:
+    """Generate the file, time both transformer sets and print a report."""
+    path = Path(tempfile.gettempdir()) / f"synthetic_lvr_land_{rows}.csv"
+
+    print(f"Generating {rows:,} rows → {path}")
+    generate_file(str(path), rows)
+    df = pd.read_csv(path, dtype=str)
+
+    print(f"\n{'column':<24} {'per-cell':>10} {'column':>10} {'speedup':>8}")
+    total_old = total_new = 0.0
+    for column, (cell_fn, column_fn) in TRANSFORMS.items():
+        started = time.perf_counter()
+        df[column].apply(cell_fn)
+        old = time.perf_counter() - started
+
+        started = time.perf_counter()
+        column_fn(df[column])
+        new = time.perf_counter() - started
+
+        total_old += old
+        total_new += new
+        print(f"{column:<24} {old:>9.2f}s {new:>9.2f}s {old / new:>7.1f}x")
+
+    print(
+        f"\nTotal: {total_old:.2f}s → {total_new:.2f}s "
+        f"({rows / total_old:,.0f} → {rows / total_new:,.0f} rows/s, "
+        f"{total_old / total_new:.1f}x)"
+    )
+
+    if not keep:
+        path.unlink()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Synthetic rows to generate"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the generated CSV file"
+    )
+
+    args = parser.parse_args()
+    run(args.rows, args.keep)
@@ -5,53 +5,66 @@ import argparse
 import glob
 from pathlib import Path
 import sys
+from typing import Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.etl.transformers import clean_yes_no, parse_roc_date, to_numeric, clean_string
-from app.etl.district_mapping import get_city_from_district
-
-
-def clean_presale_file(input_path: str, output_path: str) -> int:
-    """Clean single presale CSV file."""
-    df = pd.read_csv(input_path, skiprows=[1])
-
-    df["city"] = df["鄉鎮市區"].apply(get_city_from_district)
+from app.etl.transformers import (
+    clean_yes_no_column,
+    parse_roc_date_column,
+    to_numeric_column,
+    clean_string_column,
+    to_roc_year_column,
+    to_ad_date_column,
+)
+from app.etl.district_mapping import DistrictResolver
+from app.etl.streaming import DEFAULT_CHUNKSIZE, clean_csv
+
+
+def clean_presale_chunk(
+    df: pd.DataFrame, districts: Optional[DistrictResolver] = None
+) -> pd.DataFrame:
+    """Clean one chunk of a raw presale CSV file."""
+    if districts is None:
+        districts = DistrictResolver()
+    df["city"] = districts.resolve(df["鄉鎮市區"])
 
     cleaned_df = pd.DataFrame(
         {
             "city": df["city"],
             "district": df["鄉鎮市區"],
-            "transaction_target": df["交易標的"].apply(clean_string),
-            "land_section": df["土地位置建物門牌"].apply(clean_string),
-            "urban_land_use_type": df["都市土地使用分區"].apply(clean_string),
-            "non_urban_land_use_type": df["非都市土地使用分區"].apply(clean_string),
-            "non_urban_land_use_category": df["非都市土地使用編定"].apply(clean_string),
-            "building_type": df["建物型態"].apply(clean_string),
-            "main_use": df["主要用途"].apply(clean_string),
-            "main_building_materials": df["主要建材"].apply(clean_string),
-            "construction_complete_date": df["建築完成年月"].apply(clean_string),
-            "building_rooms": df["建物現況格局-房"].apply(to_numeric),
-            "building_halls": df["建物現況格局-廳"].apply(to_numeric),
-            "building_bathrooms": df["建物現況格局-衛"].apply(to_numeric),
-            "building_compartments": df["建物現況格局-隔間"].apply(clean_yes_no),
-            "has_management": df["有無管理組織"].apply(clean_yes_no),
-            "total_floor_number": df["總樓層數"].apply(to_numeric),
-            "unit_price_ntd": df["單價元平方公尺"].apply(to_numeric),
-            "parking_type": df["車位類別"].apply(clean_string),
-            "remarks": df["備註"].apply(clean_string),
+            "transaction_target": clean_string_column(df["交易標的"]),
+            "land_section": clean_string_column(df["土地位置建物門牌"]),
+            "urban_land_use_type": clean_string_column(df["都市土地使用分區"]),
+            "non_urban_land_use_type": clean_string_column(df["非都市土地使用分區"]),
+            "non_urban_land_use_category": clean_string_column(df["非都市土地使用編定"]),
+            "building_type": clean_string_column(df["建物型態"]),
+            "main_use": clean_string_column(df["主要用途"]),
+            "main_building_materials": clean_string_column(df["主要建材"]),
+            "construction_complete_date": clean_string_column(df["建築完成年月"]),
+            "building_rooms": to_numeric_column(df["建物現況格局-房"]),
+            "building_halls": to_numeric_column(df["建物現況格局-廳"]),
+            "building_bathrooms": to_numeric_column(df["建物現況格局-衛"]),
+            "building_compartments": clean_yes_no_column(df["建物現況格局-隔間"]),
+            "has_management": clean_yes_no_column(df["有無管理組織"]),
+            "total_floor_number": to_numeric_column(df["總樓層數"]),
+            "unit_price_ntd": to_numeric_column(df["單價元平方公尺"]),
+            "parking_type": clean_string_column(df["車位類別"]),
+            "remarks": clean_string_column(df["備註"]),
             "serial_number": df["編號"],
-            "transaction_date": df["交易年月日"].apply(parse_roc_date),
-            "transaction_pen_number": df["交易筆棟數"].apply(clean_string),
-            "land_area_sqm": df["土地移轉總面積平方公尺"].apply(to_numeric),
-            "building_area_sqm": df["建物移轉總面積平方公尺"].apply(to_numeric),
-            "building_floor_number": df["移轉層次"].apply(clean_string),
-            "total_price_ntd": df["總價元"].apply(to_numeric),
-            "parking_area_sqm": df["車位移轉總面積平方公尺"].apply(to_numeric),
-            "parking_price_ntd": df["車位總價元"].apply(to_numeric),
-            "project_name": df["建案名稱"].apply(clean_string),
-            "building_number": df["棟及號"].apply(clean_string),
-            "termination_status": df["解約情形"].apply(clean_string),
+            "transaction_date": parse_roc_date_column(df["交易年月日"]),
+            "transaction_pen_number": clean_string_column(df["交易筆棟數"]),
+            "land_area_sqm": to_numeric_column(df["土地移轉總面積平方公尺"]),
+            "building_area_sqm": to_numeric_column(df["建物移轉總面積平方公尺"]),
+            "building_floor_number": clean_string_column(df["移轉層次"]),
+            "total_price_ntd": to_numeric_column(df["總價元"]),
+            "parking_area_sqm": to_numeric_column(df["車位移轉總面積平方公尺"]),
+            "parking_price_ntd": to_numeric_column(df["車位總價元"]),
+            "project_name": clean_string_column(df["建案名稱"]),
+            "building_number": clean_string_column(df["棟及號"]),
+            "termination_status": clean_string_column(df["解約情形"]),
+            "construction_year_roc": to_roc_year_column(df["建築完成年月"]),
+            "transaction_date_ad": to_ad_date_column(df["交易年月日"]),
         }
     )
 
@@ -59,11 +72,19 @@ def clean_presale_file(input_path: str, output_path: str) -> int:
         subset=["city", "district", "transaction_date", "total_price_ntd"]
     )
 
-    cleaned_df.to_csv(output_path, index=False)
-    return len(cleaned_df)
+    return cleaned_df
+
 
+def clean_presale_file(
+    input_path: str, output_path: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE
+) -> int:
+    """Clean single presale CSV file, streaming it in chunks."""
+    return clean_csv(input_path, output_path, clean_presale_chunk, chunksize)
 
-def batch_clean(input_pattern: str, output_dir: str):
+
+def batch_clean(
+    input_pattern: str, output_dir: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE
+):
     """Clean multiple presale CSV files."""
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
@@ -80,7 +101,7 @@ def batch_clean(input_pattern: str, output_dir: str):
         output_path = f"{output_dir}/{filename}_cleaned.csv"
 
         print(f"Processing: {file_path}")
-        count = clean_presale_file(file_path, output_path)
+        count = clean_presale_file(file_path, output_path, chunksize)
         total_records += count
         print(f"  ✓ Cleaned {count} records → {output_path}")
 
@@ -95,6 +116,12 @@ if __name__ == "__main__":
     parser.add_argument(
         "--output", default="data/cleaned/presales", help="Output directory"
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        help="Rows per chunk (0 reads the whole file at once)",
+    )
 
     args = parser.parse_args()
-    batch_clean(args.input, args.output)
+    batch_clean(args.input, args.output, args.chunksize)
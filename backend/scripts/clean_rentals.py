@@ -5,57 +5,70 @@ import argparse
 import glob
 from pathlib import Path
 import sys
+from typing import Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.etl.transformers import clean_yes_no, parse_roc_date, to_numeric, clean_string
-from app.etl.district_mapping import get_city_from_district
-
-
-def clean_rental_file(input_path: str, output_path: str) -> int:
-    """Clean single rental CSV file."""
-    df = pd.read_csv(input_path, skiprows=[1])
-
-    df["city"] = df["鄉鎮市區"].apply(get_city_from_district)
+from app.etl.transformers import (
+    clean_yes_no_column,
+    parse_roc_date_column,
+    to_numeric_column,
+    clean_string_column,
+    to_roc_year_column,
+    to_ad_date_column,
+)
+from app.etl.district_mapping import DistrictResolver
+from app.etl.streaming import DEFAULT_CHUNKSIZE, clean_csv
+
+
+def clean_rental_chunk(
+    df: pd.DataFrame, districts: Optional[DistrictResolver] = None
+) -> pd.DataFrame:
+    """Clean one chunk of a raw rental CSV file."""
+    if districts is None:
+        districts = DistrictResolver()
+    df["city"] = districts.resolve(df["鄉鎮市區"])
 
     cleaned_df = pd.DataFrame(
         {
             "city": df["city"],
             "district": df["鄉鎮市區"],
-            "transaction_target": df["交易標的"].apply(clean_string),
-            "land_section": df["土地位置建物門牌"].apply(clean_string),
-            "urban_land_use_type": df["都市土地使用分區"].apply(clean_string),
-            "non_urban_land_use_type": df["非都市土地使用分區"].apply(clean_string),
-            "non_urban_land_use_category": df["非都市土地使用編定"].apply(clean_string),
-            "building_type": df["建物型態"].apply(clean_string),
-            "main_use": df["主要用途"].apply(clean_string),
-            "main_building_materials": df["主要建材"].apply(clean_string),
-            "construction_complete_date": df["建築完成年月"].apply(clean_string),
-            "building_rooms": df["建物現況格局-房"].apply(to_numeric),
-            "building_halls": df["建物現況格局-廳"].apply(to_numeric),
-            "building_bathrooms": df["建物現況格局-衛"].apply(to_numeric),
-            "building_compartments": df["建物現況格局-隔間"].apply(clean_yes_no),
-            "has_management": df["有無管理組織"].apply(clean_yes_no),
-            "total_floor_number": df["總樓層數"].apply(to_numeric),
-            "unit_price_ntd": df["單價元平方公尺"].apply(to_numeric),
-            "parking_type": df["車位類別"].apply(clean_string),
-            "remarks": df["備註"].apply(clean_string),
+            "transaction_target": clean_string_column(df["交易標的"]),
+            "land_section": clean_string_column(df["土地位置建物門牌"]),
+            "urban_land_use_type": clean_string_column(df["都市土地使用分區"]),
+            "non_urban_land_use_type": clean_string_column(df["非都市土地使用分區"]),
+            "non_urban_land_use_category": clean_string_column(df["非都市土地使用編定"]),
+            "building_type": clean_string_column(df["建物型態"]),
+            "main_use": clean_string_column(df["主要用途"]),
+            "main_building_materials": clean_string_column(df["主要建材"]),
+            "construction_complete_date": clean_string_column(df["建築完成年月"]),
+            "building_rooms": to_numeric_column(df["建物現況格局-房"]),
+            "building_halls": to_numeric_column(df["建物現況格局-廳"]),
+            "building_bathrooms": to_numeric_column(df["建物現況格局-衛"]),
+            "building_compartments": clean_yes_no_column(df["建物現況格局-隔間"]),
+            "has_management": clean_yes_no_column(df["有無管理組織"]),
+            "total_floor_number": to_numeric_column(df["總樓層數"]),
+            "unit_price_ntd": to_numeric_column(df["單價元平方公尺"]),
+            "parking_type": clean_string_column(df["車位類別"]),
+            "remarks": clean_string_column(df["備註"]),
             "serial_number": df["編號"],
-            "rental_date": df["租賃年月日"].apply(parse_roc_date),
-            "rental_pen_number": df["租賃筆棟數"].apply(clean_string),
-            "land_area_sqm": df["土地面積平方公尺"].apply(to_numeric),
-            "building_area_sqm": df["建物總面積平方公尺"].apply(to_numeric),
-            "building_floor_number": df["租賃層次"].apply(clean_string),
-            "has_furniture": df["有無附傢俱"].apply(clean_yes_no),
-            "rental_type": df["出租型態"].apply(clean_string),
-            "has_manager": df["有無管理員"].apply(clean_yes_no),
-            "rental_period": df["租賃期間"].apply(clean_string),
-            "has_elevator": df["有無電梯"].apply(clean_yes_no),
-            "equipment": df["附屬設備"].apply(clean_string),
-            "rental_service": df["租賃住宅服務"].apply(clean_string),
-            "monthly_rent_ntd": df["總額元"].apply(to_numeric),
-            "parking_area_sqm": df["車位面積平方公尺"].apply(to_numeric),
-            "parking_rent_ntd": df["車位總額元"].apply(to_numeric),
+            "rental_date": parse_roc_date_column(df["租賃年月日"]),
+            "rental_pen_number": clean_string_column(df["租賃筆棟數"]),
+            "land_area_sqm": to_numeric_column(df["土地面積平方公尺"]),
+            "building_area_sqm": to_numeric_column(df["建物總面積平方公尺"]),
+            "building_floor_number": clean_string_column(df["租賃層次"]),
+            "has_furniture": clean_yes_no_column(df["有無附傢俱"]),
+            "rental_type": clean_string_column(df["出租型態"]),
+            "has_manager": clean_yes_no_column(df["有無管理員"]),
+            "rental_period": clean_string_column(df["租賃期間"]),
+            "has_elevator": clean_yes_no_column(df["有無電梯"]),
+            "equipment": clean_string_column(df["附屬設備"]),
+            "rental_service": clean_string_column(df["租賃住宅服務"]),
+            "monthly_rent_ntd": to_numeric_column(df["總額元"]),
+            "parking_area_sqm": to_numeric_column(df["車位面積平方公尺"]),
+            "parking_rent_ntd": to_numeric_column(df["車位總額元"]),
+            "construction_year_roc": to_roc_year_column(df["建築完成年月"]),
+            "rental_date_ad": to_ad_date_column(df["租賃年月日"]),
         }
     )
 
@@ -63,11 +76,19 @@ def clean_rental_file(input_path: str, output_path: str) -> int:
         subset=["city", "district", "rental_date", "monthly_rent_ntd"]
     )
 
-    cleaned_df.to_csv(output_path, index=False)
-    return len(cleaned_df)
+    return cleaned_df
+
 
+def clean_rental_file(
+    input_path: str, output_path: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE
+) -> int:
+    """Clean single rental CSV file, streaming it in chunks."""
+    return clean_csv(input_path, output_path, clean_rental_chunk, chunksize)
 
-def batch_clean(input_pattern: str, output_dir: str):
+
+def batch_clean(
+    input_pattern: str, output_dir: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE
+):
     """Clean multiple rental CSV files."""
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
@@ -84,7 +105,7 @@ def batch_clean(input_pattern: str, output_dir: str):
         output_path = f"{output_dir}/{filename}_cleaned.csv"
 
         print(f"Processing: {file_path}")
-        count = clean_rental_file(file_path, output_path)
+        count = clean_rental_file(file_path, output_path, chunksize)
         total_records += count
         print(f"  ✓ Cleaned {count} records → {output_path}")
 
@@ -99,6 +120,12 @@ if __name__ == "__main__":
     parser.add_argument(
         "--output", default="data/cleaned/rentals", help="Output directory"
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        help="Rows per chunk (0 reads the whole file at once)",
+    )
 
     args = parser.parse_args()
-    batch_clean(args.input, args.output)
+    batch_clean(args.input, args.output, args.chunksize)
@@ -0,0 +1,230 @@
+"""Single-pass ETL: stream raw CSVs through the transformers into the database.
+
+Replaces the clean_*.py -> *_cleaned.csv -> import_*.py round trip. The
+dataset is taken from the government file name suffix (_a transactions,
+_b presales, _c rentals) unless --kind is given.
+
+Loads refresh the stats rollups of the months they wrote to; the
+rollups subcommand rebuilds them on demand.
+
+Examples:
+    python scripts/etl.py run --input "data/raw/*_lvr_land_a.csv"
+    python scripts/etl.py run --input "data/raw/*.csv" --incremental \\
+        --checkpoint data/checkpoints
+    python scripts/etl.py rollups --kind transactions --month 202303
+"""
+
+import argparse
+import glob
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.data_version import rollups_current
+from app.core.database import SessionLocal
+from app.etl.loader import LoadStats
+from app.etl.pipeline import run_file
+from app.etl.rollups import refresh_after_import, refresh_rollups
+from app.etl.streaming import DEFAULT_CHUNKSIZE
+from app.models.property_presale import PropertyPresale
+from app.models.property_rental import PropertyRental
+from app.models.property_transaction import PropertyTransaction
+from clean_presales import clean_presale_chunk
+from clean_rentals import clean_rental_chunk
+from clean_transactions import clean_transaction_chunk
+
+# kind -> (file name suffix, model, chunk cleaner)
+DATASETS = {
+    "transactions": ("a", PropertyTransaction, clean_transaction_chunk),
+    "presales": ("b", PropertyPresale, clean_presale_chunk),
+    "rentals": ("c", PropertyRental, clean_rental_chunk),
+}
+
+
+def detect_kind(file_path: str) -> str:
+    """Dataset of a raw file from its name, e.g. a_lvr_land_c.csv -> rentals."""
+    suffix = Path(file_path).stem.rsplit("_", 1)[-1].lower()
+    for kind, (letter, _, _) in DATASETS.items():
+        if suffix == letter:
+            return kind
+    raise ValueError(f"Cannot tell the dataset of {file_path}; pass --kind")
+
+
+def run(
+    input_pattern: str,
+    kind: str = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    batch_size: int = 1000,
+    incremental: bool = False,
+    checkpoint_dir: str = None,
+    load: bool = True,
+):
+    """Clean and load every raw file matching the pattern."""
+    files = sorted(glob.glob(input_pattern))
+
+    if not files:
+        print(f"No files found matching: {input_pattern}")
+        return
+
+    if checkpoint_dir:
+        Path(checkpoint_dir).mkdir(parents=True, exist_ok=True)
+
+    db = SessionLocal()
+
+    try:
+        total = LoadStats()
+        totals = {}  # kind -> LoadStats, for the rollup refresh
+        total_cleaned = 0
+        started = time.perf_counter()
+
+        # Current rollups only need the loaded months recomputed
+        rollups_were_current = {
+            kind: rollups_current(db, model.__tablename__)
+            for kind, (_, model, _) in DATASETS.items()
+        }
+
+        for file_path in files:
+            file_kind = kind or detect_kind(file_path)
+            _, model, clean_chunk = DATASETS[file_kind]
+            checkpoint_path = (
+                f"{checkpoint_dir}/{Path(file_path).stem}_cleaned.parquet"
+                if checkpoint_dir
+                else None
+            )
+
+            print(f"\nProcessing ({file_kind}): {file_path}")
+            file_started = time.perf_counter()
+            cleaned, stats = run_file(
+                db,
+                model,
+                file_path,
+                clean_chunk,
+                chunksize,
+                batch_size,
+                incremental,
+                checkpoint_path,
+                load,
+            )
+            total += stats
+            totals[file_kind] = totals.get(file_kind, LoadStats()) + stats
+            total_cleaned += cleaned
+
+            rate = cleaned / max(time.perf_counter() - file_started, 1e-9)
+            print(f"  ✓ Cleaned {cleaned} records ({rate:,.0f} rows/s)")
+            if load:
+                print(f"  ✓ Loaded: {stats}")
+            if checkpoint_path:
+                print(f"  ✓ Checkpoint → {checkpoint_path}")
+
+        rate = total_cleaned / max(time.perf_counter() - started, 1e-9)
+        print(
+            f"\n✅ Total: {total_cleaned} records from {len(files)} files "
+            f"({rate:,.0f} rows/s)"
+        )
+        if load:
+            print(f"   {total}")
+            for file_kind, stats in totals.items():
+                model = DATASETS[file_kind][1]
+                refresh_after_import(
+                    db, model, stats.months, rollups_were_current[file_kind]
+                )
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+def rebuild_rollups(kind: str = None, months: list = None):
+    """Recompute the stats rollups of one or every dataset."""
+    db = SessionLocal()
+
+    try:
+        for dataset in [kind] if kind else list(DATASETS):
+            model = DATASETS[dataset][1]
+            started = time.perf_counter()
+            written = refresh_rollups(db, model, months)
+            print(
+                f"✓ {dataset}: {written:,} rollup rows "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Clean raw CSVs and load them in a single pass"
+    )
+    run_parser.add_argument(
+        "--input", required=True, help="Raw file pattern (e.g., data/raw/*_a.csv)"
+    )
+    run_parser.add_argument(
+        "--kind",
+        choices=list(DATASETS),
+        help="Dataset of the input files (default: from the file name suffix)",
+    )
+    run_parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        help="Rows per chunk (0 reads the whole file at once)",
+    )
+    run_parser.add_argument("--batch-size", type=int, default=1000, help="Batch size")
+    run_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Upsert on serial_number so only new or changed rows are written "
+            "(without it, loading stops at the first chunk holding already "
+            "imported serial numbers)"
+        ),
+    )
+    run_parser.add_argument(
+        "--checkpoint",
+        help="Also write cleaned rows as Parquet files to this directory",
+    )
+    run_parser.add_argument(
+        "--no-load",
+        action="store_true",
+        help="Skip the database load (use with --checkpoint)",
+    )
+
+    rollups_parser = subparsers.add_parser(
+        "rollups", help="Rebuild the pre-aggregated stats rollups"
+    )
+    rollups_parser.add_argument(
+        "--kind", choices=list(DATASETS), help="Dataset to rebuild (default: all)"
+    )
+    rollups_parser.add_argument(
+        "--month",
+        type=int,
+        action="append",
+        help="Only recompute this month, e.g. 202303 (repeatable; default: all)",
+    )
+
+    args = parser.parse_args()
+    if args.command == "rollups":
+        rebuild_rollups(args.kind, args.month)
+    else:
+        run(
+            args.input,
+            args.kind,
+            args.chunksize,
+            args.batch_size,
+            args.incremental,
+            args.checkpoint,
+            not args.no_load,
+        )
@@ -0,0 +1,138 @@
+"""Replay sample search filter combinations through MySQL EXPLAIN.
+
+Reports which endpoint filter combinations still do a full table scan or
+a filesort, and how many partitions each reads, so index and partitioning
+changes can be checked against real query shapes.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.repositories.property_transaction_repository import (
+    PropertyTransactionRepository,
+)
+from app.repositories.property_rental_repository import PropertyRentalRepository
+from app.repositories.property_presale_repository import PropertyPresaleRepository
+
+
+def sample_filters(city: str, district: str, date_from: str, date_to: str) -> dict:
+    """Representative filter combinations sent by the frontend, per endpoint."""
+    location = {"city": city, "district": district}
+    dates = {"date_from": date_from, "date_to": date_to}
+
+    return {
+        "transactions": {
+            "repository": PropertyTransactionRepository,
+            "order_by": "transaction_date_ad",
+            "combinations": [
+                {},
+                {"city": city},
+                location,
+                {**location, **dates},
+                {"city": city, **dates},
+                {"city": city, "building_types": ["住宅大樓(11層含以上有電梯)"]},
+                {"city": city, "price_min": 10000000, "price_max": 30000000},
+                {**location, "age_max": 10},
+                {**location, "has_elevator": True, **dates},
+            ],
+        },
+        "rentals": {
+            "repository": PropertyRentalRepository,
+            "order_by": "rental_date_ad",
+            "combinations": [
+                {},
+                {"city": city},
+                location,
+                {**location, **dates},
+                {"city": city, "rent_min": 20000, "rent_max": 40000},
+                {**location, "has_furniture": True},
+            ],
+        },
+        "presales": {
+            "repository": PropertyPresaleRepository,
+            "order_by": "transaction_date_ad",
+            "combinations": [
+                {},
+                {"city": city},
+                location,
+                {**location, **dates},
+                {"city": city, "price_min": 10000000, "price_max": 30000000},
+            ],
+        },
+    }
+
+
+def describe(filters: dict) -> str:
+    """Short label for a filter combination."""
+    return "+".join(filters.keys()) or "(no filters)"
+
+
+def check_plan(plan: list) -> list:
+    """Return the problems found in an EXPLAIN plan."""
+    problems = []
+    for row in plan:
+        extra = row.get("Extra") or ""
+        if row.get("type") == "ALL":
+            problems.append("full scan")
+        if "Using filesort" in extra:
+            problems.append("filesort")
+        if "Using temporary" in extra:
+            problems.append("temporary")
+    return problems
+
+
+def run(city: str, district: str, date_from: str, date_to: str, limit: int) -> int:
+    """Explain every sample combination and print a report."""
+    db = SessionLocal()
+    flagged = 0
+
+    try:
+        if db.get_bind().dialect.name != "mysql":
+            print("EXPLAIN replay requires a MySQL database")
+            return 0
+
+        for endpoint, spec in sample_filters(
+            city, district, date_from, date_to
+        ).items():
+            repo = spec["repository"](db)
+            order_column = getattr(repo.model, spec["order_by"])
+            print(f"\n[{endpoint}]")
+
+            for filters in spec["combinations"]:
+                query = repo.order(repo.build_search_query(**filters), order_column)
+                plan = repo.explain(query.limit(limit + 1))
+                problems = check_plan(plan)
+                first = plan[0] if plan else {}
+
+                status = "✗ " + ", ".join(problems) if problems else "✓"
+                flagged += bool(problems)
+                # Partitions read; date filters should prune to a few quarters
+                partitions = len((first.get("partitions") or "").split(","))
+                print(
+                    f"  {status:<24} {describe(filters):<45} "
+                    f"type={first.get('type')} key={first.get('key')} "
+                    f"rows={first.get('rows')} partitions={partitions}"
+                )
+
+        print(f"\n{'⚠️' if flagged else '✅'} {flagged} combination(s) flagged")
+        return flagged
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--city", default="台北市", help="Sample city")
+    parser.add_argument("--district", default="大安區", help="Sample district")
+    parser.add_argument("--date-from", default="1120101", help="Sample start date")
+    parser.add_argument("--date-to", default="1121231", help="Sample end date")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+
+    args = parser.parse_args()
+    flagged = run(args.city, args.district, args.date_from, args.date_to, args.limit)
+    sys.exit(1 if flagged else 0)
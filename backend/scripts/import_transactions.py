@@ -4,10 +4,25 @@ import pandas as pd
 import argparse
 from pathlib import Path
 import sys
+import time
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from app.core.data_version import bump_data_version, rollups_current
 from app.core.database import SessionLocal
+from app.etl.loader import (
+    HASH_COLUMN,
+    LoadStats,
+    bulk_insert,
+    check_new_serials,
+    keyed_rows,
+    read_cleaned_file,
+    upsert,
+    with_row_hash,
+)
+from app.etl.parallel_import import parallel_import
+from app.etl.rollups import refresh_after_import, touched_months
+from app.etl.search_texts import sync_search_texts
 from app.models.property_transaction import PropertyTransaction
 
 
@@ -18,9 +33,33 @@ def safe_value(val):
     return val
 
 
-def import_transaction_file(file_path: str, db, batch_size: int = 1000) -> int:
-    """Import single cleaned CSV file to property_transactions table."""
-    df = pd.read_csv(file_path)
+def import_transaction_file(
+    file_path: str,
+    db,
+    batch_size: int = 1000,
+    use_orm: bool = False,
+    incremental: bool = False,
+) -> LoadStats:
+    """Import single cleaned CSV or Parquet file to property_transactions table.
+
+    Uses the column-oriented bulk loader unless use_orm is set, in which
+    case rows are built as ORM objects and saved with bulk_save_objects.
+    With incremental set, rows are upserted on serial_number so re-running
+    a file only writes new or changed records.
+    """
+    df = read_cleaned_file(file_path, PropertyTransaction)
+
+    if incremental:
+        return upsert(db, PropertyTransaction, df, batch_size)
+    if not use_orm:
+        inserted = bulk_insert(db, PropertyTransaction, df, batch_size)
+        return LoadStats(
+            inserted=inserted, months=touched_months(PropertyTransaction, df)
+        )
+
+    df, _ = keyed_rows(df)
+    check_new_serials(db, PropertyTransaction, df, batch_size)
+    df = with_row_hash(PropertyTransaction, df)
     df = df.where(pd.notna(df), None)
     total_records = len(df)
     imported_count = 0
@@ -68,23 +107,63 @@ def import_transaction_file(file_path: str, db, batch_size: int = 1000) -> int:
                 auxiliary_building_area=safe_value(row.get("auxiliary_building_area")),
                 balcony_area=safe_value(row.get("balcony_area")),
                 has_elevator=safe_value(row.get("has_elevator")),
+                construction_year_roc=safe_value(row.get("construction_year_roc")),
+                transaction_date_ad=safe_value(row.get("transaction_date_ad")),
+                row_hash=int(row[HASH_COLUMN]),
             )
             transactions.append(trans)
 
         db.bulk_save_objects(transactions)
+        sync_search_texts(db, PropertyTransaction, batch_df["serial_number"])
+        bump_data_version(db, PropertyTransaction.__tablename__)
         db.commit()
         imported_count += len(transactions)
 
         progress = (i + len(batch_df)) / total_records * 100
         print(f"  Progress: {progress:.1f}% ({imported_count}/{total_records})")
 
-    return imported_count
+    return LoadStats(
+        inserted=imported_count, months=touched_months(PropertyTransaction, df)
+    )
 
 
-def batch_import(input_pattern: str, batch_size: int = 1000):
+def batch_import(
+    input_pattern: str,
+    batch_size: int = 1000,
+    use_orm: bool = False,
+    workers: int = 1,
+    incremental: bool = False,
+):
     """Import multiple CSV files matching pattern."""
     import glob
 
+    if workers > 1:
+        files = glob.glob(input_pattern)
+
+        if not files:
+            print(f"No files found matching: {input_pattern}")
+            return
+
+        with SessionLocal() as db:
+            # Current rollups only need the imported months recomputed
+            rollups_were_current = rollups_current(
+                db, PropertyTransaction.__tablename__
+            )
+
+        results = parallel_import(
+            files, import_transaction_file, workers, batch_size, use_orm, incremental
+        )
+        failed = [r for r in results if not r.ok]
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(files)} files failed to import")
+
+        total = sum((r.stats for r in results), LoadStats())
+        with SessionLocal() as db:
+            refresh_after_import(
+                db, PropertyTransaction, total.months, rollups_were_current
+            )
+        return
+
     db = SessionLocal()
 
     try:
@@ -94,15 +173,26 @@ def batch_import(input_pattern: str, batch_size: int = 1000):
             print(f"No files found matching: {input_pattern}")
             return
 
-        total_imported = 0
+        # Current rollups only need the imported months recomputed
+        rollups_were_current = rollups_current(db, PropertyTransaction.__tablename__)
+        total = LoadStats()
+        started = time.perf_counter()
 
         for file_path in files:
             print(f"\nImporting: {file_path}")
-            count = import_transaction_file(file_path, db, batch_size)
-            total_imported += count
-            print(f"  ✓ Imported {count} records")
+            file_started = time.perf_counter()
+            stats = import_transaction_file(
+                file_path, db, batch_size, use_orm, incremental
+            )
+            total += stats
+            rate = stats.total / max(time.perf_counter() - file_started, 1e-9)
+            print(f"  ✓ Imported: {stats} ({rate:,.0f} rows/s)")
 
-        print(f"\n✅ Total: {total_imported} records from {len(files)} files")
+        rate = total.total / max(time.perf_counter() - started, 1e-9)
+        print(f"\n✅ Total: {total} from {len(files)} files ({rate:,.0f} rows/s)")
+        refresh_after_import(
+            db, PropertyTransaction, total.months, rollups_were_current
+        )
 
     except Exception as e:
         db.rollback()
@@ -116,6 +206,26 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--input", required=True, help="Input file pattern")
     parser.add_argument("--batch-size", type=int, default=1000, help="Batch size")
+    parser.add_argument(
+        "--orm",
+        action="store_true",
+        help="Use the slower ORM object path instead of the bulk loader",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Import files concurrently in this many worker processes",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Upsert on serial_number so only new or changed rows are written "
+            "(without it, files holding already imported serial numbers are "
+            "refused before anything is written)"
+        ),
+    )
 
     args = parser.parse_args()
-    batch_import(args.input, args.batch_size)
+    batch_import(args.input, args.batch_size, args.orm, args.workers, args.incremental)
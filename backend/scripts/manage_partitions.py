@@ -0,0 +1,189 @@
+"""Maintain the quarterly RANGE partitions of the property tables (MySQL).
+
+Quarters past the last partition land in the p_future catch-all; `add`
+splits new quarters out of it ahead of time (run it e.g. monthly from
+cron). `truncate` empties one season in place of a mass DELETE, e.g.
+before reloading a corrected government release for that quarter.
+
+Examples:
+    python scripts/manage_partitions.py list --kind rentals
+    python scripts/manage_partitions.py add --ahead 4
+    python scripts/manage_partitions.py truncate --kind transactions \\
+        --quarter 2023Q1
+"""
+
+import argparse
+from datetime import date
+from pathlib import Path
+import sys
+
+from sqlalchemy import delete, text
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.data_version import bump_data_version, rollups_current
+from app.core.database import SessionLocal
+from app.core.partitions import (
+    FIRST_PERIOD,
+    FUTURE_PARTITION,
+    date_period,
+    next_period,
+    parse_period,
+    partition_clause,
+    partition_name,
+    partition_period,
+    period_months,
+)
+from app.etl.rollups import refresh_after_import
+from app.models.property_presale import PropertyPresale
+from app.models.property_rental import PropertyRental
+from app.models.property_search_text import PropertySearchText
+from app.models.property_transaction import PropertyTransaction
+
+KINDS = {
+    "transactions": PropertyTransaction,
+    "presales": PropertyPresale,
+    "rentals": PropertyRental,
+}
+
+
+def existing_partitions(db, table_name: str) -> list:
+    """(partition name, estimated rows) of a table, in partition order."""
+    return db.execute(
+        text(
+            "SELECT PARTITION_NAME, TABLE_ROWS FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION"
+        ),
+        {"table": table_name},
+    ).all()
+
+
+def list_partitions(db, models: list) -> None:
+    """Print each table's partitions with estimated row counts."""
+    for model in models:
+        print(f"\n[{model.__tablename__}]")
+        for name, rows in existing_partitions(db, model.__tablename__):
+            print(f"  {name:<10} ~{rows:,} rows")
+
+
+def add_partitions(db, models: list, ahead: int) -> None:
+    """Split quarters up to `ahead` past the current one out of p_future."""
+    target = date_period(date.today())
+    for _ in range(ahead):
+        target = next_period(target)
+
+    for model in models:
+        table_name = model.__tablename__
+        names = [name for name, _ in existing_partitions(db, table_name)]
+        if FUTURE_PARTITION not in names:
+            print(f"  ✗ {table_name}: not partitioned (run alembic upgrade head)")
+            continue
+
+        last = max(filter(None, map(partition_period, names)), default=None)
+        period = next_period(last) if last else FIRST_PERIOD
+        new = []
+        while period <= target:
+            new.append(period)
+            period = next_period(period)
+
+        if not new:
+            print(
+                f"  ✓ {table_name}: partitions already reach {partition_name(target)}"
+            )
+            continue
+
+        clauses = [partition_clause(p) for p in new]
+        clauses.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE")
+        db.execute(
+            text(
+                f"ALTER TABLE {table_name} REORGANIZE PARTITION {FUTURE_PARTITION} "
+                f"INTO ({', '.join(clauses)})"
+            )
+        )
+        print(
+            f"  ✓ {table_name}: added {partition_name(new[0])}"
+            f"..{partition_name(new[-1])}"
+        )
+
+
+def truncate_quarter(db, model, quarter: str) -> None:
+    """Delete every row of one quarter by truncating its partition."""
+    table_name = model.__tablename__
+    period = parse_period(quarter)
+    name = partition_name(period)
+
+    names = [partition for partition, _ in existing_partitions(db, table_name)]
+    if name not in names:
+        raise ValueError(f"{table_name} has no partition {name} for {quarter}")
+
+    rollups_were_current = rollups_current(db, table_name)
+    db.execute(text(f"ALTER TABLE {table_name} TRUNCATE PARTITION {name}"))
+    # The unpartitioned full-text mirror is cleared with an ordinary DELETE
+    texts = PropertySearchText.__table__
+    db.execute(
+        delete(texts).where(texts.c.table_name == table_name, texts.c.period == period)
+    )
+    bump_data_version(db, table_name)
+    db.commit()
+    print(f"  ✓ {table_name}: truncated {name}")
+
+    refresh_after_import(db, model, set(period_months(period)), rollups_were_current)
+
+
+def run(command: str, kind: str = None, ahead: int = 4, quarter: str = None):
+    """Run a maintenance command against one or every property table."""
+    db = SessionLocal()
+
+    try:
+        if db.get_bind().dialect.name != "mysql":
+            print("Partition maintenance requires a MySQL database")
+            return
+
+        models = [KINDS[kind]] if kind else list(KINDS.values())
+        if command == "list":
+            list_partitions(db, models)
+        elif command == "add":
+            add_partitions(db, models, ahead)
+        elif command == "truncate":
+            truncate_quarter(db, models[0], quarter)
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="Show partitions and row counts")
+    list_parser.add_argument("--kind", choices=list(KINDS), help="Table (default: all)")
+
+    add_parser = subparsers.add_parser("add", help="Add partitions for coming quarters")
+    add_parser.add_argument("--kind", choices=list(KINDS), help="Table (default: all)")
+    add_parser.add_argument(
+        "--ahead",
+        type=int,
+        default=4,
+        help="Quarters past the current one that must have a partition",
+    )
+
+    truncate_parser = subparsers.add_parser(
+        "truncate", help="Empty one quarter's partition (before a reload)"
+    )
+    truncate_parser.add_argument("--kind", choices=list(KINDS), required=True)
+    truncate_parser.add_argument(
+        "--quarter", required=True, help="Quarter to empty, e.g. 2023Q1"
+    )
+
+    args = parser.parse_args()
+    run(
+        args.command,
+        args.kind,
+        getattr(args, "ahead", 4),
+        getattr(args, "quarter", None),
+    )
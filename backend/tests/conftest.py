@@ -0,0 +1,69 @@
+"""Shared fixtures: SQLite databases with the app's tables, and an API client."""
+
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory SQLite database."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Session on a fresh SQLite file, which the API client reads as well."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'api.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def client(file_db):
+    """API client whose requests read file_db's database."""
+    from fastapi.testclient import TestClient
+
+    from app.core.database import get_async_db
+    from app.core.search_cache import search_cache
+    from app.main import app
+    from app.repositories.base import _count_cache
+
+    url = file_db.get_bind().url.set(drivername="sqlite+aiosqlite")
+    # No pool: each request runs on its own event loop
+    engine = create_async_engine(url, poolclass=NullPool)
+    Session = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def get_test_db():
+        async with Session() as session:
+            yield session
+
+    # Cached responses and counts are keyed on data versions, which restart
+    # at 0 with every test database
+    asyncio.run(search_cache.backend.clear())
+    _count_cache.clear()
+
+    app.dependency_overrides[get_async_db] = get_test_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_async_db)
+    asyncio.run(engine.dispose())
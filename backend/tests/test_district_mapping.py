@@ -0,0 +1,101 @@
+"""Districts resolve to cities, settling shared names with the file's city code."""
+
+import pandas as pd
+import pytest
+
+from app.etl.district_mapping import (
+    DistrictResolver,
+    city_from_file_name,
+    resolve_city,
+)
+from app.etl.streaming import iter_clean_chunks
+
+DISTRICTS = ["中正區", "板橋區", "東區", "東區", "火星區", None, "北區", "中正區"]
+
+
+@pytest.mark.parametrize(
+    "file_name, city",
+    [
+        ("a_lvr_land_a.csv", "台北市"),
+        ("F_LVR_LAND_B.CSV", "新北市"),
+        ("data/raw/o_lvr_land_c.csv", "新竹市"),
+        ("c_lvr_land_a_build.csv", "基隆市"),
+        ("y_lvr_land_a.csv", None),  # No city has code y
+        ("transactions.csv", None),
+    ],
+)
+def test_city_from_file_name(file_name, city):
+    assert city_from_file_name(file_name) == city
+
+
+@pytest.mark.parametrize("hint", [None, "台北市", "基隆市", "新竹市", "台中市"])
+def test_resolve_matches_resolve_city(hint):
+    cities = DistrictResolver(hint).resolve(pd.Series(DISTRICTS))
+
+    assert cities.tolist() == [
+        None if name is None else resolve_city(name, hint) for name in DISTRICTS
+    ]
+
+
+@pytest.mark.parametrize(
+    "hint, expected",
+    [
+        # Without a code the most likely city is assumed
+        (None, ["台北市", "新北市", "嘉義市", "嘉義市", None, None, "新竹市", "台北市"]),
+        ("基隆市", ["基隆市", "新北市", "嘉義市", "嘉義市", None, None, "新竹市", "基隆市"]),
+        ("台中市", ["台北市", "新北市", "台中市", "台中市", None, None, "台中市", "台北市"]),
+    ],
+)
+def test_city_hint_settles_ambiguous_districts(hint, expected):
+    assert DistrictResolver(hint).resolve(pd.Series(DISTRICTS)).tolist() == expected
+
+
+def test_resolve_keeps_index():
+    districts = pd.Series(["板橋區", "東區"], index=[10, 20])
+
+    assert DistrictResolver().resolve(districts).index.tolist() == [10, 20]
+
+
+def test_unknown_districts_are_tallied_across_chunks(capsys):
+    resolver = DistrictResolver()
+    resolver.resolve(pd.Series(DISTRICTS[:5]))
+    resolver.resolve(pd.Series(DISTRICTS[5:] + ["火星區"]))
+
+    assert resolver.unknown == {"火星區": 2, "(blank)": 1}
+    assert resolver.guessed == {
+        ("中正區", "台北市"): 2,
+        ("東區", "嘉義市"): 2,
+        ("北區", "新竹市"): 1,
+    }
+
+    resolver.report("x.csv")
+    lines = capsys.readouterr().out.splitlines()
+    # One line for the unknown districts and one for the guessed ones
+    assert len(lines) == 2
+    assert "3 rows with unknown districts in x.csv" in lines[0]
+    assert "火星區 ×2" in lines[0]
+
+
+def test_nothing_guessed_with_a_hint(capsys):
+    resolver = DistrictResolver("台南市")
+    resolver.resolve(pd.Series(["東區", "北區", "板橋區"]))
+    resolver.report()
+
+    assert not resolver.guessed
+    assert capsys.readouterr().out == ""
+
+
+def test_clean_chunks_use_the_file_city_code(tmp_path, capsys):
+    path = tmp_path / "o_lvr_land_a.csv"
+    pd.DataFrame({"鄉鎮市區": ["district", "東區", "北區", "香山區", "東區"]}).to_csv(
+        path, index=False
+    )
+
+    chunks = iter_clean_chunks(
+        str(path),
+        lambda df, districts: pd.DataFrame({"city": districts.resolve(df["鄉鎮市區"])}),
+        chunksize=2,
+    )
+
+    assert pd.concat(chunks)["city"].tolist() == ["新竹市"] * 4
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,98 @@
+"""/export streams every matching row as CSV, NDJSON or Parquet."""
+
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+import pytest
+
+from app.models.property_transaction import PropertyTransaction
+
+EXPORT = "/api/v1/transactions/export"
+FIELDS = "district,total_price_ntd,has_elevator,building_rooms"
+
+
+@pytest.fixture
+def client(client, file_db):
+    for i, district in enumerate(["大安區", "信義區", "大安區"]):
+        file_db.add(
+            PropertyTransaction(
+                city="臺北市",
+                district=district,
+                serial_number=f"X{i}",
+                transaction_date="1120315",
+                transaction_date_ad=date(2023, 3, 15),
+                total_price_ntd=Decimal("12500000.50") + i,
+                has_elevator=bool(i % 2),
+                building_rooms=None if i == 2 else 3,
+            )
+        )
+    file_db.commit()
+    return client
+
+
+def export(client, export_format, **params):
+    response = client.get(
+        EXPORT, params={"format": export_format, "fields": FIELDS, **params}
+    )
+    assert response.status_code == 200
+    return response
+
+
+def test_csv(client):
+    response = export(client, "csv", district="大安區")
+
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert 'filename="transactions.csv"' in response.headers["content-disposition"]
+    reader = csv.DictReader(io.StringIO(response.text))
+    assert sorted(reader.fieldnames) == sorted(["id", *FIELDS.split(",")])
+    rows = [{k: v for k, v in row.items() if k != "id"} for row in reader]
+    assert rows == [
+        {
+            "district": "大安區",
+            "total_price_ntd": "12500002.50",
+            "has_elevator": "False",
+            "building_rooms": "",
+        },
+        {
+            "district": "大安區",
+            "total_price_ntd": "12500000.50",
+            "has_elevator": "False",
+            "building_rooms": "3",
+        },
+    ]
+
+
+def test_ndjson(client):
+    response = export(client, "ndjson")
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert len(items) == 3
+    assert set(items[0]) == {"id", *FIELDS.split(",")}
+    # Decimals follow JSON_DECIMAL_MODE ("string" by default)
+    assert items[-1]["total_price_ntd"] == "12500000.50"
+    assert items[0]["building_rooms"] is None
+
+
+def test_parquet_keeps_column_types(client):
+    response = export(client, "parquet")
+
+    table = pq.read_table(io.BytesIO(response.content))
+    assert str(table.schema.field("total_price_ntd").type) == "decimal128(20, 2)"
+    assert str(table.schema.field("building_rooms").type) == "int64"
+    assert str(table.schema.field("has_elevator").type) == "bool"
+    assert table.column("total_price_ntd").to_pylist()[-1] == Decimal("12500000.50")
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"fields": "district,password"}, {"date_from": "not-a-date"}],
+)
+def test_invalid_request_fails_before_streaming(client, params):
+    response = client.get(EXPORT, params=params)
+
+    assert response.status_code == 400
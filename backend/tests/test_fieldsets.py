@@ -0,0 +1,82 @@
+"""fields= narrows search items to the requested fields (plus id)."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.core.fieldsets import parse_fields, resolve_fields
+from app.core.roc_calendar import current_roc_year
+from app.models.property_transaction import PropertyTransaction
+from app.schemas.property_transaction import PropertyTransactionResponse
+
+SEARCH = "/api/v1/transactions/"
+
+
+@pytest.fixture
+def client(client, file_db):
+    file_db.add(
+        PropertyTransaction(
+            city="臺北市",
+            district="大安區",
+            serial_number="F1",
+            transaction_date="1120315",
+            transaction_date_ad=date(2023, 3, 15),
+            total_price_ntd=Decimal("12500000.50"),
+            construction_year_roc=100,
+        )
+    )
+    file_db.commit()
+    return client
+
+
+def test_items_hold_only_requested_fields(client):
+    page = client.get(SEARCH, params={"fields": "district,total_price_ntd"}).json()
+
+    assert page["total"] == 1
+    assert page["items"] == [
+        {
+            "id": page["items"][0]["id"],
+            "district": "大安區",
+            "total_price_ntd": "12500000.50",
+        }
+    ]
+
+
+def test_derived_fields_can_be_requested(client):
+    page = client.get(SEARCH, params={"fields": "building_age"}).json()
+
+    assert page["items"][0]["building_age"] == current_roc_year() - 100
+
+
+def test_unknown_field_is_rejected(client):
+    response = client.get(SEARCH, params={"fields": "district,password"})
+
+    assert response.status_code == 400
+    assert "Unknown fields: password" in response.json()["detail"]
+
+
+def test_all_fields_without_fields_parameter(client):
+    item = client.get(SEARCH).json()["items"][0]
+
+    assert set(item) == set(PropertyTransactionResponse.model_fields)
+
+
+@pytest.mark.parametrize(
+    "value, fields",
+    [
+        (None, None),
+        ("", None),
+        (" , ", None),
+        ("city, district,", ["city", "district"]),
+    ],
+)
+def test_parse_fields(value, fields):
+    assert parse_fields(value) == fields
+
+
+def test_resolve_fields_keeps_schema_order_and_id():
+    fields = resolve_fields(PropertyTransactionResponse, ["city", "district"])
+
+    # The schema declares district before city
+    assert fields == ("id", "district", "city")
@@ -0,0 +1,70 @@
+"""Read endpoints answer If-None-Match with 304 until the data changes."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.core.data_version import bump_data_version
+from app.core.http_cache import etag_matches
+from app.models.property_transaction import PropertyTransaction
+
+TABLE = PropertyTransaction.__tablename__
+
+
+@pytest.fixture
+def transaction_id(file_db):
+    transaction = PropertyTransaction(
+        city="臺北市",
+        district="大安區",
+        serial_number="E1",
+        transaction_date="1120315",
+        transaction_date_ad=date(2023, 3, 15),
+        total_price_ntd=Decimal(10_000_000),
+    )
+    file_db.add(transaction)
+    file_db.commit()
+    return transaction.id
+
+
+@pytest.mark.parametrize("path", ["/api/v1/transactions/", "/api/v1/transactions/{id}"])
+def test_matching_etag_gets_304(client, transaction_id, path):
+    url = path.format(id=transaction_id)
+    response = client.get(url)
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"].startswith("private")
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+
+def test_etag_changes_with_data_version_and_parameters(client, file_db):
+    url = "/api/v1/transactions/?city=臺北市"
+    etag = client.get(url).headers["etag"]
+
+    assert client.get(url + "&limit=5").headers["etag"] != etag
+
+    bump_data_version(file_db, TABLE)
+    file_db.commit()
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    "if_none_match, matches",
+    [
+        ('W/"abc"', True),
+        ('"abc"', True),  # Weak comparison ignores W/
+        ('W/"xyz", W/"abc"', True),
+        ("*", True),
+        ('W/"xyz"', False),
+    ],
+)
+def test_etag_matches(if_none_match, matches):
+    assert etag_matches('W/"abc"', if_none_match) is matches
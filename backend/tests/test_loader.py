@@ -0,0 +1,121 @@
+"""Incremental imports upsert on serial_number and are idempotent."""
+
+import pandas as pd
+import pytest
+
+from app.etl.loader import bulk_insert, coerce_frame, upsert
+from app.models.property_search_text import PropertySearchText
+from app.models.property_transaction import PropertyTransaction
+
+
+def cleaned(*rows):
+    """Cleaned transaction rows as read from a file: (serial, date, price)."""
+    return coerce_frame(
+        PropertyTransaction,
+        pd.DataFrame(
+            [
+                {
+                    "city": "臺北市",
+                    "district": "大安區",
+                    "land_section": f"臺北市大安區仁愛路四段{i}號",
+                    "serial_number": serial,
+                    "transaction_date": "1120315",
+                    "transaction_date_ad": date,
+                    "total_price_ntd": price,
+                }
+                for i, (serial, date, price) in enumerate(rows)
+            ]
+        ),
+    )
+
+
+def stored(db):
+    """(serial, period, price) of every stored row."""
+    return sorted(
+        (row.serial_number, row.period, int(row.total_price_ntd))
+        for row in db.query(PropertyTransaction)
+    )
+
+
+def counts(stats):
+    return stats.inserted, stats.updated, stats.unchanged, stats.skipped
+
+
+FILE = [("A1", "2023-03-15", 100), ("A2", "2023-05-01", 200)]
+
+
+def test_upsert_reports_inserted_then_unchanged(db):
+    assert counts(upsert(db, PropertyTransaction, cleaned(*FILE))) == (2, 0, 0, 0)
+    # Re-running the same file writes nothing
+    assert counts(upsert(db, PropertyTransaction, cleaned(*FILE))) == (0, 0, 2, 0)
+
+    assert stored(db) == [("A1", 20231, 100), ("A2", 20232, 200)]
+
+
+def test_upsert_updates_changed_rows(db):
+    upsert(db, PropertyTransaction, cleaned(*FILE))
+
+    changed = [("A1", "2023-03-15", 150), FILE[1], ("A3", "2023-06-30", 300)]
+    stats = upsert(db, PropertyTransaction, cleaned(*changed))
+
+    assert counts(stats) == (1, 1, 1, 0)
+    assert stored(db) == [
+        ("A1", 20231, 150),
+        ("A2", 20232, 200),
+        ("A3", 20232, 300),
+    ]
+
+
+def test_upsert_moves_record_to_its_new_quarter(db):
+    upsert(db, PropertyTransaction, cleaned(*FILE))
+
+    # A corrected date moves A1 from 2023 Q1 to 2023 Q4
+    moved = [("A1", "2023-11-02", 100), FILE[1]]
+    stats = upsert(db, PropertyTransaction, cleaned(*moved))
+
+    assert counts(stats) == (0, 1, 1, 0)
+    assert stored(db) == [("A1", 20234, 100), ("A2", 20232, 200)]
+    # Stats rollups of both the old and the new month are refreshed
+    assert {202303, 202311} <= stats.months
+    texts = db.query(PropertySearchText).filter_by(serial_number="A1").all()
+    assert [text.period for text in texts] == [20234]
+
+
+def test_upsert_keeps_last_repeated_serial(db):
+    rows = [("A1", "2023-03-15", 100), ("A1", "2023-11-02", 150)]
+    stats = upsert(db, PropertyTransaction, cleaned(*rows))
+
+    assert counts(stats) == (1, 0, 0, 0)
+    assert stored(db) == [("A1", 20234, 150)]
+
+
+def test_upsert_skips_rows_without_serial(db):
+    rows = [*FILE, (None, "2023-03-15", 300)]
+
+    assert counts(upsert(db, PropertyTransaction, cleaned(*rows))) == (2, 0, 0, 1)
+    assert counts(upsert(db, PropertyTransaction, cleaned(*rows))) == (0, 0, 2, 1)
+    assert len(stored(db)) == 2
+
+
+def test_bulk_insert_refuses_loaded_serials(db):
+    assert bulk_insert(db, PropertyTransaction, cleaned(*FILE)) == 2
+
+    with pytest.raises(ValueError, match="already in property_transactions"):
+        bulk_insert(db, PropertyTransaction, cleaned(("A3", "2023-06-30", 1), FILE[0]))
+    # Nothing of the refused file was written
+    assert len(stored(db)) == 2
+
+
+def test_bulk_insert_refuses_serials_repeated_in_other_quarters(db):
+    rows = [("A1", "2023-03-15", 100), ("A1", "2023-11-02", 150)]
+
+    with pytest.raises(ValueError, match="repeat within the file"):
+        bulk_insert(db, PropertyTransaction, cleaned(*rows))
+
+
+def test_every_loaded_row_is_mirrored_for_search(db):
+    rows = [*FILE, (None, "2023-03-15", 300)]
+
+    assert bulk_insert(db, PropertyTransaction, cleaned(*rows)) == 2
+    texts = db.query(PropertySearchText.serial_number)
+    assert sorted(serial for serial, in texts) == [s for s, _, _ in stored(db)]
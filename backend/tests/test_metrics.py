@@ -0,0 +1,10 @@
+"""Operational metrics are not served unless enabled."""
+
+from app.main import app
+
+
+def test_metrics_not_mounted_by_default():
+    paths = list(app.openapi()["paths"])
+
+    assert "/api/v1/transactions/" in paths
+    assert not [path for path in paths if path.startswith("/api/v1/metrics")]
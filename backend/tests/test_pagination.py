@@ -0,0 +1,107 @@
+"""Keyset cursor pagination over rows with NULL order values."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.core.data_version import bump_data_version
+from app.core.pagination import CountStrategy
+from app.models.property_transaction import PropertyTransaction
+from app.repositories.base import _count_cache
+from app.repositories.property_transaction_repository import (
+    PropertyTransactionRepository,
+)
+
+ROWS = 50
+NULL_DATES = {3, 17, 18, 40}  # Rows whose ROC date could not be parsed
+
+
+@pytest.fixture
+def repository(db):
+    _count_cache.clear()
+    for i in range(ROWS):
+        db.add(
+            PropertyTransaction(
+                city="臺北市",
+                district="大安區",
+                serial_number=f"RPTEST{i:05d}",
+                transaction_date="1120315" if i not in NULL_DATES else "1121399",
+                # A few dates repeat, so ties are broken by id
+                transaction_date_ad=(
+                    None if i in NULL_DATES else date(2023, 1 + i % 12, 1 + i % 5)
+                ),
+                total_price_ntd=Decimal(1_000_000 + i),
+            )
+        )
+    db.commit()
+    return PropertyTransactionRepository(db)
+
+
+def walk(repository, **search):
+    """Follow next_cursor from the first page to the last, collecting ids."""
+    ids, cursor = [], None
+    while True:
+        page = repository.search(
+            limit=7, cursor=cursor, count_strategy=CountStrategy.NONE, **search
+        )
+        ids += [row.id for row in page["items"]]
+        assert (page["next_cursor"] is not None) == page["has_next"]
+        if not page["has_next"]:
+            return ids
+        cursor = page["next_cursor"]
+
+
+def offset_order(repository, order_desc):
+    """Ids in the order one unpaginated query returns them."""
+    page = repository.search(
+        limit=ROWS + 1, count_strategy=CountStrategy.NONE, order_desc=order_desc
+    )
+    return [row.id for row in page["items"]]
+
+
+@pytest.mark.parametrize("order_desc", [True, False])
+@pytest.mark.parametrize("fields", [None, ["district"]])
+def test_cursor_walk_reaches_null_dates(repository, order_desc, fields):
+    ids = walk(repository, order_desc=order_desc, fields=fields)
+
+    assert len(ids) == ROWS
+    assert ids == offset_order(repository, order_desc)
+
+
+def test_null_dates_sort_last_when_descending(repository):
+    ids = walk(repository)
+
+    tail = ids[-len(NULL_DATES) :]
+    rows = {row.id: row for row in repository.db.query(PropertyTransaction)}
+    assert all(rows[i].transaction_date_ad is None for i in tail)
+    assert tail == sorted(tail, reverse=True)
+
+
+def test_estimated_count_reports_exact_when_count_ran(repository):
+    # SQLite has no EXPLAIN row estimate, so the first request runs COUNT(*)
+    first = repository.search(district="大安區", count_strategy=CountStrategy.ESTIMATED)
+    again = repository.search(district="大安區", count_strategy=CountStrategy.ESTIMATED)
+
+    assert (first["total"], first["count_strategy"]) == (ROWS, CountStrategy.EXACT)
+    assert (again["total"], again["count_strategy"]) == (ROWS, CountStrategy.ESTIMATED)
+
+
+def test_estimated_count_is_recounted_after_an_import(repository):
+    repository.search(district="大安區", count_strategy=CountStrategy.ESTIMATED)
+
+    repository.db.add(
+        PropertyTransaction(
+            city="臺北市",
+            district="大安區",
+            serial_number="RPTEST99999",
+            transaction_date="1120315",
+            transaction_date_ad=date(2023, 3, 15),
+            total_price_ntd=Decimal(1_000_000),
+        )
+    )
+    bump_data_version(repository.db, PropertyTransaction.__tablename__)
+    repository.db.commit()
+    page = repository.search(district="大安區", count_strategy=CountStrategy.ESTIMATED)
+
+    assert (page["total"], page["count_strategy"]) == (ROWS + 1, CountStrategy.EXACT)
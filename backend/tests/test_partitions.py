@@ -0,0 +1,35 @@
+"""The models' primary key may differ from MySQL's partitioned (id, period)."""
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, text
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.core.database import Base
+from app.models import PropertyPresale, PropertyRental, PropertyTransaction
+
+
+@pytest.mark.parametrize(
+    "model", [PropertyTransaction, PropertyPresale, PropertyRental]
+)
+def test_autogenerate_ignores_partitioned_primary_key(model):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    table = model.__table__
+
+    # Recreate the table with the primary key migration 5533a1d79403 sets
+    ddl = str(CreateTable(table).compile(engine))
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE {table.name}"))
+        connection.execute(
+            text(ddl.replace("PRIMARY KEY (id)", "PRIMARY KEY (id, period)"))
+        )
+        for index in table.indexes:
+            connection.execute(CreateIndex(index))
+        columns = connection.execute(text(f"PRAGMA table_info({table.name})"))
+        assert [c.name for c in columns if c.pk] == ["id", "period"]
+
+    with engine.connect() as connection:
+        diff = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+    assert diff == []
@@ -0,0 +1,47 @@
+"""Parquet checkpoints keep the model's column types."""
+
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from app.etl.loader import coerce_frame, read_cleaned_file
+from app.etl.pipeline import ParquetCheckpoint
+from app.models.property_transaction import PropertyTransaction
+
+
+def test_checkpoint_round_trips_integers_and_decimals(tmp_path):
+    frame = coerce_frame(
+        PropertyTransaction,
+        pd.DataFrame(
+            {
+                "city": ["臺北市", "臺北市"],
+                "district": ["大安區", "信義區"],
+                "serial_number": ["A1", "A2"],
+                "transaction_date": ["1120315", "1121102"],
+                "transaction_date_ad": ["2023-03-15", "2023-11-02"],
+                "building_rooms": [3, None],
+                "total_price_ntd": ["98765432109.87", "1000000"],
+                "unit_price_ntd": ["215678.25", None],
+            }
+        ),
+    )
+    path = tmp_path / "transactions.parquet"
+    checkpoint = ParquetCheckpoint(str(path), PropertyTransaction)
+    checkpoint.write(frame)
+    checkpoint.close()
+
+    schema = pq.read_schema(path)
+    assert str(schema.field("building_rooms").type) == "int64"
+    assert str(schema.field("period").type) == "int64"
+    assert str(schema.field("total_price_ntd").type) == "decimal128(20, 2)"
+
+    stored = pq.read_table(path).to_pydict()
+    assert stored["building_rooms"] == [3, None]
+    assert stored["period"] == [20231, 20234]
+    assert stored["unit_price_ntd"] == [Decimal("215678.25"), None]
+    assert stored["total_price_ntd"][0] == Decimal("98765432109.87")
+
+    # Read back through the loader, the rows are those that were written
+    reread = read_cleaned_file(str(path), PropertyTransaction)
+    pd.testing.assert_frame_equal(reread[frame.columns], frame)
@@ -0,0 +1,47 @@
+"""Replicas whose connections die mid-request leave the rotation."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import ReplicaRouter, read_only_session
+
+
+def gone_away(connection_invalidated):
+    return OperationalError(
+        "SELECT 1",
+        {},
+        Exception("(2006, 'MySQL server has gone away')"),
+        connection_invalidated=connection_invalidated,
+    )
+
+
+async def read_through(tmp_path, error):
+    """Status of the replica after a read on it fails with error."""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    router = ReplicaRouter(primary, [replica], retry_seconds=60)
+
+    with pytest.raises(OperationalError):
+        async with read_only_session(router) as db:
+            await db.execute(text("SELECT 1"))
+            raise error
+
+    await primary.dispose()
+    await replica.dispose()
+    return router.status()[0]
+
+
+def test_disconnect_marks_replica_down(tmp_path):
+    status = asyncio.run(read_through(tmp_path, gone_away(True)))
+
+    assert (status["healthy"], status["failures"]) == (False, 1)
+
+
+def test_failing_query_keeps_replica(tmp_path):
+    status = asyncio.run(read_through(tmp_path, gone_away(False)))
+
+    assert (status["healthy"], status["failures"]) == (True, 0)
@@ -0,0 +1,26 @@
+"""ROC date parsing."""
+
+from datetime import date
+
+import pytest
+
+from app.core.roc_calendar import parse_roc_year, roc_to_date
+
+
+@pytest.mark.parametrize(
+    "value, year, ad_date",
+    [
+        ("1120315", 112, date(2023, 3, 15)),
+        ("990101", 99, date(2010, 1, 1)),
+        ("751024.0", 75, date(1986, 10, 24)),  # Read as a float
+        (" 1051215 ", 105, date(2016, 12, 15)),
+        ("1120230", 112, None),  # Not a calendar date
+        ("0000101", None, None),  # ROC years start at 1
+        ("123", None, None),
+        ("abc", None, None),
+        (None, None, None),
+    ],
+)
+def test_parse_roc_dates(value, year, ad_date):
+    assert parse_roc_year(value) == year
+    assert roc_to_date(value) == ad_date
@@ -0,0 +1,48 @@
+"""Stats rollups are only marked current for the data they were built from."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.core.data_version import bump_data_version, rollups_current
+from app.etl import rollups
+from app.models.property_transaction import PropertyTransaction
+
+TABLE = PropertyTransaction.__tablename__
+
+
+@pytest.fixture
+def db(db):
+    db.add(
+        PropertyTransaction(
+            city="臺北市",
+            district="大安區",
+            serial_number="RPTEST00001",
+            transaction_date="1120315",
+            transaction_date_ad=date(2023, 3, 15),
+            total_price_ntd=Decimal(10_000_000),
+        )
+    )
+    bump_data_version(db, TABLE)
+    db.commit()
+    return db
+
+
+def test_refresh_marks_rollups_current(db):
+    assert rollups.refresh_rollups(db, PropertyTransaction) > 0
+    assert rollups_current(db, TABLE)
+
+
+def test_import_during_refresh_leaves_rollups_stale(db, monkeypatch):
+    build_rollups = rollups.build_rollups
+
+    def build_during_import(*args):
+        # Another import commits a batch while the refresh is running
+        bump_data_version(db, TABLE)
+        return build_rollups(*args)
+
+    monkeypatch.setattr(rollups, "build_rollups", build_during_import)
+    rollups.refresh_rollups(db, PropertyTransaction)
+
+    assert not rollups_current(db, TABLE)
@@ -0,0 +1,51 @@
+"""Search responses are cached until an import bumps the data version."""
+
+from datetime import date
+from decimal import Decimal
+
+from app.core.data_version import bump_data_version
+from app.models.property_transaction import PropertyTransaction
+
+TABLE = PropertyTransaction.__tablename__
+SEARCH = "/api/v1/transactions/?city=臺北市"
+
+
+def add_transaction(db, serial_number):
+    db.add(
+        PropertyTransaction(
+            city="臺北市",
+            district="大安區",
+            serial_number=serial_number,
+            transaction_date="1120315",
+            transaction_date_ad=date(2023, 3, 15),
+            total_price_ntd=Decimal(10_000_000),
+        )
+    )
+
+
+def test_search_is_served_from_cache_until_data_version_changes(client, file_db):
+    add_transaction(file_db, "C1")
+    bump_data_version(file_db, TABLE)
+    file_db.commit()
+    assert client.get(SEARCH).json()["total"] == 1
+
+    # Written without a version bump: the cached response is still served
+    add_transaction(file_db, "C2")
+    file_db.commit()
+    assert client.get(SEARCH).json()["total"] == 1
+
+    # An import bumps the version in the same transaction as its rows
+    add_transaction(file_db, "C3")
+    bump_data_version(file_db, TABLE)
+    file_db.commit()
+    assert client.get(SEARCH).json()["total"] == 3
+
+
+def test_cache_key_covers_every_parameter(client, file_db):
+    add_transaction(file_db, "C1")
+    add_transaction(file_db, "C2")
+    file_db.commit()
+
+    assert len(client.get(SEARCH + "&limit=1").json()["items"]) == 1
+    assert len(client.get(SEARCH + "&limit=2").json()["items"]) == 2
+    assert client.get(SEARCH + "&district=信義區").json()["total"] == 0
@@ -0,0 +1,85 @@
+"""/stats aggregates in SQL, with nearest-rank percentiles."""
+
+import math
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models.property_transaction import PropertyTransaction
+
+STATS = "/api/v1/transactions/stats"
+
+# District -> unit prices; None is a row without a unit price
+UNIT_PRICES = {
+    "大安區": [120, 80, None, 100, 90, 150, 110, 95, 130, 105, 85],
+    "信義區": [200, None, 180],
+}
+
+
+@pytest.fixture
+def client(client, file_db):
+    for district, prices in UNIT_PRICES.items():
+        for i, price in enumerate(prices):
+            file_db.add(
+                PropertyTransaction(
+                    city="臺北市",
+                    district=district,
+                    serial_number=f"{district}{i}",
+                    transaction_date="1120315",
+                    transaction_date_ad=date(2023, 1 + i % 2 * 2, 15),
+                    total_price_ntd=Decimal(10_000_000),
+                    unit_price_ntd=None if price is None else Decimal(price),
+                )
+            )
+    file_db.commit()
+    return client
+
+
+def nearest_rank(values, percentile):
+    """Smallest value whose rank reaches percentile% of the values."""
+    ranked = sorted(v for v in values if v is not None)
+    return ranked[math.ceil(percentile / 100 * len(ranked)) - 1]
+
+
+def stats(client, **params):
+    response = client.get(STATS, params=params)
+    assert response.status_code == 200
+    body = response.json()
+    return [dict(zip(body["columns"], row)) for row in body["rows"]]
+
+
+def test_grouped_metrics_and_percentiles(client):
+    metrics = ["count", "min", "max", "avg", "p25", "p50", "p75", "p90"]
+    rows = stats(client, group_by="district", value="unit_price_ntd", metrics=metrics)
+
+    # Groups come back ordered by the group columns
+    assert [row["district"] for row in rows] == sorted(UNIT_PRICES)
+    for row in rows:
+        prices = UNIT_PRICES[row["district"]]
+        values = [v for v in prices if v is not None]
+        assert row["count"] == len(prices)  # Rows, with or without a value
+        assert (row["min"], row["max"]) == (min(values), max(values))
+        assert row["avg"] == pytest.approx(sum(values) / len(values))
+        for p in (25, 50, 75, 90):
+            assert row[f"p{p}"] == nearest_rank(prices, p), p
+
+
+def test_ungrouped_and_by_month(client):
+    everything = [v for prices in UNIT_PRICES.values() for v in prices]
+
+    [row] = stats(client, metrics=["count", "p50"])
+    assert row == {"count": len(everything), "p50": nearest_rank(everything, 50)}
+
+    rows = stats(client, group_by="month", metrics=["count"])
+    assert rows == [{"month": "2023-01", "count": 8}, {"month": "2023-03", "count": 6}]
+
+
+def test_filters_apply_before_aggregating(client):
+    [row] = stats(client, district="信義區", metrics=["count", "max"])
+
+    assert row == {"count": 3, "max": 200}
+
+
+def test_invalid_metric_is_rejected(client):
+    assert client.get(STATS, params={"metrics": "p99"}).status_code == 422
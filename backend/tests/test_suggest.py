@@ -0,0 +1,106 @@
+"""Typeahead indexes are rebuilt in the background, never inside a lookup."""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.data_version import bump_data_version
+from app.core.database import Base
+from app.core.suggest import SuggestKind, Suggestions
+from app.models.property_presale import PropertyPresale
+
+TABLE = PropertyPresale.__tablename__
+
+
+def presale(serial_number, project_name):
+    return PropertyPresale(
+        city="臺北市",
+        district="大安區",
+        serial_number=serial_number,
+        project_name=project_name,
+        transaction_date="1120315",
+        transaction_date_ad=date(2023, 3, 15),
+        total_price_ntd=Decimal(10_000_000),
+    )
+
+
+async def rebuilt(suggestions):
+    """Wait for the running rebuilds to finish."""
+    await asyncio.gather(*suggestions._tasks.values())
+
+
+async def serve_stale_index_while_rebuilding():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    suggestions = Suggestions(rebuild_interval=0, session=Session)
+
+    async def lookup(prefix):
+        # A session per lookup, as per request
+        async with Session() as db:
+            return await suggestions.lookup(db, SuggestKind.PROJECT, prefix)
+
+    async with Session() as db:
+        db.add(presale("PTEST00001", "信義之星"))
+        await db.commit()
+
+    # Nothing is built yet: the first lookup starts the build
+    assert await lookup("信義") == []
+    await rebuilt(suggestions)
+    assert await lookup("信義") == ["信義之星"]
+
+    async with Session() as db:
+        db.add(presale("PTEST00002", "信義新城"))
+        await db.run_sync(lambda session: bump_data_version(session, TABLE))
+        await db.commit()
+
+    # The old index answers until the rebuild swaps in the new one
+    assert await lookup("信義") == ["信義之星"]
+    await rebuilt(suggestions)
+    assert await lookup("信義") == ["信義之星", "信義新城"]
+
+    await suggestions.close()
+    await engine.dispose()
+
+
+def test_lookup_serves_stale_index_while_rebuilding():
+    asyncio.run(serve_stale_index_while_rebuilding())
+
+
+async def check_versions_once_per_interval():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    suggestions = Suggestions(rebuild_interval=60, session=Session)
+    suggestions.warm()
+    await rebuilt(suggestions)
+
+    checks = []
+    versions = suggestions._versions
+
+    async def counted(db, kind):
+        checks.append(kind)
+        return await versions(db, kind)
+
+    suggestions._versions = counted
+    for prefix in ["信", "信義", "信義之"]:
+        async with Session() as db:
+            await suggestions.lookup(db, SuggestKind.PROJECT, prefix)
+    assert checks == []
+
+    suggestions.rebuild_interval = 0
+    async with Session() as db:
+        await suggestions.lookup(db, SuggestKind.PROJECT, "信")
+    assert checks == [SuggestKind.PROJECT]
+
+    await suggestions.close()
+    await engine.dispose()
+
+
+def test_versions_are_checked_once_per_rebuild_interval():
+    asyncio.run(check_versions_once_per_interval())
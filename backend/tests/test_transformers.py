@@ -0,0 +1,93 @@
+"""The column transformers return what the per-cell ones return, cell by cell."""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.etl.transformers import (
+    clean_string,
+    clean_string_column,
+    clean_yes_no,
+    clean_yes_no_column,
+    parse_roc_date,
+    parse_roc_date_column,
+    to_ad_date,
+    to_ad_date_column,
+    to_numeric,
+    to_numeric_column,
+    to_roc_year,
+    to_roc_year_column,
+)
+
+# Raw cells as read with dtype=str: blanks, padding, text, numbers, ROC dates
+RAW = [
+    "1120315",
+    " 1120315 ",
+    "990101",
+    "1080601.0",
+    "1120230",
+    "0000101",
+    "12345",
+    "123",
+    "12.5",
+    "3,000",
+    "有",
+    " 有",
+    "無",
+    "  仁愛路  ",
+    "",
+    None,
+    np.nan,
+]
+
+
+def plain(value):
+    """One Python value per cell whatever the dtype (missing -> None)."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.date()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+@pytest.mark.parametrize(
+    "cell, column",
+    [
+        (clean_string, clean_string_column),
+        (to_numeric, to_numeric_column),
+        (clean_yes_no, clean_yes_no_column),
+        (to_roc_year, to_roc_year_column),
+        (to_ad_date, to_ad_date_column),
+    ],
+)
+def test_column_matches_cells(cell, column):
+    expected = [plain(cell(value)) for value in RAW]
+
+    assert [plain(value) for value in column(pd.Series(RAW))] == expected
+
+
+def test_parse_roc_date_column_matches_cells():
+    # parse_roc_date expects numbers, as pandas parsed the dates before
+    # files were read with dtype=str; the column version takes either
+    numbers = [1120315.0, 990101.0, 1080601.0, np.nan]
+    expected = [parse_roc_date(value) for value in numbers]
+
+    for raw in (numbers, ["1120315", "990101", "1080601.0", None]):
+        parsed = parse_roc_date_column(pd.Series(raw))
+        assert [None if v is None else str(v) for v in map(plain, parsed)] == expected
+
+
+def test_to_ad_date_column_parses_dates():
+    dates = to_ad_date_column(pd.Series(["1120315", "990101", "1120230"]))
+
+    assert [plain(value) for value in dates] == [
+        date(2023, 3, 15),
+        date(2010, 1, 1),
+        None,
+    ]
@@ -3,6 +3,7 @@ import { MdSearch, MdRefresh, MdExpandMore, MdExpandLess, MdLocationCity, MdLoca
 import { Input } from '@/components/ui/input'
 import { Button } from '@/components/ui/button'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
+import { useSuggestions } from '@/hooks/useSuggestions'
 
 interface SearchFiltersProps {
   onSearch: (filters: {
@@ -23,6 +24,7 @@ export function SearchFilters({ onSearch }: SearchFiltersProps) {
   const [ageMin, setAgeMin] = useState('')
   const [ageMax, setAgeMax] = useState('')
   const [isExpanded, setIsExpanded] = useState(false)
+  const { data: districtSuggestions } = useSuggestions('district', district)
 
   const handleSearch = () => {
     onSearch({
@@ -95,7 +97,13 @@ export function SearchFilters({ onSearch }: SearchFiltersProps) {
                 value={district}
                 onChange={(e) => setDistrict(e.target.value)}
                 placeholder="e.g. 中正區"
+                list="district-suggestions"
               />
+              <datalist id="district-suggestions">
+                {districtSuggestions?.map((name) => (
+                  <option key={name} value={name} />
+                ))}
+              </datalist>
             </div>
 
             <div className="space-y-2">
@@ -0,0 +1,16 @@
+import { useQuery } from '@tanstack/react-query'
+import { suggestApi } from '@/lib/api'
+import { queryKeys } from '@/lib/queryKeys'
+import type { SuggestKind } from '@/types/property'
+
+export const useSuggestions = (kind: SuggestKind, prefix: string) => {
+  const trimmed = prefix.trim()
+
+  return useQuery({
+    queryKey: queryKeys.suggest.list(kind, trimmed),
+    queryFn: () => suggestApi.get(kind, trimmed),
+    enabled: trimmed.length > 0,
+    staleTime: 5 * 60 * 1000,
+    select: (data) => data.items,
+  })
+}
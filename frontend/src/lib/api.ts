@@ -4,7 +4,9 @@ import type {
   PropertyPresale,
   PropertyRental,
   SearchResponse,
-  SearchParams
+  SearchParams,
+  SuggestKind,
+  SuggestResponse
 } from '@/types/property'
 
 const API_BASE_URL = 'http://localhost:8000/api/v1'
@@ -71,3 +73,13 @@ export const rentalsApi = {
   },
 }
 
+
+// Suggest API
+export const suggestApi = {
+  get: async (kind: SuggestKind, prefix: string, limit = 10) => {
+    const { data } = await apiClient.get<SuggestResponse>('/suggest', {
+      params: { kind, prefix, limit },
+    })
+    return data
+  },
+}
@@ -1,4 +1,4 @@
-import type { SearchParams } from '@/types/property'
+import type { SearchParams, SuggestKind } from '@/types/property'
 
 export const queryKeys = {
   transactions: {
@@ -22,5 +22,9 @@ export const queryKeys = {
     details: () => [...queryKeys.rentals.all, 'detail'] as const,
     detail: (id: number) => [...queryKeys.rentals.details(), id] as const,
   },
+  suggest: {
+    all: ['suggest'] as const,
+    list: (kind: SuggestKind, prefix: string) => [...queryKeys.suggest.all, kind, prefix] as const,
+  },
 }
 
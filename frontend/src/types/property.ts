@@ -1,10 +1,13 @@
 // Base search response type
 export interface SearchResponse<T> {
   items: T[]
-  total: number
+  total: number | null
   page: number
   page_size: number
-  total_pages: number
+  total_pages: number | null
+  next_cursor?: string | null
+  has_next?: boolean
+  count_strategy?: 'exact' | 'estimated' | 'none'
 }
 
 // Property Transaction
@@ -128,6 +131,8 @@ export interface PropertyRental {
 export interface SearchParams {
   skip?: number
   limit?: number
+  cursor?: string
+  count_strategy?: 'exact' | 'estimated' | 'none'
   city?: string
   district?: string
   price_min?: number
@@ -138,3 +143,12 @@ export interface SearchParams {
   order_desc?: boolean
 }
 
+
+// Typeahead suggestions (/suggest)
+export type SuggestKind = 'project' | 'district' | 'road'
+
+export interface SuggestResponse {
+  kind: SuggestKind
+  prefix: string
+  items: string[]
+}